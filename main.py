@@ -7,15 +7,26 @@ Teoría de la Computación - Noviembre 2025
 
 import os
 import sys
-from src.parser.yaml_parser import YAMLParser
+from src.parser.registry import MachineRegistry
+from src.parser.corpus_reader import CorpusReader
 from src.simulator.mt_simulator import MTSimulator
-from src.utils.exceptions import TuringMachineError
+from src.simulator.trace_printer import TracePrinter
+from src.utils.exceptions import TuringMachineError, CorpusError
+from src import cli
+
+# Celdas mostradas a cada lado del cabezal en las IDs (evita imprimir cintas enormes)
+VENTANA_TRAZA = 40
 
 class TuringMachineMenu:
     """Menú interactivo para el simulador de Máquinas de Turing"""
     
     def __init__(self):
-        pass
+        # Configuración de la salida de trazas (opción 4 del menú)
+        self.muestreo_traza = 1
+        self.solo_cambios_estado = False
+        self.archivo_traza = None
+        # Las MTs se parsean una sola vez y se vuelven a cargar solo si cambia el YAML
+        self.registro = MachineRegistry(max_machines=8)
         
     def mostrar_menu_principal(self):
         """Muestra el menú principal del simulador"""
@@ -28,24 +39,21 @@ class TuringMachineMenu:
         print("1.  Ejecutar MT Reconocedora de Palíndromos")
         print("2.  Ejecutar MT Alteradora (Duplicar cadena)")
         print("3.  Ver información del proyecto")
-        print("4.  Salir")
+        print("4.  Configurar salida de las trazas")
+        print("5.  Salir")
         print("-"*60)
         
     def leer_cadenas_desde_archivo(self, archivo_txt):
         """Lee las cadenas de prueba desde un archivo TXT"""
+        # Las líneas vacías y los comentarios se ignoran en CorpusReader; las
+        # líneas inválidas se reportan una a una sin descartar las demás
         try:
-            with open(archivo_txt, 'r', encoding='utf-8') as f:
-                cadenas = []
-                for linea in f:
-                    linea = linea.strip()
-                    # Ignorar líneas vacías y comentarios
-                    if linea and not linea.startswith('#'):
-                        cadenas.append(linea)
-                return cadenas
-        except FileNotFoundError:
-            print(f" Error: No se encontró el archivo {archivo_txt}")
-            return []
-        except Exception as e:
+            if not os.path.exists(archivo_txt):
+                print(f" Error: No se encontró el archivo {archivo_txt}")
+                return []
+            reader = CorpusReader(archivo_txt, on_error=lambda e: print(f" Línea ignorada: {e}"))
+            return list(reader.iter_strings())
+        except CorpusError as e:
             print(f" Error al leer {archivo_txt}: {e}")
             return []
     
@@ -58,8 +66,7 @@ class TuringMachineMenu:
         
         # Cargar la MT desde el archivo YAML
         try:
-            data = YAMLParser.load_from_file("mt_reconocedora.yaml")
-            mt = YAMLParser.parse_turing_machine(data)
+            mt = self.registro.get("mt_reconocedora.yaml")
             print(" MT reconocedora cargada exitosamente")
         except Exception as e:
             print(f" Error al cargar MT reconocedora: {e}")
@@ -81,20 +88,22 @@ class TuringMachineMenu:
         for i, cadena in enumerate(cadenas, 1):
             print(f"\n{'='*20} CADENA {i}: '{cadena}' {'='*20}")
             try:
-                accepted, ids, final_result = simulator.simulate(cadena)
-                resultados.append((cadena, accepted, len(ids)))
-                
-                # Mostrar las descripciones instantáneas
+                # Mostrar las descripciones instantáneas a medida que se generan
                 print(f"\n DESCRIPCIONES INSTANTÁNEAS:")
                 print("-"*60)
-                for id_desc in ids:
-                    print(f" {id_desc.get_compact_representation()}")
+                with self.crear_impresor_traza(i) as impresor:
+                    resultado = simulator.run(cadena, record_trace=False, on_step=impresor.emit,
+                                              on_step_context=impresor.context)
                 print("-"*60)
                 
+                accepted = resultado.accepted
+                ids_generadas = impresor.received
+                resultados.append((cadena, accepted, ids_generadas))
+                
                 if accepted:
-                    print(f"\n RESULTADO: Cadena '{cadena}' ACEPTADA en {len(ids)} pasos")
+                    print(f"\n RESULTADO: Cadena '{cadena}' ACEPTADA en {ids_generadas} pasos")
                 else:
-                    print(f"\n RESULTADO: Cadena '{cadena}' RECHAZADA en {len(ids)} pasos")
+                    print(f"\n RESULTADO: Cadena '{cadena}' RECHAZADA en {ids_generadas} pasos")
                     
             except Exception as e:
                 print(f" Error simulando '{cadena}': {e}")
@@ -115,8 +124,7 @@ class TuringMachineMenu:
         
         # Cargar la MT desde el archivo YAML
         try:
-            data = YAMLParser.load_from_file("mt_alteradora.yaml")
-            mt = YAMLParser.parse_turing_machine(data)
+            mt = self.registro.get("mt_alteradora.yaml")
             print(" MT alteradora cargada exitosamente")
         except Exception as e:
             print(f" Error al cargar MT alteradora: {e}")
@@ -138,26 +146,26 @@ class TuringMachineMenu:
         for i, cadena in enumerate(cadenas, 1):
             print(f"\n{'='*20} CADENA {i}: '{cadena}' {'='*20}")
             try:
-                accepted, ids, final_result = simulator.simulate(cadena)
-                resultados.append((cadena, accepted, len(ids)))
-                
-                # Mostrar las descripciones instantáneas
+                # Mostrar las descripciones instantáneas a medida que se generan
                 print(f"\n DESCRIPCIONES INSTANTÁNEAS:")
                 print("-"*60)
-                for id_desc in ids:
-                    print(f" {id_desc.get_compact_representation()}")
+                with self.crear_impresor_traza(i) as impresor:
+                    resultado = simulator.run(cadena, record_trace=False, on_step=impresor.emit,
+                                              on_step_context=impresor.context)
                 print("-"*60)
                 
+                accepted = resultado.accepted
+                ids_generadas = impresor.received
+                resultados.append((cadena, accepted, ids_generadas))
+                
                 if accepted:
                     # Extraer la cadena duplicada desde la última descripción (contenido de la cinta)
                     # y filtrar únicamente símbolos del alfabeto de entrada (evita 'B' y cualquier marcador)
-                    contenido_final = ids[-1].tape_content if ids else ""
-                    alfabeto = mt.input_alphabet if hasattr(mt, 'input_alphabet') else set(['a','b'])
-                    cadena_duplicada = ''.join(ch for ch in contenido_final if ch in alfabeto)
-                    print(f"\n RESULTADO: Cadena '{cadena}' procesada exitosamente en {len(ids)} pasos")
+                    cadena_duplicada = mt.get_output(resultado.tape_content)
+                    print(f"\n RESULTADO: Cadena '{cadena}' procesada exitosamente en {ids_generadas} pasos")
                     print(f" Cadena duplicada: '{cadena_duplicada}'")
                 else:
-                    print(f"\n RESULTADO: Error procesando '{cadena}' en {len(ids)} pasos")
+                    print(f"\n RESULTADO: Error procesando '{cadena}' en {ids_generadas} pasos")
                     
             except Exception as e:
                 print(f" Error simulando '{cadena}': {e}")
@@ -169,6 +177,44 @@ class TuringMachineMenu:
         # Mostrar resumen
         self.mostrar_resumen_resultados(resultados, "Alteradora")
     
+    def crear_impresor_traza(self, numero_cadena):
+        """Crea el impresor de trazas según la configuración actual"""
+        archivo = None
+        if self.archivo_traza:
+            # Un archivo por cadena: traza.txt -> traza_1.txt, traza_2.txt, ...
+            base, extension = os.path.splitext(self.archivo_traza)
+            archivo = f"{base}_{numero_cadena}{extension or '.txt'}"
+        return TracePrinter(every=self.muestreo_traza,
+                            only_state_changes=self.solo_cambios_estado,
+                            context=VENTANA_TRAZA, file_path=archivo)
+    
+    def configurar_trazas(self):
+        """Permite configurar el muestreo y el destino de las trazas"""
+        print("\n" + " CONFIGURACIÓN DE TRAZAS".center(60, "="))
+        print(f"Muestreo actual: 1 de cada {self.muestreo_traza} pasos")
+        print(f"Solo cambios de estado: {'sí' if self.solo_cambios_estado else 'no'}")
+        print(f"Archivo de traza: {self.archivo_traza or '(terminal)'}")
+        print("-"*60)
+        
+        valor = input(" Mostrar 1 de cada k pasos (ENTER para mantener): ").strip()
+        if valor:
+            if valor.isdigit() and int(valor) >= 1:
+                self.muestreo_traza = int(valor)
+            else:
+                print(" Valor inválido, se mantiene la configuración anterior")
+        
+        valor = input(" ¿Solo cambios de estado? (s/n, ENTER para mantener): ").strip().lower()
+        if valor in ("s", "n"):
+            self.solo_cambios_estado = valor == "s"
+        
+        valor = input(" Archivo de traza (ENTER para mantener, '-' para la terminal): ").strip()
+        if valor == "-":
+            self.archivo_traza = None
+        elif valor:
+            self.archivo_traza = valor
+        
+        print(" Configuración actualizada")
+    
     def mostrar_resumen_resultados(self, resultados, tipo_mt):
         """Muestra un resumen de los resultados de la simulación"""
         print(f"\n{' RESUMEN DE RESULTADOS - MT ' + tipo_mt.upper():=^60}")
@@ -226,7 +272,7 @@ class TuringMachineMenu:
         while True:
             try:
                 self.mostrar_menu_principal()
-                opcion = input(" Selecciona una opción (1-4): ").strip()
+                opcion = input(" Selecciona una opción (1-5): ").strip()
                 
                 if opcion == "1":
                     self.ejecutar_mt_reconocedora()
@@ -235,13 +281,15 @@ class TuringMachineMenu:
                 elif opcion == "3":
                     self.mostrar_informacion_proyecto()
                 elif opcion == "4":
+                    self.configurar_trazas()
+                elif opcion == "5":
                     print("\n ¡Gracias por usar el simulador de Máquinas de Turing!")
                     print(" Proyecto TC3 - Universidad del Valle de Guatemala")
                     break
                 else:
-                    print(" Opción inválida. Por favor selecciona 1, 2, 3 o 4.")
+                    print(" Opción inválida. Por favor selecciona 1, 2, 3, 4 o 5.")
                 
-                if opcion in ["1", "2", "3"]:
+                if opcion in ["1", "2", "3", "4"]:
                     input("\n Presiona ENTER para volver al menú principal...")
                     
             except KeyboardInterrupt:
@@ -253,6 +301,10 @@ class TuringMachineMenu:
 
 def main():
     """Función principal del programa"""
+    # Con argumentos se usa la CLI no interactiva (ver src/cli.py)
+    if len(sys.argv) > 1:
+        sys.exit(cli.main(sys.argv[1:]))
+    
     # Verificar que estamos en el directorio correcto
     archivos_requeridos = [
         "mt_reconocedora.yaml",
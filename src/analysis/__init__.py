@@ -0,0 +1,13 @@
+"""
+Análisis estático de Máquinas de Turing
+
+Este módulo contiene herramientas que estudian la estructura de una MT
+(grafo de estados, transiciones) sin necesidad de simularla.
+"""
+
+from .graph_analysis import MachineAnalysis, analyze_machine, prune_machine
+from .minimization import compute_equivalence_classes, minimize_machine
+from .coverage import CoverageMap
+
+__all__ = ['MachineAnalysis', 'analyze_machine', 'prune_machine',
+           'compute_equivalence_classes', 'minimize_machine', 'CoverageMap']
@@ -0,0 +1,304 @@
+"""
+Cobertura de transiciones y de pares (estado, símbolo) sobre un corpus
+
+Cada ejecución se reduce a dos mapas de bits (enteros de Python): uno sobre
+los índices de TuringMachine.transitions y otro sobre los pares (estado,
+símbolo leído). Los mapas de varias ejecuciones, trabajadores o reportes se
+combinan con OR, y para cada elemento cubierto se conserva la cadena más
+corta (y menor en orden lexicográfico) que lo alcanza.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.transition import Transition
+from ..utils.exceptions import MTException
+
+
+def iter_bits(bitmap: int) -> Iterator[int]:
+    """
+    Itera las posiciones de los bits encendidos, de menor a mayor
+    
+    Args:
+        bitmap: Mapa de bits
+    
+    Returns:
+        Iterador de posiciones
+    """
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+def _is_smaller(candidate: str, current: str) -> bool:
+    """Orden de las cadenas representativas: primero la longitud"""
+    return (len(candidate), candidate) < (len(current), current)
+
+
+class CoverageMap:
+    """
+    Cobertura acumulada de una MT
+    
+    La numeración de pares usa estados y símbolos ordenados, así que es la
+    misma en todos los procesos que cargan la MT. Las ejecuciones se
+    registran con MTSimulator.run(coverage=...), que llena un conjunto con los
+    pares leídos; como la MT es determinista, cada par con transición
+    identifica una única transición.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine):
+        """
+        Inicializa una cobertura vacía
+        
+        Args:
+            turing_machine: MT cuya cobertura se mide
+        """
+        self.turing_machine = turing_machine
+        self.fingerprint = turing_machine.get_fingerprint()
+        self.state_names: List[str] = sorted(turing_machine.states)
+        self.symbols: List[str] = sorted(turing_machine.tape_alphabet | {turing_machine.blank_symbol})
+        self._pair_numbers = {(state, symbol): number for number, (state, symbol) in enumerate(
+            (state, symbol) for state in self.state_names for symbol in self.symbols)}
+        self._transition_numbers = {(transition.from_state, transition.read_symbols[0]): number
+                                    for number, transition in enumerate(turing_machine.transitions)}
+        self.transitions = 0
+        self.pairs = 0
+        self.runs = 0
+        # Número de transición o de par -> cadena más corta que lo alcanza
+        self.transition_inputs: Dict[int, str] = {}
+        self.pair_inputs: Dict[int, str] = {}
+    
+    @property
+    def transition_count(self) -> int:
+        """Número de transiciones de la MT"""
+        return len(self.turing_machine.transitions)
+    
+    @property
+    def pair_count(self) -> int:
+        """Número de pares (estado, símbolo) posibles"""
+        return len(self._pair_numbers)
+    
+    def encode(self, pairs: Iterable[Tuple[str, str]]) -> Tuple[int, int]:
+        """
+        Convierte los pares leídos en una ejecución a mapas de bits
+        
+        Args:
+            pairs: Pares (estado, símbolo) leídos
+        
+        Returns:
+            Tupla con (mapa de transiciones, mapa de pares)
+        """
+        transitions = 0
+        covered_pairs = 0
+        transition_numbers = self._transition_numbers
+        pair_numbers = self._pair_numbers
+        for pair in pairs:
+            covered_pairs |= 1 << pair_numbers[pair]
+            number = transition_numbers.get(pair)
+            if number is not None:
+                transitions |= 1 << number
+        return transitions, covered_pairs
+    
+    def add(self, input_string: str, transitions: int, pairs: int) -> None:
+        """
+        Agrega los mapas de bits de una ejecución
+        
+        Args:
+            input_string: Cadena simulada
+            transitions: Mapa de bits de transiciones aplicadas
+            pairs: Mapa de bits de pares leídos
+        """
+        self.runs += 1
+        self.transitions |= transitions
+        self.pairs |= pairs
+        for bitmap, inputs in ((transitions, self.transition_inputs), (pairs, self.pair_inputs)):
+            for number in iter_bits(bitmap):
+                current = inputs.get(number)
+                if current is None or _is_smaller(input_string, current):
+                    inputs[number] = input_string
+    
+    def record(self, input_string: str, pairs: Set[Tuple[str, str]]) -> Tuple[int, int]:
+        """
+        Codifica y agrega los pares leídos en una ejecución
+        
+        Args:
+            input_string: Cadena simulada
+            pairs: Conjunto llenado por MTSimulator.run(coverage=...)
+        
+        Returns:
+            Tupla con (mapa de transiciones, mapa de pares) de la ejecución
+        """
+        transitions, covered_pairs = self.encode(pairs)
+        self.add(input_string, transitions, covered_pairs)
+        return transitions, covered_pairs
+    
+    def merge(self, other: 'CoverageMap') -> None:
+        """
+        Combina otra cobertura de la misma MT (OR de los mapas)
+        
+        Args:
+            other: Cobertura a combinar
+        
+        Raises:
+            MTException: Si la cobertura corresponde a otra MT
+        """
+        if other.fingerprint != self.fingerprint:
+            raise MTException("La cobertura a combinar corresponde a otra MT")
+        self.runs += other.runs
+        self.transitions |= other.transitions
+        self.pairs |= other.pairs
+        for inputs, other_inputs in ((self.transition_inputs, other.transition_inputs),
+                                     (self.pair_inputs, other.pair_inputs)):
+            for number, input_string in other_inputs.items():
+                current = inputs.get(number)
+                if current is None or _is_smaller(input_string, current):
+                    inputs[number] = input_string
+    
+    def pair_at(self, number: int) -> Tuple[str, str]:
+        """Par (estado, símbolo) con un número dado"""
+        return self.state_names[number // len(self.symbols)], self.symbols[number % len(self.symbols)]
+    
+    def uncovered_transitions(self) -> List[Tuple[int, Transition]]:
+        """
+        Transiciones que ninguna ejecución aplicó
+        
+        Returns:
+            Lista de (índice, transición)
+        """
+        return [(number, transition) for number, transition in enumerate(self.turing_machine.transitions)
+                if not self.transitions >> number & 1]
+    
+    def uncovered_pairs(self, defined_only: bool = False) -> List[Tuple[str, str]]:
+        """
+        Pares (estado, símbolo) que ninguna ejecución leyó
+        
+        Args:
+            defined_only: Si solo se consideran pares con transición
+        
+        Returns:
+            Lista de pares
+        """
+        return [pair for pair, number in self._pair_numbers.items()
+                if not self.pairs >> number & 1 and (not defined_only or pair in self._transition_numbers)]
+    
+    def get_reduced_corpus(self) -> List[str]:
+        """
+        Cadenas que conservan toda la cobertura alcanzada
+        
+        Es la unión de las cadenas más cortas de cada transición y de cada par
+        cubierto; el resto del corpus no agrega cobertura.
+        
+        Returns:
+            Cadenas ordenadas por longitud
+        """
+        inputs = set(self.transition_inputs.values()) | set(self.pair_inputs.values())
+        return sorted(inputs, key=lambda input_string: (len(input_string), input_string))
+    
+    def get_report(self, details: bool = True) -> str:
+        """
+        Genera un reporte legible de la cobertura
+        
+        Args:
+            details: Si se listan las transiciones sin cubrir y la cadena más
+                     corta de cada transición cubierta
+        
+        Returns:
+            Reporte como string
+        """
+        covered_transitions = bin(self.transitions).count('1')
+        covered_pairs = bin(self.pairs).count('1')
+        lines = [
+            f"Cobertura sobre {self.runs} ejecuciones:",
+            f"  Transiciones: {covered_transitions}/{self.transition_count}",
+            f"  Pares (estado, símbolo): {covered_pairs}/{self.pair_count}",
+            f"  Cadenas necesarias para conservarla: {len(self.get_reduced_corpus())}",
+        ]
+        if not details:
+            return "\n".join(lines)
+        uncovered = self.uncovered_transitions()
+        if uncovered:
+            lines.append("Transiciones sin cubrir:")
+            lines.extend(f"  #{number}: {transition}" for number, transition in uncovered)
+        if self.transition_inputs:
+            lines.append("Cadena más corta por transición:")
+            for number in sorted(self.transition_inputs):
+                lines.append(f"  #{number}: {self.transition_inputs[number]!r}")
+        return "\n".join(lines)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte la cobertura a un diccionario serializable (mapas en hexadecimal)
+        
+        Returns:
+            Diccionario con la cobertura
+        """
+        return {
+            'fingerprint': self.fingerprint,
+            'runs': self.runs,
+            'transitions': format(self.transitions, 'x'),
+            'pairs': format(self.pairs, 'x'),
+            'transition_inputs': {str(number): value for number, value in self.transition_inputs.items()},
+            'pair_inputs': {str(number): value for number, value in self.pair_inputs.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, turing_machine: TuringMachine, data: Dict[str, Any]) -> 'CoverageMap':
+        """
+        Reconstruye una cobertura guardada con to_dict
+        
+        Args:
+            turing_machine: MT de la cobertura
+            data: Diccionario producido por to_dict
+        
+        Returns:
+            Instancia de CoverageMap
+        
+        Raises:
+            MTException: Si la cobertura corresponde a otra MT
+        """
+        coverage = cls(turing_machine)
+        if data.get('fingerprint') != coverage.fingerprint:
+            raise MTException("La cobertura guardada corresponde a otra MT")
+        coverage.runs = data['runs']
+        coverage.transitions = int(data['transitions'], 16)
+        coverage.pairs = int(data['pairs'], 16)
+        coverage.transition_inputs = {int(number): value for number, value in data['transition_inputs'].items()}
+        coverage.pair_inputs = {int(number): value for number, value in data['pair_inputs'].items()}
+        return coverage
+    
+    def save(self, file_path: str) -> None:
+        """
+        Guarda la cobertura como JSON
+        
+        Args:
+            file_path: Ruta del archivo
+        """
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False)
+    
+    @classmethod
+    def load(cls, turing_machine: TuringMachine, file_path: str) -> 'CoverageMap':
+        """
+        Carga una cobertura guardada con save
+        
+        Args:
+            turing_machine: MT de la cobertura
+            file_path: Ruta del archivo
+        
+        Returns:
+            Instancia de CoverageMap
+        
+        Raises:
+            MTException: Si el archivo no se puede leer o es de otra MT
+        """
+        try:
+            with open(file_path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            raise MTException(f"No se pudo leer la cobertura {file_path}: {e}")
+        return cls.from_dict(turing_machine, data)
+    
+    def __repr__(self) -> str:
+        return (f"CoverageMap(runs={self.runs}, transitions={bin(self.transitions).count('1')}/"
+                f"{self.transition_count}, pairs={bin(self.pairs).count('1')}/{self.pair_count})")
@@ -0,0 +1,491 @@
+"""
+Fuzzing diferencial entre los motores de simulación
+
+Genera MT deterministas aleatorias (válidas según validate_yaml_structure),
+un presupuesto aleatorio por MT (límite fijo o polinomial de pasos y
+crecimiento máximo de la cinta) y entradas aleatorias, las ejecuta en todos
+los motores registrados y compara veredicto, motivo de parada, número de
+pasos, cinta final y posición del cabezal contra el motor de referencia
+(MTSimulator). Cada discrepancia se reduce a una MT y una entrada mínimas.
+Los tiempos de cada motor se acumulan, por lo que el resultado sirve también
+como benchmark.
+
+Uso:
+    python -m src.analysis.fuzzing --machines 200 --inputs 20 --seed 1
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.tape import Tape
+from ..models.budget import StepBudget
+from ..models.mapped_tape import MappedInput
+from ..parser.yaml_parser import YAMLParser
+from ..simulator.mt_simulator import MTSimulator, StepByStepSimulation
+from .minimization import minimize_machine
+from ..simulator.segmented_engine import SegmentedSimulator
+from ..simulator.macro_engine import MacroSimulator
+from ..simulator.pipeline import Pipeline, PipelineStage
+from ..simulator.breakpoints import Breakpoint, Watchpoint
+from ..simulator.simulation_result import SimulationResult
+from ..utils.exceptions import MTException
+
+
+# Fábrica de motor: (MT, max_steps, presupuesto) -> función que simula una cadena
+EngineFactory = Callable[[TuringMachine, int, StepBudget], Callable[[str], SimulationResult]]
+
+# Puntos de interrupción del motor 'run_until': se cumplen seguido en las MT generadas
+FUZZ_BREAKPOINTS = [Breakpoint(state='q1'), Breakpoint(symbol='X'), Watchpoint(0)]
+
+
+def _simulation_result(input_string: str, simulation: StepByStepSimulation) -> SimulationResult:
+    """Convierte una simulación paso a paso terminada en SimulationResult"""
+    return SimulationResult(input_string, simulation.accepted, simulation.halt_reason,
+                            simulation.step, simulation.result_message,
+                            simulation.current_state, simulation.tape)
+
+
+def _step_by_step_engine(turing_machine: TuringMachine, max_steps: int,
+                         budget: StepBudget) -> Callable[[str], SimulationResult]:
+    """Adapta StepByStepSimulation a la interfaz de motor"""
+    simulator = MTSimulator(turing_machine, max_steps, budget=budget)
+    
+    def run(input_string: str) -> SimulationResult:
+        simulation = simulator.simulate_step_by_step(input_string)
+        simulation.run_to_completion()
+        return _simulation_result(input_string, simulation)
+    return run
+
+
+def _run_until_engine(turing_machine: TuringMachine, max_steps: int,
+                      budget: StepBudget) -> Callable[[str], SimulationResult]:
+    """Ejecuta StepByStepSimulation.run_until deteniéndose en FUZZ_BREAKPOINTS hasta terminar"""
+    simulator = MTSimulator(turing_machine, max_steps, budget=budget)
+    
+    def run(input_string: str) -> SimulationResult:
+        simulation = simulator.simulate_step_by_step(input_string)
+        while simulation.run_until(FUZZ_BREAKPOINTS) is not None:
+            pass
+        return _simulation_result(input_string, simulation)
+    return run
+
+
+def _mapped_input_engine(turing_machine: TuringMachine, max_steps: int,
+                         budget: StepBudget) -> Callable[[str], SimulationResult]:
+    """Simula la cadena escrita en un archivo temporal y leída como MappedInput"""
+    simulator = MTSimulator(turing_machine, max_steps, budget=budget)
+    
+    def run(input_string: str) -> SimulationResult:
+        descriptor, path = tempfile.mkstemp(suffix='.txt')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(input_string.encode('latin-1'))
+            mapped = MappedInput(path)
+            try:
+                result = simulator.run(mapped, record_trace=False)
+                # Copiar la cinta antes de liberar el mapeo del archivo
+                if result.tape is not None:
+                    tape = Tape("", result.tape.blank_symbol)
+                    tape.tape = list(result.tape.tape)
+                    tape.head_position = result.tape.head_position
+                    result.tape = tape
+            finally:
+                mapped.close()
+        finally:
+            os.remove(path)
+        return result
+    return run
+
+
+def _pipeline_engine(turing_machine: TuringMachine, max_steps: int,
+                     budget: StepBudget) -> Callable[[str], SimulationResult]:
+    """Ejecuta un Pipeline de una sola etapa"""
+    pipeline = Pipeline([PipelineStage(turing_machine, max_steps=max_steps, budget=budget)])
+    return lambda input_string: pipeline.run(input_string).stages[-1]
+
+
+def _initial_tape_engine(turing_machine: TuringMachine, max_steps: int,
+                         budget: StepBudget) -> Callable[[str], SimulationResult]:
+    """Entrega la cinta ya construida con MTSimulator.run(initial_tape=...)"""
+    simulator = MTSimulator(turing_machine, max_steps, budget=budget)
+    return lambda input_string: simulator.run(input_string, record_trace=False,
+                                              initial_tape=turing_machine.create_tape(input_string))
+
+
+# Motores registrados; 'reference' es contra el que se compara el resto
+ENGINES: Dict[str, EngineFactory] = {
+    'reference': lambda tm, max_steps, budget: MTSimulator(tm, max_steps, budget=budget).run,
+    'untraced': lambda tm, max_steps, budget: (
+        lambda s, sim=MTSimulator(tm, max_steps, budget=budget): sim.run(s, record_trace=False)),
+    'step_by_step': _step_by_step_engine,
+    'run_until': _run_until_engine,
+    'segmented': lambda tm, max_steps, budget: SegmentedSimulator(tm, max_steps, budget=budget, segment_size=4).run,
+    'macro': lambda tm, max_steps, budget: MacroSimulator(tm, max_steps, budget=budget, block_size=3).run,
+    'mapped_input': _mapped_input_engine,
+    'initial_tape': _initial_tape_engine,
+    'pipeline': _pipeline_engine,
+    'batch': lambda tm, max_steps, budget: (
+        lambda s, sim=MTSimulator(tm, max_steps, budget=budget): sim.simulate_batch([s])[0]),
+    'minimized': lambda tm, max_steps, budget: MTSimulator(minimize_machine(tm), max_steps, budget=budget).run,
+}
+
+
+def register_engine(name: str, factory: EngineFactory) -> None:
+    """
+    Registra un motor de simulación para el fuzzing diferencial
+    
+    Args:
+        name: Nombre del motor
+        factory: Función (MT, max_steps, presupuesto) -> función que simula una cadena
+    """
+    ENGINES[name] = factory
+
+
+def result_signature(result: SimulationResult) -> Tuple:
+    """
+    Obtiene los campos que deben coincidir entre motores
+    
+    Args:
+        result: Resultado de una simulación
+    
+    Returns:
+        Tupla (aceptada, motivo, pasos, cinta, posición del cabezal)
+    """
+    return (result.accepted, result.halt_reason, result.steps,
+            result.tape_content, result.head_position)
+
+
+def generate_random_machine(rng: random.Random, num_states: int = 4,
+                            input_alphabet: Optional[List[str]] = None,
+                            extra_symbols: Optional[List[str]] = None,
+                            density: float = 0.85,
+                            accept_density: float = 0.3) -> Dict[str, Any]:
+    """
+    Genera la definición YAML (como diccionario) de una MT determinista aleatoria
+    
+    Args:
+        rng: Generador de números aleatorios
+        num_states: Número de estados sin contar el de aceptación
+        input_alphabet: Alfabeto de entrada (por defecto [a, b])
+        extra_symbols: Símbolos adicionales de la cinta (por defecto [X, B])
+        density: Probabilidad de que exista transición para cada (estado, símbolo)
+        accept_density: Lo mismo para el estado de aceptación (transiciones que
+            nunca se ejecutan pero que el análisis debe tolerar)
+    
+    Returns:
+        Diccionario con la clave 'mt'
+    """
+    input_alphabet = input_alphabet or ['a', 'b']
+    extra_symbols = extra_symbols or ['X', 'B']
+    tape_alphabet = input_alphabet + [s for s in extra_symbols if s not in input_alphabet]
+    states = [f"q{i}" for i in range(num_states)] + ['qf']
+    
+    transitions = []
+    for state in states:
+        for symbol in tape_alphabet:
+            if rng.random() >= (accept_density if state == 'qf' else density):
+                continue
+            # El estado de aceptación se elige con menor probabilidad
+            next_state = 'qf' if rng.random() < 0.1 else rng.choice(states[:-1])
+            transitions.append({
+                'state': state,
+                'read': [symbol],
+                'write': [rng.choice(tape_alphabet)],
+                'move': rng.choices(['L', 'R', 'S'], weights=[4, 4, 1])[0],
+                'next': next_state
+            })
+    
+    return {
+        'mt': {
+            'states': states,
+            'input_alphabet': input_alphabet,
+            'tape_alphabet': tape_alphabet,
+            'initial_state': 'q0',
+            'accept_states': ['qf'],
+            'transitions': transitions
+        }
+    }
+
+
+def generate_random_input(rng: random.Random, input_alphabet: List[str], max_length: int = 10) -> str:
+    """
+    Genera una cadena aleatoria sobre el alfabeto de entrada
+    
+    Args:
+        rng: Generador de números aleatorios
+        input_alphabet: Símbolos permitidos
+        max_length: Longitud máxima
+    
+    Returns:
+        Cadena aleatoria
+    """
+    return ''.join(rng.choice(input_alphabet) for _ in range(rng.randint(0, max_length)))
+
+
+def generate_random_budget(rng: random.Random, max_steps: int = 500) -> StepBudget:
+    """
+    Genera un presupuesto aleatorio sin límite de tiempo (para que sea reproducible)
+    
+    Cada límite (fijo, polinomial y de crecimiento de la cinta) aparece de
+    forma independiente, así que también se generan presupuestos vacíos y
+    combinados.
+    
+    Args:
+        rng: Generador de números aleatorios
+        max_steps: Mayor límite fijo de pasos a generar
+    
+    Returns:
+        Instancia de StepBudget
+    """
+    budget = StepBudget()
+    if rng.random() < 0.4:
+        budget.max_steps = rng.randint(0, max_steps)
+    if rng.random() < 0.4:
+        budget.steps_coefficient = rng.choice([0.5, 1, 2, 3])
+        budget.steps_exponent = rng.choice([1, 2])
+        budget.steps_base = rng.randint(0, 20)
+    if rng.random() < 0.4:
+        budget.max_tape_growth = rng.randint(0, 8)
+    return budget
+
+
+class Mismatch:
+    """
+    Discrepancia entre un motor y el de referencia
+    """
+    
+    def __init__(self, engine: str, machine_data: Dict[str, Any], input_string: str,
+                 expected: Tuple, actual: Tuple, budget: Optional[StepBudget] = None):
+        """
+        Inicializa la discrepancia
+        
+        Args:
+            engine: Nombre del motor que discrepa
+            machine_data: Definición de la MT (ya reducida)
+            input_string: Cadena de entrada (ya reducida)
+            expected: Firma del resultado de referencia
+            actual: Firma del resultado del motor (o el error producido)
+            budget: Presupuesto con el que se simuló
+        """
+        self.engine = engine
+        self.machine_data = machine_data
+        self.input_string = input_string
+        self.expected = expected
+        self.actual = actual
+        self.budget = budget or StepBudget()
+    
+    def __str__(self) -> str:
+        yaml_text = YAMLParser.dump_turing_machine(YAMLParser.parse_turing_machine(self.machine_data))
+        return (f"Motor '{self.engine}' con entrada '{self.input_string}':\n"
+                f"  presupuesto: {self.budget.to_dict()}\n"
+                f"  esperado: {self.expected}\n"
+                f"  obtenido: {self.actual}\n"
+                f"{yaml_text}")
+
+
+class EngineStats:
+    """
+    Tiempo y trabajo acumulados de un motor durante el fuzzing
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.runs = 0
+        self.steps = 0
+        self.seconds = 0.0
+    
+    def __str__(self) -> str:
+        runs_per_second = self.runs / self.seconds if self.seconds else 0.0
+        steps_per_second = self.steps / self.seconds if self.seconds else 0.0
+        return (f"{self.name:<16} {self.runs:>8} ejecuciones {self.steps:>12} pasos "
+                f"{runs_per_second:>12.0f} ejec/s {steps_per_second:>14.0f} pasos/s")
+
+
+class DifferentialFuzzer:
+    """
+    Ejecuta el fuzzing diferencial entre los motores registrados
+    """
+    
+    def __init__(self, engines: Optional[List[str]] = None, seed: Optional[int] = None,
+                 max_steps: int = 500, num_states: int = 4, max_input_length: int = 10,
+                 budgets: bool = True):
+        """
+        Inicializa el fuzzer
+        
+        Args:
+            engines: Nombres de los motores a comparar (por defecto todos)
+            seed: Semilla para reproducir la ejecución
+            max_steps: Límite de pasos de cada simulación (si el presupuesto no define otro)
+            num_states: Estados de cada MT generada
+            max_input_length: Longitud máxima de las entradas generadas
+            budgets: Si cada MT se simula con un presupuesto aleatorio
+        """
+        self.engines = engines or [name for name in ENGINES if name != 'reference']
+        self.rng = random.Random(seed)
+        self.max_steps = max_steps
+        self.num_states = num_states
+        self.max_input_length = max_input_length
+        self.budgets = budgets
+        self.stats = {name: EngineStats(name) for name in ['reference'] + self.engines}
+        self.mismatches: List[Mismatch] = []
+    
+    def _run_engine(self, name: str, turing_machine: TuringMachine, budget: StepBudget,
+                    input_string: str, timed: bool = False) -> Tuple:
+        """Ejecuta un motor y retorna la firma del resultado (o el error)"""
+        try:
+            engine = ENGINES[name](turing_machine, self.max_steps, budget)
+            start = time.perf_counter()
+            result = engine(input_string)
+        except Exception as e:
+            return ('error', type(e).__name__, str(e))
+        if timed:
+            stats = self.stats[name]
+            stats.seconds += time.perf_counter() - start
+            stats.runs += 1
+            stats.steps += result.steps
+        return result_signature(result)
+    
+    def _mismatches(self, engine: str, machine_data: Dict[str, Any], budget: StepBudget,
+                    input_string: str) -> Optional[Tuple[Tuple, Tuple]]:
+        """Retorna (esperado, obtenido) si el motor discrepa en este caso"""
+        try:
+            turing_machine = YAMLParser.parse_turing_machine(machine_data)
+        except MTException:
+            return None
+        expected = self._run_engine('reference', turing_machine, budget, input_string)
+        actual = self._run_engine(engine, turing_machine, budget, input_string)
+        return (expected, actual) if expected != actual else None
+    
+    def run(self, num_machines: int = 100, inputs_per_machine: int = 10) -> List[Mismatch]:
+        """
+        Genera MT y entradas aleatorias y compara todos los motores
+        
+        Args:
+            num_machines: Número de MT a generar
+            inputs_per_machine: Entradas a probar por MT
+        
+        Returns:
+            Lista de discrepancias encontradas (ya reducidas)
+        """
+        for _ in range(num_machines):
+            machine_data = generate_random_machine(self.rng, self.num_states)
+            turing_machine = YAMLParser.parse_turing_machine(machine_data)
+            input_alphabet = machine_data['mt']['input_alphabet']
+            budget = generate_random_budget(self.rng, self.max_steps) if self.budgets else StepBudget()
+            
+            for _ in range(inputs_per_machine):
+                input_string = generate_random_input(self.rng, input_alphabet, self.max_input_length)
+                expected = self._run_engine('reference', turing_machine, budget, input_string, timed=True)
+                for engine in self.engines:
+                    actual = self._run_engine(engine, turing_machine, budget, input_string, timed=True)
+                    if actual != expected:
+                        self.mismatches.append(self.shrink(engine, machine_data, input_string, budget))
+        return self.mismatches
+    
+    def shrink(self, engine: str, machine_data: Dict[str, Any], input_string: str,
+               budget: Optional[StepBudget] = None) -> Mismatch:
+        """
+        Reduce una discrepancia a una MT y una entrada mínimas
+        
+        Quita transiciones, estados sin uso y símbolos de la entrada mientras
+        la discrepancia se mantenga.
+        
+        Args:
+            engine: Motor que discrepa
+            machine_data: Definición de la MT
+            input_string: Cadena de entrada
+            budget: Presupuesto con el que se encontró la discrepancia
+        
+        Returns:
+            Discrepancia reducida
+        """
+        budget = budget or StepBudget()
+        data = copy.deepcopy(machine_data)
+        changed = True
+        while changed:
+            changed = False
+            
+            # Quitar transiciones
+            transitions = data['mt']['transitions']
+            i = 0
+            while i < len(transitions):
+                candidate = copy.deepcopy(data)
+                del candidate['mt']['transitions'][i]
+                if self._mismatches(engine, candidate, budget, input_string):
+                    data, transitions, changed = candidate, candidate['mt']['transitions'], True
+                else:
+                    i += 1
+            
+            # Quitar estados que ya no aparecen en ninguna transición
+            mt_data = data['mt']
+            used = {mt_data['initial_state']} | set(mt_data['accept_states'])
+            for transition in mt_data['transitions']:
+                used.update((transition['state'], transition['next']))
+            if len(used) < len(mt_data['states']):
+                mt_data['states'] = [name for name in mt_data['states'] if name in used]
+            
+            # Acortar la entrada
+            i = 0
+            while i < len(input_string):
+                candidate_input = input_string[:i] + input_string[i + 1:]
+                if self._mismatches(engine, data, budget, candidate_input):
+                    input_string, changed = candidate_input, True
+                else:
+                    i += 1
+        
+        expected, actual = self._mismatches(engine, data, budget, input_string) or ((), ())
+        return Mismatch(engine, data, input_string, expected, actual, budget)
+    
+    def get_report(self) -> str:
+        """
+        Obtiene el reporte de discrepancias y rendimiento por motor
+        
+        Returns:
+            String con el reporte
+        """
+        report = f"Discrepancias: {len(self.mismatches)}\n"
+        for mismatch in self.mismatches:
+            report += f"{mismatch}\n"
+        report += "Rendimiento por motor:\n"
+        for stats in self.stats.values():
+            report += f"  {stats}\n"
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada del fuzzing diferencial
+    
+    Args:
+        argv: Argumentos de línea de comandos
+    
+    Returns:
+        0 si no hubo discrepancias, 1 en otro caso
+    """
+    parser = argparse.ArgumentParser(description="Fuzzing diferencial de los motores de simulación")
+    parser.add_argument('--machines', type=int, default=100, help="MT aleatorias a generar")
+    parser.add_argument('--inputs', type=int, default=10, help="Entradas por MT")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla")
+    parser.add_argument('--max-steps', type=int, default=500, help="Límite de pasos por simulación")
+    parser.add_argument('--states', type=int, default=4, help="Estados por MT")
+    parser.add_argument('--engines', nargs='*', default=None, choices=sorted(ENGINES),
+                        help="Motores a comparar contra la referencia")
+    parser.add_argument('--no-budgets', action='store_true',
+                        help="Simular sin presupuestos aleatorios (solo --max-steps)")
+    args = parser.parse_args(argv)
+    
+    fuzzer = DifferentialFuzzer(args.engines, args.seed, args.max_steps, args.states,
+                                budgets=not args.no_budgets)
+    mismatches = fuzzer.run(args.machines, args.inputs)
+    print(fuzzer.get_report())
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Análisis del grafo de estados de una Máquina de Turing
+"""
+
+from collections import deque
+from typing import Dict, Set, Tuple, Iterable
+from ..models.turing_machine import TuringMachine
+
+
+class MachineAnalysis:
+    """
+    Resultado del análisis estático del grafo de transiciones de una MT
+    """
+    
+    def __init__(self, turing_machine: TuringMachine):
+        """
+        Construye el grafo de estados y calcula los conjuntos relevantes
+        
+        Args:
+            turing_machine: La Máquina de Turing a analizar
+        """
+        self.turing_machine = turing_machine
+        
+        # Grafo de estados (aristas hacia adelante y hacia atrás)
+        self.successors: Dict[str, Set[str]] = {name: set() for name in turing_machine.states}
+        self.predecessors: Dict[str, Set[str]] = {name: set() for name in turing_machine.states}
+        for transition in turing_machine.transitions:
+            # Desde un estado de aceptación la simulación se detiene, sus aristas no cuentan
+            if turing_machine.is_accept_state(transition.from_state):
+                continue
+            self.successors[transition.from_state].add(transition.to_state)
+            self.predecessors[transition.to_state].add(transition.from_state)
+        
+        # Estados alcanzables desde el estado inicial
+        self.reachable_states = self._closure([turing_machine.initial_state], self.successors)
+        self.unreachable_states = set(turing_machine.states) - self.reachable_states
+        
+        # Estados desde los que se puede llegar a algún estado de aceptación
+        self.productive_states = self._closure(turing_machine.accept_states, self.predecessors)
+        self.dead_states = set(turing_machine.states) - self.productive_states
+        
+        # Estados muertos que aún tienen transiciones: la simulación deambularía en ellos
+        self.wandering_states = {name for name in self.dead_states if self.successors[name]}
+        
+        # Pares (estado, símbolo) sin transición: la MT se detiene ahí
+        self.halting_pairs: Set[Tuple[str, str]] = set()
+        for name in turing_machine.states:
+            if turing_machine.is_accept_state(name):
+                continue
+            for symbol in turing_machine.tape_alphabet:
+                if turing_machine.get_transition(name, [symbol]) is None:
+                    self.halting_pairs.add((name, symbol))
+    
+    @staticmethod
+    def _closure(start: Iterable[str], edges: Dict[str, Set[str]]) -> Set[str]:
+        """
+        Calcula el conjunto de estados alcanzables mediante BFS
+        
+        Args:
+            start: Estados de partida
+            edges: Aristas del grafo a recorrer
+            
+        Returns:
+            Conjunto de estados visitados (incluye los de partida)
+        """
+        visited = set(start)
+        queue = deque(visited)
+        while queue:
+            state = queue.popleft()
+            for neighbor in edges.get(state, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        return visited
+    
+    def is_dead(self, state: str) -> bool:
+        """
+        Verifica si desde un estado ya no es posible aceptar
+        
+        Args:
+            state: Nombre del estado
+            
+        Returns:
+            True si ningún estado de aceptación es alcanzable desde él
+        """
+        return state in self.dead_states
+    
+    def is_halting(self, state: str, symbol: str) -> bool:
+        """
+        Verifica si la MT se detiene en el par (estado, símbolo)
+        
+        Args:
+            state: Nombre del estado
+            symbol: Símbolo leído
+            
+        Returns:
+            True si no existe transición para el par
+        """
+        return (state, symbol) in self.halting_pairs
+    
+    def get_report(self) -> str:
+        """
+        Obtiene un reporte legible del análisis
+        
+        Returns:
+            String con el reporte
+        """
+        report = "Análisis estático:\n"
+        report += f"  Estados inalcanzables: {sorted(self.unreachable_states)}\n"
+        report += f"  Estados muertos: {sorted(self.dead_states)}\n"
+        report += f"  Estados muertos con transiciones: {sorted(self.wandering_states)}\n"
+        report += f"  Pares (estado, símbolo) de parada: {len(self.halting_pairs)}\n"
+        return report
+
+
+def analyze_machine(turing_machine: TuringMachine) -> MachineAnalysis:
+    """
+    Analiza el grafo de transiciones de una MT
+    
+    Args:
+        turing_machine: La Máquina de Turing a analizar
+        
+    Returns:
+        Instancia de MachineAnalysis con los resultados
+    """
+    return MachineAnalysis(turing_machine)
+
+
+def prune_machine(turing_machine: TuringMachine) -> TuringMachine:
+    """
+    Crea una MT equivalente sin peso muerto
+    
+    Elimina los estados inalcanzables (y sus transiciones) y quita las
+    transiciones que salen de estados muertos, de modo que la simulación
+    rechaza en cuanto entra a uno de ellos.
+    
+    Args:
+        turing_machine: La Máquina de Turing a podar
+        
+    Returns:
+        Nueva instancia de TuringMachine podada
+    """
+    analysis = analyze_machine(turing_machine)
+    keep = analysis.reachable_states
+    
+    transitions = []
+    for transition in turing_machine.transitions:
+        if transition.from_state not in keep or transition.from_state in analysis.dead_states:
+            continue
+        transitions.append({
+            'state': transition.from_state,
+            'read': list(transition.read_symbols),
+            'write': list(transition.write_symbols),
+            'move': transition.move,
+            'next': transition.to_state
+        })
+    
+    return TuringMachine(
+        states=[name for name in turing_machine.states if name in keep],
+        input_alphabet=sorted(turing_machine.input_alphabet),
+        tape_alphabet=sorted(turing_machine.tape_alphabet),
+        initial_state=turing_machine.initial_state,
+        accept_states=[name for name in turing_machine.accept_states if name in keep],
+        transitions=transitions,
+        blank_symbol=turing_machine.blank_symbol,
+        budget=turing_machine.budget
+    )
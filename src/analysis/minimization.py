@@ -0,0 +1,134 @@
+"""
+Minimización de Máquinas de Turing por refinamiento de particiones
+"""
+
+from typing import Dict, List, Tuple
+from ..models.turing_machine import TuringMachine
+from .graph_analysis import analyze_machine
+
+
+def compute_equivalence_classes(turing_machine: TuringMachine) -> List[List[str]]:
+    """
+    Agrupa los estados alcanzables con comportamiento idéntico
+    
+    Parte de la partición {aceptación, no aceptación} y la refina usando la
+    firma de cada estado: para cada símbolo leído, (escritura, movimiento,
+    bloque del siguiente estado). Termina cuando la partición es estable.
+    
+    Args:
+        turing_machine: La Máquina de Turing a analizar
+        
+    Returns:
+        Lista de clases de equivalencia (cada una en el orden original de estados)
+    """
+    reachable = analyze_machine(turing_machine).reachable_states
+    states = [name for name in turing_machine.states if name in reachable]
+    symbols = sorted(turing_machine.tape_alphabet)
+    
+    # Tabla δ por estado: símbolo -> (escritura, movimiento, siguiente)
+    table: Dict[str, Dict[str, Tuple[str, str, str]]] = {name: {} for name in states}
+    for transition in turing_machine.transitions:
+        if transition.from_state in table:
+            table[transition.from_state][transition.read_symbols[0]] = (
+                transition.write_symbols[0], transition.move, transition.to_state)
+    
+    # Los estados de aceptación detienen la simulación: todos son equivalentes
+    block_of = {name: (1 if turing_machine.is_accept_state(name) else 0) for name in states}
+    num_blocks = len(set(block_of.values()))
+    
+    while True:
+        signatures: Dict[tuple, int] = {}
+        new_block_of = {}
+        for name in states:
+            if turing_machine.is_accept_state(name):
+                signature = ('accept',)
+            else:
+                row = table[name]
+                signature = (block_of[name],) + tuple(
+                    (row[s][0], row[s][1], block_of[row[s][2]]) if s in row else None
+                    for s in symbols
+                )
+            new_block_of[name] = signatures.setdefault(signature, len(signatures))
+        
+        block_of = new_block_of
+        if len(signatures) == num_blocks:
+            break
+        num_blocks = len(signatures)
+    
+    classes: Dict[int, List[str]] = {}
+    for name in states:
+        classes.setdefault(block_of[name], []).append(name)
+    return list(classes.values())
+
+
+def minimize_machine(turing_machine: TuringMachine, rename: bool = True) -> TuringMachine:
+    """
+    Crea una MT mínima equivalente fusionando estados equivalentes
+    
+    Los estados inalcanzables se descartan. Con rename=True los estados se
+    renumeran como q0, q1, ... en orden BFS desde el estado inicial; si no,
+    cada clase conserva el nombre de su representante.
+    
+    Args:
+        turing_machine: La Máquina de Turing a minimizar
+        rename: Si se renumeran los estados resultantes
+        
+    Returns:
+        Nueva instancia de TuringMachine minimizada
+    """
+    classes = compute_equivalence_classes(turing_machine)
+    
+    # Representante de cada clase (el estado inicial representa a la suya)
+    representative: Dict[str, str] = {}
+    for members in classes:
+        leader = turing_machine.initial_state if turing_machine.initial_state in members else members[0]
+        for name in members:
+            representative[name] = leader
+    
+    # Transiciones de los representantes, redirigidas a representantes; las
+    # de los estados de aceptación nunca se ejecutan y pueden llevar a estados
+    # que la alcanzabilidad descartó
+    transitions_by_state: Dict[str, List[Dict]] = {}
+    for transition in turing_machine.transitions:
+        if representative.get(transition.from_state) != transition.from_state:
+            continue
+        if turing_machine.is_accept_state(transition.from_state):
+            continue
+        transitions_by_state.setdefault(transition.from_state, []).append({
+            'state': transition.from_state,
+            'read': list(transition.read_symbols),
+            'write': list(transition.write_symbols),
+            'move': transition.move,
+            'next': representative[transition.to_state]
+        })
+    
+    # Orden BFS desde el estado inicial para una numeración estable
+    order = [turing_machine.initial_state]
+    seen = {turing_machine.initial_state}
+    index = 0
+    while index < len(order):
+        for trans_dict in transitions_by_state.get(order[index], []):
+            if trans_dict['next'] not in seen:
+                seen.add(trans_dict['next'])
+                order.append(trans_dict['next'])
+        index += 1
+    
+    names: Dict[str, str] = {leader: (f"q{i}" if rename else leader) for i, leader in enumerate(order)}
+    
+    transitions = []
+    for leader in order:
+        for trans_dict in transitions_by_state.get(leader, []):
+            trans_dict['state'] = names[trans_dict['state']]
+            trans_dict['next'] = names[trans_dict['next']]
+            transitions.append(trans_dict)
+    
+    return TuringMachine(
+        states=[names[leader] for leader in order],
+        input_alphabet=sorted(turing_machine.input_alphabet),
+        tape_alphabet=sorted(turing_machine.tape_alphabet),
+        initial_state=names[turing_machine.initial_state],
+        accept_states=[names[leader] for leader in order if turing_machine.is_accept_state(leader)],
+        transitions=transitions,
+        blank_symbol=turing_machine.blank_symbol,
+        budget=turing_machine.budget
+    )
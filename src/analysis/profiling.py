@@ -0,0 +1,415 @@
+"""
+Perfilado del lenguaje aceptado por una MT según la longitud de la entrada
+
+Ejecuta la MT sobre todas las cadenas de cada longitud (o una muestra
+aleatoria si son demasiadas), registra pasos, tamaño máximo de la cinta,
+recorrido del cabezal y expansiones a la izquierda, y ajusta la complejidad
+empírica del peor caso (p. ej. O(n²) para mt_reconocedora.yaml). Produce una
+tabla, un CSV y, si matplotlib está instalado, gráficas.
+
+Uso:
+    python -m src.analysis.profiling --mt mt_reconocedora.yaml --max-length 12 --output perfil
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import multiprocessing
+import os
+import random
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.budget import StepBudget
+from ..parser.yaml_parser import YAMLParser
+from ..simulator.mt_simulator import MTSimulator
+from ..simulator.simulation_result import HaltReason
+from ..utils.exceptions import MTException
+
+
+# Métricas por ejecución: (aceptada, límite alcanzado, pasos, tamaño de cinta,
+# recorrido del cabezal, expansiones a la izquierda)
+RunMetrics = Tuple[bool, bool, int, int, int, int]
+
+METRICS = ('steps', 'max_tape', 'head_travel', 'left_expansions')
+
+# Modelos de complejidad en orden de preferencia ante un empate
+COMPLEXITY_MODELS: Dict[str, Callable[[int], float]] = {
+    'O(1)': lambda n: 0.0,
+    'O(log n)': lambda n: math.log2(n),
+    'O(n)': lambda n: float(n),
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n²)': lambda n: float(n ** 2),
+    'O(n² log n)': lambda n: n ** 2 * math.log2(n),
+    'O(n³)': lambda n: float(n ** 3),
+    'O(2^n)': lambda n: 2.0 ** n,
+}
+
+
+def profile_input(simulator: MTSimulator, input_string: str) -> RunMetrics:
+    """
+    Simula una cadena sin IDs con MTSimulator.run y mide el uso de recursos
+    
+    El tamaño de la cinta, el recorrido del cabezal y las expansiones a la
+    izquierda se leen de la cinta final.
+    
+    Args:
+        simulator: Simulador de la MT (con el presupuesto de pasos a aplicar)
+        input_string: Cadena de entrada
+    
+    Returns:
+        Tupla RunMetrics
+    """
+    result = simulator.run(input_string, record_trace=False)
+    limited = result.halt_reason in (HaltReason.MAX_STEPS, HaltReason.STEP_BUDGET)
+    tape = result.tape
+    return (result.accepted, limited, result.steps, len(tape.tape), tape.head_moves,
+            tape.left_expansions)
+
+
+def enumerate_inputs(alphabet: List[str], length: int, samples: int,
+                     rng: random.Random) -> Tuple[List[str], bool]:
+    """
+    Obtiene las cadenas a perfilar de una longitud
+    
+    Args:
+        alphabet: Alfabeto de entrada
+        length: Longitud de las cadenas
+        samples: Máximo de cadenas; si hay más se toma una muestra aleatoria
+        rng: Generador aleatorio para el muestreo
+    
+    Returns:
+        Tupla con (cadenas, exhaustivo)
+    """
+    total = len(alphabet) ** length
+    if total <= samples:
+        return [''.join(word) for word in itertools.product(alphabet, repeat=length)], True
+    return [''.join(rng.choice(alphabet) for _ in range(length)) for _ in range(samples)], False
+
+
+class LengthProfile:
+    """
+    Métricas agregadas de todas las cadenas de una misma longitud
+    """
+    
+    def __init__(self, length: int, exhaustive: bool):
+        self.length = length
+        self.exhaustive = exhaustive
+        self.runs = 0
+        self.accepted = 0
+        self.limited = 0
+        self.totals = dict.fromkeys(METRICS, 0)
+        self.maxima = dict.fromkeys(METRICS, 0)
+    
+    def add(self, metrics: RunMetrics) -> None:
+        """Agrega las métricas de una ejecución"""
+        accepted, limited = metrics[0], metrics[1]
+        self.runs += 1
+        self.accepted += accepted
+        self.limited += limited
+        for name, value in zip(METRICS, metrics[2:]):
+            self.totals[name] += value
+            if value > self.maxima[name]:
+                self.maxima[name] = value
+    
+    def mean(self, metric: str) -> float:
+        """Promedio de una métrica"""
+        return self.totals[metric] / self.runs if self.runs else 0.0
+    
+    def to_row(self) -> Dict[str, object]:
+        """Fila para el CSV"""
+        row = {'length': self.length, 'runs': self.runs, 'exhaustive': self.exhaustive,
+               'accepted': self.accepted, 'step_limit_reached': self.limited}
+        for metric in METRICS:
+            row[f'{metric}_mean'] = round(self.mean(metric), 3)
+            row[f'{metric}_max'] = self.maxima[metric]
+        return row
+
+
+class ComplexityFit:
+    """
+    Ajuste por mínimos cuadrados y = a + b·f(n) del mejor modelo de COMPLEXITY_MODELS
+    """
+    
+    def __init__(self, model: str, intercept: float, coefficient: float, r_squared: float):
+        self.model = model
+        self.intercept = intercept
+        self.coefficient = coefficient
+        self.r_squared = r_squared
+    
+    def predict(self, length: int) -> float:
+        """Valor estimado para una longitud"""
+        return self.intercept + self.coefficient * COMPLEXITY_MODELS[self.model](length)
+    
+    @classmethod
+    def fit(cls, points: List[Tuple[int, float]]) -> Optional['ComplexityFit']:
+        """
+        Elige el modelo con menor error residual
+        
+        Args:
+            points: Pares (longitud, valor); se ignoran longitudes menores a 1
+        
+        Returns:
+            Instancia de ComplexityFit, o None si hay menos de tres puntos
+        """
+        points = [(n, y) for n, y in points if n >= 1]
+        if len(points) < 3:
+            return None
+        
+        mean_y = sum(y for _, y in points) / len(points)
+        total = sum((y - mean_y) ** 2 for _, y in points)
+        best = None
+        
+        for model, function in COMPLEXITY_MODELS.items():
+            xs = [function(n) for n, _ in points]
+            mean_x = sum(xs) / len(xs)
+            variance = sum((x - mean_x) ** 2 for x in xs)
+            if variance == 0:
+                coefficient = 0.0
+            else:
+                coefficient = sum((x - mean_x) * (y - mean_y) for x, (_, y) in zip(xs, points)) / variance
+                if coefficient < 0:
+                    continue
+            intercept = mean_y - coefficient * mean_x
+            residual = sum((y - intercept - coefficient * x) ** 2 for x, (_, y) in zip(xs, points))
+            
+            # Un modelo más complejo solo gana si reduce el error de forma apreciable
+            if best is None or residual < best[0] * (1 - 1e-6) - 1e-9:
+                r_squared = 1 - residual / total if total else 1.0
+                best = (residual, cls(model, intercept, coefficient, r_squared))
+        return best[1]
+    
+    def __str__(self) -> str:
+        return (f"{self.model} (≈ {self.intercept:.2f} + {self.coefficient:.4g}·f(n), "
+                f"R² = {self.r_squared:.4f})")
+
+
+# Simulador de la MT en cada proceso trabajador
+_worker_simulator: Optional[MTSimulator] = None
+
+
+def _init_worker(machine: tuple) -> None:
+    """Crea el simulador del proceso trabajador a partir de (MT, max_steps, análisis, presupuesto)"""
+    global _worker_simulator
+    _worker_simulator = MTSimulator(*machine)
+
+
+def _profile_chunk(strings: List[str]) -> List[RunMetrics]:
+    """Perfila un grupo de cadenas"""
+    return [profile_input(_worker_simulator, input_string) for input_string in strings]
+
+
+class AcceptanceProfiler:
+    """
+    Perfila una MT sobre longitudes de entrada crecientes
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, max_steps: int = 100000,
+                 use_analysis: bool = True, budget: Optional[StepBudget] = None,
+                 workers: int = 1, seed: Optional[int] = None):
+        """
+        Inicializa el perfilador
+        
+        Args:
+            turing_machine: La Máquina de Turing a perfilar
+            max_steps: Límite de pasos si el presupuesto no define uno
+            use_analysis: Si se rechaza al entrar a un estado muerto
+            budget: Presupuesto de ejecución (solo se usan los límites de pasos)
+            workers: Procesos trabajadores (1 = mismo proceso)
+            seed: Semilla del muestreo de cadenas
+        """
+        self.turing_machine = turing_machine
+        self.max_steps = max_steps
+        self.budget = budget or turing_machine.budget or StepBudget()
+        self.workers = workers
+        self.rng = random.Random(seed)
+        
+        # Solo los límites de pasos: sin tiempo ni crecimiento máximo de la cinta
+        step_budget = StepBudget(self.budget.max_steps, self.budget.steps_coefficient,
+                                 self.budget.steps_exponent, self.budget.steps_base)
+        self._machine = (turing_machine, max_steps, use_analysis, step_budget)
+        self.profiles: List[LengthProfile] = []
+    
+    def run(self, lengths: Iterable[int], samples: int = 1000,
+            chunk_size: int = 256) -> List[LengthProfile]:
+        """
+        Perfila cada longitud
+        
+        Args:
+            lengths: Longitudes de entrada a perfilar
+            samples: Máximo de cadenas por longitud (exhaustivo si caben)
+            chunk_size: Cadenas por trabajo enviado a los procesos trabajadores
+        
+        Returns:
+            Lista de LengthProfile, una por longitud
+        """
+        alphabet = sorted(self.turing_machine.input_alphabet)
+        jobs = []
+        profiles = {}
+        for length in lengths:
+            strings, exhaustive = enumerate_inputs(alphabet, length, samples, self.rng)
+            profiles[length] = LengthProfile(length, exhaustive)
+            for start in range(0, len(strings), chunk_size):
+                jobs.append((length, strings[start:start + chunk_size]))
+        
+        if self.workers == 1:
+            _init_worker(self._machine)
+            results = map(_profile_chunk, (job for _, job in jobs))
+            for (length, _), metrics in zip(jobs, results):
+                for run_metrics in metrics:
+                    profiles[length].add(run_metrics)
+        else:
+            with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                      initargs=(self._machine,)) as pool:
+                results = pool.imap(_profile_chunk, (job for _, job in jobs))
+                for (length, _), metrics in zip(jobs, results):
+                    for run_metrics in metrics:
+                        profiles[length].add(run_metrics)
+        
+        self.profiles = [profiles[length] for length in sorted(profiles)]
+        return self.profiles
+    
+    def fit(self, metric: str = 'steps') -> Optional[ComplexityFit]:
+        """
+        Ajusta la complejidad del peor caso de una métrica
+        
+        Args:
+            metric: Una de METRICS
+        
+        Returns:
+            Instancia de ComplexityFit o None si no hay suficientes longitudes
+        """
+        return ComplexityFit.fit([(profile.length, profile.maxima[metric]) for profile in self.profiles])
+    
+    def get_table(self) -> str:
+        """
+        Obtiene la tabla de resultados y los ajustes de complejidad
+        
+        Returns:
+            String con la tabla
+        """
+        lines = [f"{'n':>4} {'cadenas':>8} {'acept.':>7} {'límite':>7} "
+                 f"{'pasos prom':>11} {'pasos máx':>10} {'cinta máx':>10} "
+                 f"{'recorrido máx':>14} {'exp. izq. máx':>14}"]
+        for profile in self.profiles:
+            runs = f"{profile.runs}{'' if profile.exhaustive else '*'}"
+            lines.append(f"{profile.length:>4} {runs:>8} {profile.accepted:>7} {profile.limited:>7} "
+                         f"{profile.mean('steps'):>11.1f} {profile.maxima['steps']:>10} "
+                         f"{profile.maxima['max_tape']:>10} {profile.maxima['head_travel']:>14} "
+                         f"{profile.maxima['left_expansions']:>14}")
+        if any(not profile.exhaustive for profile in self.profiles):
+            lines.append("* muestra aleatoria")
+        
+        lines.append("")
+        lines.append("Complejidad empírica (peor caso):")
+        for metric in METRICS:
+            fit = self.fit(metric)
+            lines.append(f"  {metric:<16} {fit if fit else 'sin datos suficientes'}")
+        return '\n'.join(lines)
+    
+    def write_csv(self, file_path: str) -> None:
+        """
+        Guarda las métricas por longitud en CSV
+        
+        Args:
+            file_path: Ruta del archivo
+        """
+        rows = [profile.to_row() for profile in self.profiles]
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]) if rows else ['length'])
+            writer.writeheader()
+            writer.writerows(rows)
+    
+    def write_plots(self, directory: str) -> List[str]:
+        """
+        Guarda una gráfica por métrica (promedio, peor caso y ajuste)
+        
+        Requiere matplotlib, que es opcional.
+        
+        Args:
+            directory: Carpeta de destino
+        
+        Returns:
+            Rutas de las gráficas generadas
+        
+        Raises:
+            MTException: Si matplotlib no está instalado
+        """
+        try:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+        except ImportError:
+            raise MTException("Se requiere matplotlib para generar gráficas (pip install matplotlib)")
+        
+        lengths = [profile.length for profile in self.profiles]
+        paths = []
+        for metric in METRICS:
+            figure, axes = plt.subplots()
+            axes.plot(lengths, [profile.mean(metric) for profile in self.profiles], 'o-', label='promedio')
+            axes.plot(lengths, [profile.maxima[metric] for profile in self.profiles], 's-', label='peor caso')
+            fit = self.fit(metric)
+            if fit is not None:
+                fitted = [n for n in lengths if n >= 1]
+                axes.plot(fitted, [fit.predict(n) for n in fitted], '--', label=f'ajuste {fit.model}')
+            axes.set_xlabel('longitud de la entrada (n)')
+            axes.set_ylabel(metric)
+            axes.set_title(metric)
+            axes.legend()
+            
+            path = os.path.join(directory, f'{metric}.png')
+            figure.savefig(path)
+            plt.close(figure)
+            paths.append(path)
+        return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada del perfilado
+    
+    Args:
+        argv: Argumentos de línea de comandos
+    
+    Returns:
+        0 si se completó, 2 si hubo errores
+    """
+    parser = argparse.ArgumentParser(description="Perfilado de pasos y uso de cinta según la longitud de la entrada")
+    parser.add_argument('--mt', '-m', required=True, help="Archivo YAML con la definición de la MT")
+    parser.add_argument('--min-length', type=int, default=0, help="Longitud mínima")
+    parser.add_argument('--max-length', type=int, default=10, help="Longitud máxima")
+    parser.add_argument('--samples', type=int, default=1000,
+                        help="Cadenas por longitud; si hay más se toma una muestra aleatoria")
+    parser.add_argument('--max-steps', type=int, default=100000, help="Límite de pasos por cadena")
+    parser.add_argument('--workers', '-w', type=int, default=1, help="Procesos trabajadores")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla del muestreo")
+    parser.add_argument('--output', '-o', default=None,
+                        help="Carpeta donde guardar profile.csv y las gráficas")
+    args = parser.parse_args(argv)
+    
+    try:
+        turing_machine = YAMLParser.parse_turing_machine(YAMLParser.load_from_file(args.mt))
+    except MTException as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    profiler = AcceptanceProfiler(turing_machine, args.max_steps, workers=args.workers, seed=args.seed)
+    profiler.run(range(args.min_length, args.max_length + 1), args.samples)
+    print(profiler.get_table())
+    
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        csv_path = os.path.join(args.output, 'profile.csv')
+        profiler.write_csv(csv_path)
+        print(f"\nTabla guardada en {csv_path}")
+        try:
+            for path in profiler.write_plots(args.output):
+                print(f"Gráfica guardada en {path}")
+        except MTException as e:
+            print(f"⚠️  {e}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Interfaz de línea de comandos no interactiva para el simulador
+
+Uso:
+    python main.py --mt mt_reconocedora.yaml --cadenas cadenas_reconocedora.txt \\
+                   --trace summary --workers 4 --max-steps 10000 --format jsonl
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+from .parser.corpus_reader import CorpusReader
+from .simulator.batch_runner import BatchRunner, write_records, TRACE_LEVELS, OUTPUT_FORMATS
+from .analysis.coverage import CoverageMap
+from .utils.exceptions import MTException
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """
+    Construye el parser de argumentos de la CLI
+    
+    Returns:
+        Instancia de ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Simula un archivo de cadenas sobre una Máquina de Turing sin interacción")
+    parser.add_argument('--mt', '-m', required=True, help="Archivo YAML con la definición de la MT")
+    parser.add_argument('--cadenas', '-c', required=True,
+                        help="Archivo de cadenas (texto, .tsv o .jsonl, opcionalmente .gz)")
+    parser.add_argument('--trace', '-t', choices=TRACE_LEVELS, default='summary',
+                        help="Nivel de detalle de cada registro (por defecto: summary)")
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help="Número de procesos trabajadores (por defecto: 1)")
+    parser.add_argument('--max-steps', type=int, default=10000,
+                        help="Número máximo de pasos por cadena si la MT no declara un presupuesto (por defecto: 10000)")
+    parser.add_argument('--format', '-f', choices=OUTPUT_FORMATS, default='jsonl',
+                        help="Formato de salida en stdout (por defecto: jsonl)")
+    parser.add_argument('--ordered', action='store_true',
+                        help="Emitir los resultados en el orden del archivo de cadenas")
+    parser.add_argument('--coverage', metavar='ARCHIVO',
+                        help="Medir la cobertura de transiciones y guardarla en ARCHIVO (JSON); "
+                             "si ya existe, se combina con la cobertura guardada")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la CLI
+    
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv[1:])
+        
+    Returns:
+        Código de salida: 0 si todo coincide, 1 si hubo discrepancias con los
+        resultados esperados, 2 si hubo un error
+    """
+    args = build_argument_parser().parse_args(argv)
+    
+    try:
+        runner = BatchRunner(args.mt, max_steps=args.max_steps, workers=args.workers,
+                             trace_level=args.trace, coverage=args.coverage is not None)
+        records = runner.run(CorpusReader(args.cadenas), ordered=args.ordered)
+        written, mismatches = write_records(records, sys.stdout, args.format, args.trace)
+        if runner.coverage is not None:
+            if os.path.exists(args.coverage):
+                runner.coverage.merge(CoverageMap.load(runner.turing_machine, args.coverage))
+            runner.coverage.save(args.coverage)
+    except MTException as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # La salida se cerró (p. ej. al usar `| head`)
+        return 0
+    
+    print(f"{written} cadenas simuladas, {mismatches} discrepancias", file=sys.stderr)
+    if runner.coverage is not None:
+        print(runner.coverage.get_report(details=False), file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
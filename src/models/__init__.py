@@ -7,7 +7,9 @@ los componentes de una Máquina de Turing.
 
 from .turing_machine import TuringMachine
 from .tape import Tape
+from .mapped_tape import MappedInput, MappedTape
 from .transition import Transition
-from .state import State
+from .state import State, StateRow
+from .budget import StepBudget
 
-__all__ = ['TuringMachine', 'Tape', 'Transition', 'State']
\ No newline at end of file
+__all__ = ['TuringMachine', 'Tape', 'MappedInput', 'MappedTape', 'Transition', 'State', 'StateRow', 'StepBudget']
\ No newline at end of file
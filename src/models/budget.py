@@ -0,0 +1,99 @@
+"""
+Clase StepBudget para representar el presupuesto de ejecución de una MT
+"""
+
+from typing import Any, Dict, Optional
+
+
+class StepBudget:
+    """
+    Presupuesto de ejecución de una simulación
+    
+    Combina hasta cuatro límites; la simulación se detiene con el primero que
+    se cumpla:
+        - max_steps: número fijo de pasos
+        - steps_coefficient / steps_exponent / steps_base: polinomio en la
+          longitud n de la entrada, base + c·n^k pasos
+        - time_limit: segundos de reloj
+        - max_tape_growth: celdas que la cinta puede crecer respecto a la entrada
+    """
+    
+    # Claves admitidas en el bloque 'budget' del YAML
+    FIELDS = ('max_steps', 'steps_coefficient', 'steps_exponent', 'steps_base',
+              'time_limit', 'max_tape_growth')
+    
+    def __init__(self, max_steps: Optional[int] = None, steps_coefficient: Optional[float] = None,
+                 steps_exponent: float = 2, steps_base: int = 0,
+                 time_limit: Optional[float] = None, max_tape_growth: Optional[int] = None):
+        """
+        Inicializa el presupuesto
+        
+        Args:
+            max_steps: Límite fijo de pasos (None = sin límite fijo)
+            steps_coefficient: Coeficiente c del límite polinomial (None = sin límite polinomial)
+            steps_exponent: Exponente k del límite polinomial
+            steps_base: Término constante del límite polinomial
+            time_limit: Límite de tiempo en segundos (None = sin límite)
+            max_tape_growth: Celdas que puede crecer la cinta (None = sin límite)
+        """
+        self.max_steps = max_steps
+        self.steps_coefficient = steps_coefficient
+        self.steps_exponent = steps_exponent
+        self.steps_base = steps_base
+        self.time_limit = time_limit
+        self.max_tape_growth = max_tape_growth
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StepBudget':
+        """
+        Crea un presupuesto a partir del bloque 'budget' del YAML
+        
+        Args:
+            data: Diccionario con las claves de FIELDS
+            
+        Returns:
+            Instancia de StepBudget
+        """
+        return cls(**{key: data[key] for key in cls.FIELDS if key in data})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte el presupuesto al formato del bloque 'budget' del YAML
+        
+        Returns:
+            Diccionario solo con los límites definidos
+        """
+        data = {}
+        if self.max_steps is not None:
+            data['max_steps'] = self.max_steps
+        if self.steps_coefficient is not None:
+            data['steps_coefficient'] = self.steps_coefficient
+            data['steps_exponent'] = self.steps_exponent
+            data['steps_base'] = self.steps_base
+        if self.time_limit is not None:
+            data['time_limit'] = self.time_limit
+        if self.max_tape_growth is not None:
+            data['max_tape_growth'] = self.max_tape_growth
+        return data
+    
+    def has_step_limit(self) -> bool:
+        """Indica si el presupuesto limita el número de pasos"""
+        return self.max_steps is not None or self.steps_coefficient is not None
+    
+    def polynomial_limit(self, input_length: int) -> Optional[int]:
+        """
+        Calcula el límite polinomial para una longitud de entrada
+        
+        Args:
+            input_length: Longitud n de la cadena de entrada
+            
+        Returns:
+            Número de pasos permitidos o None si no hay límite polinomial
+        """
+        if self.steps_coefficient is None:
+            return None
+        return int(self.steps_base + self.steps_coefficient * input_length ** self.steps_exponent)
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"StepBudget({fields})"
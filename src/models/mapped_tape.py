@@ -0,0 +1,235 @@
+"""
+Cintas cuya región inicial es un archivo mapeado en memoria (entradas enormes)
+"""
+
+import mmap
+import os
+import sys
+from typing import Iterable, Iterator, List, Optional, Set, Union
+from .tape import Tape
+from ..utils.exceptions import SimulationError
+
+
+# Símbolo (string internado) correspondiente a cada byte del archivo
+_BYTE_SYMBOLS = [sys.intern(chr(code)) for code in range(256)]
+
+# Tamaño de los bloques revisados en la validación del alfabeto
+_VALIDATION_CHUNK = 1 << 24
+
+
+class MappedInput:
+    """
+    Cadena de entrada guardada en un archivo, un símbolo por byte (ASCII o Latin-1)
+    
+    El archivo se mapea con mmap en modo de solo lectura, así que abrirlo no
+    copia su contenido; el salto de línea final, si existe, no forma parte de
+    la entrada.
+    """
+    
+    def __init__(self, file_path: str):
+        """
+        Abre y mapea el archivo de entrada
+        
+        Args:
+            file_path: Ruta del archivo
+        
+        Raises:
+            SimulationError: Si el archivo no se puede abrir
+        """
+        self.path = file_path
+        try:
+            with open(file_path, 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                # mmap no admite archivos vacíos
+                self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        except OSError as e:
+            raise SimulationError(f"No se pudo abrir la entrada {file_path}: {e}")
+        
+        length = len(self.data)
+        while length and self.data[length - 1] in (0x0A, 0x0D):
+            length -= 1
+        self.length = length
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __str__(self) -> str:
+        return f"<archivo {self.path}: {self.length} símbolos>"
+    
+    def __repr__(self) -> str:
+        return f"MappedInput('{self.path}', length={self.length})"
+    
+    def find_invalid_symbols(self, alphabet: Iterable[str]) -> Set[str]:
+        """
+        Valida el alfabeto con una tabla de bytes, por bloques y sin decodificar
+        
+        bytes.translate elimina en C todos los bytes permitidos; lo que queda
+        son los símbolos inválidos.
+        
+        Args:
+            alphabet: Símbolos permitidos
+        
+        Returns:
+            Conjunto de símbolos inválidos encontrados (vacío si la entrada es válida)
+        """
+        allowed = bytes(ord(symbol) for symbol in alphabet if len(symbol) == 1 and ord(symbol) < 256)
+        invalid = set()
+        for start in range(0, self.length, _VALIDATION_CHUNK):
+            chunk = self.data[start:min(start + _VALIDATION_CHUNK, self.length)]
+            remaining = chunk.translate(None, allowed)
+            if remaining:
+                invalid.update(_BYTE_SYMBOLS[code] for code in set(remaining))
+        return invalid
+    
+    def create_tape(self, blank_symbol: str = "B") -> 'MappedTape':
+        """
+        Crea una cinta cuya región inicial es este archivo
+        
+        Args:
+            blank_symbol: Símbolo en blanco
+        
+        Returns:
+            Instancia de MappedTape
+        """
+        return MappedTape(self, blank_symbol)
+    
+    def close(self) -> None:
+        """Libera el mapeo del archivo"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+class MappedCells:
+    """
+    Secuencia de celdas con la interfaz de lista que usa Tape
+    
+    Las celdas del archivo se decodifican al leerlas y solo las escritas se
+    guardan (copia al escribir); las celdas agregadas a la izquierda y a la
+    derecha del archivo viven en listas aparte. La memoria usada es
+    proporcional a las celdas modificadas o agregadas.
+    """
+    
+    def __init__(self, source: MappedInput, blank_symbol: str):
+        self.data = source.data
+        self.length = source.length
+        self.blank_symbol = blank_symbol
+        # Celdas a la izquierda del archivo, en orden inverso (insert(0) es O(1))
+        self.left: List[str] = []
+        # Celdas a la derecha del archivo
+        self.right: List[str] = []
+        # Celdas del archivo ya escritas: desplazamiento en el archivo -> símbolo
+        self.written = {}
+        if not self.length:
+            self.right.append(blank_symbol)
+    
+    def __len__(self) -> int:
+        return len(self.left) + self.length + len(self.right)
+    
+    def _get(self, index: int) -> str:
+        left = len(self.left)
+        if index < left:
+            return self.left[left - 1 - index]
+        offset = index - left
+        if offset < self.length:
+            symbol = self.written.get(offset)
+            return symbol if symbol is not None else _BYTE_SYMBOLS[self.data[offset]]
+        return self.right[offset - self.length]
+    
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice fuera de la cinta")
+        return self._get(index)
+    
+    def __setitem__(self, index: int, symbol: str) -> None:
+        if index < 0:
+            index += len(self)
+        left = len(self.left)
+        if index < left:
+            self.left[left - 1 - index] = symbol
+            return
+        offset = index - left
+        if offset < self.length:
+            self.written[offset] = symbol
+        else:
+            self.right[offset - self.length] = symbol
+    
+    def insert(self, index: int, symbol: str) -> None:
+        if index != 0:
+            raise SimulationError("MappedCells solo admite inserciones al inicio")
+        self.left.append(symbol)
+    
+    def append(self, symbol: str) -> None:
+        self.right.append(symbol)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (self._get(i) for i in range(len(self)))
+    
+    def to_string(self) -> str:
+        """
+        Obtiene todas las celdas como string sin recorrerlas una por una
+        
+        Returns:
+            Contenido completo de la cinta
+        """
+        mapped = self.data[:self.length].decode('latin-1')
+        if self.written:
+            pieces = []
+            previous = 0
+            for offset in sorted(self.written):
+                pieces.append(mapped[previous:offset])
+                pieces.append(self.written[offset])
+                previous = offset + 1
+            pieces.append(mapped[previous:])
+            mapped = ''.join(pieces)
+        return ''.join(reversed(self.left)) + mapped + ''.join(self.right)
+
+
+class MappedTape(Tape):
+    """
+    Cinta cuya región inicial es un MappedInput
+    
+    Arranca de inmediato sin importar el tamaño del archivo; lectura,
+    escritura y movimientos usan la misma lógica de Tape sobre MappedCells.
+    """
+    
+    def __init__(self, source: MappedInput, blank_symbol: str = "B"):
+        """
+        Inicializa la cinta
+        
+        Args:
+            source: Entrada mapeada
+            blank_symbol: Símbolo en blanco
+        """
+        super().__init__("", blank_symbol)
+        self.source = source
+        self.tape = MappedCells(source, blank_symbol)
+    
+    def get_tape_content(self, start: Optional[int] = None, end: Optional[int] = None) -> str:
+        """
+        Obtiene el contenido de la cinta como string
+        
+        Args:
+            start: Posición inicial (opcional)
+            end: Posición final (opcional)
+        
+        Returns:
+            Contenido de la cinta como string
+        """
+        content = self.tape.to_string()
+        if start is None:
+            start = 0
+        if end is None:
+            end = len(content)
+        
+        # Mismo recorte que Tape.get_tape_content, con búsquedas en C
+        stripped = content.lstrip(self.blank_symbol)
+        first_non_blank = len(content) - len(stripped) if stripped else 0
+        last_non_blank = len(content.rstrip(self.blank_symbol)) - 1 if stripped else len(content) - 1
+        
+        start = min(start, first_non_blank, self.head_position)
+        end = max(end, last_non_blank + 1, self.head_position + 1)
+        return content[start:end]
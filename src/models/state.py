@@ -2,14 +2,19 @@
 Clase State para representar estados de una Máquina de Turing
 """
 
-from typing import Set
+import sys
 
 
 class State:
     """
     Representa un estado en una Máquina de Turing
+    
+    Es un registro inmutable con __slots__; el nombre se interna para que las
+    comparaciones entre estados sean por identidad en el caso común.
     """
     
+    __slots__ = ('name', 'is_accept')
+    
     def __init__(self, name: str, is_accept: bool = False):
         """
         Inicializa un estado
@@ -18,8 +23,17 @@ class State:
             name: Nombre del estado
             is_accept: Si es un estado de aceptación
         """
-        self.name = name
-        self.is_accept = is_accept
+        object.__setattr__(self, 'name', sys.intern(name))
+        object.__setattr__(self, 'is_accept', is_accept)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("State es inmutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("State es inmutable")
+    
+    def __reduce__(self):
+        return (State, (self.name, self.is_accept))
     
     def __str__(self) -> str:
         return self.name
@@ -35,4 +49,32 @@ class State:
         return False
     
     def __hash__(self) -> int:
-        return hash(self.name)
\ No newline at end of file
+        return hash(self.name)
+
+
+class StateRow:
+    """
+    Fila de la tabla de transiciones de un estado (MT de una cinta)
+    
+    Cada entrada de `symbols` apunta directamente a la fila del estado
+    siguiente, de modo que el simulador avanza de fila en fila con una sola
+    búsqueda por símbolo, sin construir claves (estado, símbolos).
+    """
+    
+    __slots__ = ('name', 'is_accept', 'symbols')
+    
+    def __init__(self, name: str, is_accept: bool = False):
+        """
+        Inicializa una fila vacía
+        
+        Args:
+            name: Nombre del estado
+            is_accept: Si es un estado de aceptación
+        """
+        self.name = sys.intern(name)
+        self.is_accept = is_accept
+        # símbolo leído -> (fila siguiente, símbolo escrito, movimiento, Transition)
+        self.symbols = {}
+    
+    def __repr__(self) -> str:
+        return f"StateRow('{self.name}', symbols={sorted(self.symbols)})"
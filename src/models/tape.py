@@ -2,7 +2,7 @@
 Clase Tape para representar la cinta de una Máquina de Turing
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class Tape:
@@ -22,6 +22,13 @@ class Tape:
         self.tape = list(input_string) if input_string else [blank_symbol]
         self.head_position = 0
         
+        # Celdas agregadas a la izquierda: la posición absoluta de una celda
+        # (0 = primer símbolo de la entrada) es su índice menos este valor
+        self.left_expansions = 0
+        
+        # Movimientos L o R del cabezal desde que se creó la cinta
+        self.head_moves = 0
+        
         # Asegurar que la cinta tenga al menos un símbolo
         if not self.tape:
             self.tape = [blank_symbol]
@@ -48,14 +55,17 @@ class Tape:
     
     def move_left(self) -> None:
         """Mueve el cabezal una posición a la izquierda"""
+        self.head_moves += 1
         self.head_position -= 1
         if self.head_position < 0:
             # Expandir la cinta hacia la izquierda
             self.tape.insert(0, self.blank_symbol)
             self.head_position = 0
+            self.left_expansions += 1
     
     def move_right(self) -> None:
         """Mueve el cabezal una posición a la derecha"""
+        self.head_moves += 1
         self.head_position += 1
         self._ensure_position_exists()
     
@@ -116,41 +126,96 @@ class Tape:
         
         return ''.join(self.tape[start:end])
     
-    def get_visual_representation(self, context: int = 5) -> str:
+    def write_content_into(self, buffer: memoryview) -> int:
+        """
+        Copia el contenido de la cinta (UTF-8) en un buffer preasignado
+        
+        Args:
+            buffer: Buffer de destino (p. ej. un espacio de memoria compartida)
+            
+        Returns:
+            Bytes escritos, o -1 si el contenido no cabe en el buffer
+        """
+        encoded = self.get_tape_content().encode('utf-8')
+        if len(encoded) > len(buffer):
+            return -1
+        buffer[:len(encoded)] = encoded
+        return len(encoded)
+    
+    def get_visual_representation(self, context: int = 5, full: bool = False) -> str:
         """
         Obtiene una representación visual de la cinta con el cabezal marcado
         
         Args:
             context: Número de posiciones a mostrar alrededor del cabezal
+            full: Si se amplía la ventana para cubrir todo el contenido no blanco
             
         Returns:
             Representación visual de la cinta
         """
+        return Tape.render_visual(self.tape, self.head_position, self.blank_symbol, context, full)
+    
+    @staticmethod
+    def render_visual(cells: Sequence[str], head_position: int, blank_symbol: str = "B",
+                      context: int = 5, full: bool = False, offset: int = 0,
+                      length: Optional[int] = None) -> str:
+        """
+        Dibuja una ventana de celdas con posiciones, símbolos y el cabezal
+        
+        Con full=False el costo es O(context) sin importar el tamaño de la
+        cinta; las celdas fuera de la ventana se indican con '…'.
+        
+        Args:
+            cells: Celdas de la cinta (lista o string)
+            head_position: Posición del cabezal
+            blank_symbol: Símbolo en blanco (para posiciones fuera de las celdas)
+            context: Número de posiciones a mostrar alrededor del cabezal
+            full: Si se amplía la ventana para cubrir todo el contenido no blanco
+            offset: Posición en la cinta de cells[0] cuando cells es solo una ventana
+            length: Largo de la cinta completa (None = len(cells))
+            
+        Returns:
+            Representación visual en tres líneas
+        """
         # Determinar rango a mostrar
-        start = max(0, self.head_position - context)
-        end = min(len(self.tape), self.head_position + context + 1)
+        start = max(0, head_position - context)
+        end = min(len(cells), head_position + context + 1)
         
-        # Asegurar que el rango incluya contenido relevante
-        first_non_blank = next((i for i, s in enumerate(self.tape) if s != self.blank_symbol), 0)
-        last_non_blank = next((i for i in range(len(self.tape) - 1, -1, -1) if self.tape[i] != self.blank_symbol), len(self.tape) - 1)
+        if full:
+            # Asegurar que el rango incluya contenido relevante
+            first_non_blank = next((i for i, s in enumerate(cells) if s != blank_symbol), 0)
+            last_non_blank = next((i for i in range(len(cells) - 1, -1, -1) if cells[i] != blank_symbol), len(cells) - 1)
+            
+            start = min(start, first_non_blank)
+            end = max(end, last_non_blank + 1)
         
-        start = min(start, first_non_blank)
-        end = max(end, last_non_blank + 1)
+        end = max(end, head_position + 1)
         
         # Crear representación
-        tape_section = self.tape[start:end]
-        head_pos_in_section = self.head_position - start
+        tape_section = [cells[i] if i < len(cells) else blank_symbol for i in range(start, end)]
+        head_pos_in_section = head_position - start
         
         # Línea superior con posiciones
-        positions = [str(i).center(3) for i in range(start, end)]
-        pos_line = '|'.join(positions)
+        positions = [str(offset + i).center(3) for i in range(start, end)]
         
         # Línea con símbolos
         symbols = [symbol.center(3) for symbol in tape_section]
-        symbol_line = '|'.join(symbols)
         
         # Línea con indicador del cabezal
         head_indicators = [' ^ ' if i == head_pos_in_section else '   ' for i in range(len(tape_section))]
+        
+        # Marcar las celdas omitidas a cada lado de la ventana
+        if offset + start > 0:
+            positions.insert(0, ' … ')
+            symbols.insert(0, ' … ')
+            head_indicators.insert(0, '   ')
+        if offset + end < (len(cells) if length is None else length):
+            positions.append(' … ')
+            symbols.append(' … ')
+            head_indicators.append('   ')
+        
+        pos_line = '|'.join(positions)
+        symbol_line = '|'.join(symbols)
         head_line = '|'.join(head_indicators)
         
         return f"{pos_line}\n{symbol_line}\n{head_line}"
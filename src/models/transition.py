@@ -2,17 +2,23 @@
 Clase Transition para representar transiciones de una Máquina de Turing
 """
 
-from typing import List, Tuple
+import sys
+from typing import List, Sequence, Tuple
 from .state import State
 
 
 class Transition:
     """
     Representa una transición en una Máquina de Turing
+    
+    Es un registro inmutable con __slots__: los estados y símbolos se internan
+    y el resultado de apply() se calcula una sola vez en la construcción.
     """
     
-    def __init__(self, from_state: str, read_symbols: List[str], 
-                 write_symbols: List[str], move: str, to_state: str):
+    __slots__ = ('from_state', 'read_symbols', 'write_symbols', 'move', 'to_state', '_result')
+    
+    def __init__(self, from_state: str, read_symbols: Sequence[str], 
+                 write_symbols: Sequence[str], move: str, to_state: str):
         """
         Inicializa una transición
         
@@ -23,15 +29,32 @@ class Transition:
             move: Dirección de movimiento ('L', 'R', 'S')
             to_state: Estado destino
         """
-        self.from_state = from_state
-        self.read_symbols = read_symbols
-        self.write_symbols = write_symbols
-        self.move = move
-        self.to_state = to_state
-        
         # Validar que read y write tengan la misma longitud
         if len(read_symbols) != len(write_symbols):
             raise ValueError("read_symbols y write_symbols deben tener la misma longitud")
+        
+        intern = sys.intern
+        write_symbols = tuple(intern(symbol) for symbol in write_symbols)
+        move = intern(move)
+        to_state = intern(to_state)
+        
+        setter = object.__setattr__
+        setter(self, 'from_state', intern(from_state))
+        setter(self, 'read_symbols', tuple(intern(symbol) for symbol in read_symbols))
+        setter(self, 'write_symbols', write_symbols)
+        setter(self, 'move', move)
+        setter(self, 'to_state', to_state)
+        setter(self, '_result', (to_state, write_symbols, move))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Transition es inmutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Transition es inmutable")
+    
+    def __reduce__(self):
+        return (Transition, (self.from_state, self.read_symbols, self.write_symbols,
+                             self.move, self.to_state))
     
     def matches(self, current_state: str, tape_symbols: List[str]) -> bool:
         """
@@ -48,14 +71,25 @@ class Transition:
                 len(tape_symbols) == len(self.read_symbols) and
                 all(tape_sym == read_sym for tape_sym, read_sym in zip(tape_symbols, self.read_symbols)))
     
-    def apply(self) -> Tuple[str, List[str], str]:
+    def apply(self) -> Tuple[str, Tuple[str, ...], str]:
         """
         Aplica la transición y retorna el nuevo estado, símbolos a escribir y movimiento
         
         Returns:
-            Tupla con (nuevo_estado, símbolos_a_escribir, movimiento)
+            Tupla precalculada con (nuevo_estado, símbolos_a_escribir, movimiento)
         """
-        return self.to_state, self.write_symbols, self.move
+        return self._result
+    
+    def _key(self) -> tuple:
+        return (self.from_state, self.read_symbols, self.write_symbols, self.move, self.to_state)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Transition):
+            return self._key() == other._key()
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self._key())
     
     def __str__(self) -> str:
         read_str = ','.join(self.read_symbols)
@@ -64,6 +98,6 @@ class Transition:
     
     def __repr__(self) -> str:
         return (f"Transition(from_state='{self.from_state}', "
-                f"read_symbols={self.read_symbols}, "
-                f"write_symbols={self.write_symbols}, "
-                f"move='{self.move}', to_state='{self.to_state}')")
\ No newline at end of file
+                f"read_symbols={list(self.read_symbols)}, "
+                f"write_symbols={list(self.write_symbols)}, "
+                f"move='{self.move}', to_state='{self.to_state}')")
@@ -2,10 +2,15 @@
 Clase TuringMachine para representar una Máquina de Turing completa
 """
 
-from typing import List, Dict, Optional
-from .state import State
+import hashlib
+import json
+import sys
+from typing import Iterable, List, Dict, Optional, Union
+from .state import State, StateRow
 from .transition import Transition
 from .tape import Tape
+from .mapped_tape import MappedInput
+from .budget import StepBudget
 from ..utils.exceptions import InvalidStateError, InvalidTransitionError
 
 
@@ -17,7 +22,7 @@ class TuringMachine:
     def __init__(self, states: List[str], input_alphabet: List[str], 
                  tape_alphabet: List[str], initial_state: str, 
                  accept_states: List[str], transitions: List[Dict],
-                 blank_symbol: str = "B"):
+                 blank_symbol: str = "B", budget: Optional[StepBudget] = None):
         """
         Inicializa una Máquina de Turing
         
@@ -29,13 +34,17 @@ class TuringMachine:
             accept_states: Lista de estados de aceptación
             transitions: Lista de transiciones en formato dict
             blank_symbol: Símbolo en blanco
+            budget: Presupuesto de ejecución declarado para la MT (opcional)
         """
-        self.states = {name: State(name, name in accept_states) for name in states}
-        self.input_alphabet = set(input_alphabet)
-        self.tape_alphabet = set(tape_alphabet)
-        self.initial_state = initial_state
-        self.accept_states = set(accept_states)
-        self.blank_symbol = blank_symbol
+        # Los nombres de estados y símbolos se internan para comparar por identidad
+        intern = sys.intern
+        self.states = {intern(name): State(name, name in accept_states) for name in states}
+        self.input_alphabet = {intern(symbol) for symbol in input_alphabet}
+        self.tape_alphabet = {intern(symbol) for symbol in tape_alphabet}
+        self.initial_state = intern(initial_state)
+        self.accept_states = {intern(name) for name in accept_states}
+        self.blank_symbol = intern(blank_symbol)
+        self.budget = budget
         
         # Validar que el estado inicial exista
         if initial_state not in self.states:
@@ -62,13 +71,91 @@ class TuringMachine:
         self._build_transition_index()
     
     def _build_transition_index(self) -> None:
-        """Construye un índice para búsqueda rápida de transiciones"""
+        """Construye un índice para búsqueda rápida de transiciones y las filas por estado"""
         self.transition_index = {}
         for transition in self.transitions:
-            key = (transition.from_state, tuple(transition.read_symbols))
+            key = (transition.from_state, transition.read_symbols)
             if key in self.transition_index:
                 raise InvalidTransitionError(f"Transición duplicada encontrada: {key}")
             self.transition_index[key] = transition
+        self._build_state_rows()
+    
+    def _build_state_rows(self) -> None:
+        """
+        Construye la tabla estado -> símbolo -> (fila siguiente, escritura, movimiento, transición)
+        
+        Las transiciones hacia estados no declarados o de varias cintas no
+        generan entrada; get_transition sigue cubriendo esos casos.
+        """
+        self.state_rows = {name: StateRow(name, state.is_accept) for name, state in self.states.items()}
+        for transition in self.transitions:
+            row = self.state_rows.get(transition.from_state)
+            next_row = self.state_rows.get(transition.to_state)
+            if row is None or next_row is None or len(transition.read_symbols) != 1:
+                continue
+            row.symbols[transition.read_symbols[0]] = (
+                next_row, transition.write_symbols[0], transition.move, transition)
+    
+    def with_transitions(self, transitions: List[Transition], removed: Iterable[Transition],
+                         added: Iterable[Transition]) -> 'TuringMachine':
+        """
+        Crea una nueva versión de la MT con otra lista de transiciones
+
+        El índice de transiciones se copia y se actualiza solo con las
+        transiciones quitadas y agregadas; estados y alfabetos se comparten.
+        La MT original no se modifica, así que las simulaciones que la usan
+        pueden terminar con ella.
+
+        Args:
+            transitions: Lista completa de transiciones de la nueva versión
+            removed: Transiciones de esta versión que ya no están
+            added: Transiciones nuevas (ya validadas)
+
+        Returns:
+            Nueva instancia de TuringMachine
+
+        Raises:
+            InvalidTransitionError: Si una transición agregada duplica otra
+        """
+        index = dict(self.transition_index)
+        for transition in removed:
+            key = (transition.from_state, transition.read_symbols)
+            if index.get(key) is transition:
+                del index[key]
+        for transition in added:
+            key = (transition.from_state, transition.read_symbols)
+            if key in index:
+                raise InvalidTransitionError(f"Transición duplicada encontrada: {key}")
+            index[key] = transition
+
+        machine = TuringMachine.__new__(TuringMachine)
+        machine.__dict__.update(self.__dict__)
+        machine.transitions = transitions
+        machine.transition_index = index
+        machine._build_state_rows()
+        return machine
+
+    def get_row(self, state: str) -> Optional[StateRow]:
+        """
+        Obtiene la fila de transiciones de un estado
+        
+        Args:
+            state: Nombre del estado
+            
+        Returns:
+            Instancia de StateRow o None si el estado no existe
+        """
+        return self.state_rows.get(state)
+    
+    def __getstate__(self) -> Dict:
+        # Las filas se referencian entre sí; se reconstruyen al deserializar
+        state = self.__dict__.copy()
+        del state['state_rows']
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._build_state_rows()
     
     def get_transition(self, current_state: str, tape_symbols: List[str]) -> Optional[Transition]:
         """
@@ -96,30 +183,89 @@ class TuringMachine:
         """
         return state in self.accept_states
     
-    def validate_input(self, input_string: str) -> bool:
+    def validate_input(self, input_string: Union[str, MappedInput]) -> bool:
         """
         Valida que una cadena de entrada use solo símbolos del alfabeto de entrada
         
         Args:
-            input_string: Cadena a validar
+            input_string: Cadena a validar o entrada mapeada desde archivo
             
         Returns:
             True si la cadena es válida
         """
+        if isinstance(input_string, MappedInput):
+            return not input_string.find_invalid_symbols(self.input_alphabet)
         return all(symbol in self.input_alphabet for symbol in input_string)
     
-    def create_tape(self, input_string: str) -> Tape:
+    def get_output(self, tape_content: str) -> str:
+        """
+        Extrae la salida de una MT alteradora a partir del contenido de la cinta
+        
+        Se conservan solo los símbolos del alfabeto de entrada (se descartan
+        blancos y marcadores).
+        
+        Args:
+            tape_content: Contenido final de la cinta
+            
+        Returns:
+            Cadena de salida
+        """
+        return ''.join(symbol for symbol in tape_content if symbol in self.input_alphabet)
+    
+    def create_tape(self, input_string: Union[str, MappedInput]) -> Tape:
         """
         Crea una cinta inicializada con la cadena de entrada
         
         Args:
-            input_string: Cadena inicial
+            input_string: Cadena inicial o entrada mapeada desde archivo
             
         Returns:
-            Cinta inicializada
+            Cinta inicializada (MappedTape para entradas mapeadas)
         """
+        if isinstance(input_string, MappedInput):
+            return input_string.create_tape(self.blank_symbol)
         return Tape(input_string, self.blank_symbol)
     
+    def to_dict(self) -> Dict:
+        """
+        Convierte la MT al formato de diccionario usado por los archivos YAML
+        
+        Returns:
+            Diccionario con la clave 'mt' y la definición completa
+        """
+        data = {
+            'mt': {
+                'states': list(self.states.keys()),
+                'input_alphabet': sorted(self.input_alphabet),
+                'tape_alphabet': sorted(self.tape_alphabet),
+                'initial_state': self.initial_state,
+                'accept_states': [name for name in self.states if name in self.accept_states],
+                'transitions': [
+                    {
+                        'state': transition.from_state,
+                        'read': list(transition.read_symbols),
+                        'write': list(transition.write_symbols),
+                        'move': transition.move,
+                        'next': transition.to_state
+                    }
+                    for transition in self.transitions
+                ]
+            }
+        }
+        if self.budget is not None:
+            data['mt']['budget'] = self.budget.to_dict()
+        return data
+    
+    def get_fingerprint(self) -> str:
+        """
+        Calcula una huella del contenido de la MT (independiente del orden de las claves)
+        
+        Returns:
+            Hash SHA-256 en hexadecimal
+        """
+        canonical = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
     def __str__(self) -> str:
         return (f"TuringMachine(\n"
                 f"  States: {list(self.states.keys())}\n"
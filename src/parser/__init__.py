@@ -6,5 +6,8 @@ que contienen la definición de Máquinas de Turing.
 """
 
 from .yaml_parser import YAMLParser
+from .corpus_reader import CorpusReader, CorpusEntry, read_corpus
+from .hot_reload import MachineReloader
+from .registry import MachineRegistry
 
-__all__ = ['YAMLParser']
\ No newline at end of file
+__all__ = ['YAMLParser', 'CorpusReader', 'CorpusEntry', 'read_corpus', 'MachineReloader', 'MachineRegistry']
\ No newline at end of file
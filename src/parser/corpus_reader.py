@@ -0,0 +1,230 @@
+"""
+Lector en streaming de archivos de cadenas de prueba
+"""
+
+import gzip
+import json
+import mmap
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, Union
+from ..utils.exceptions import CorpusError
+
+
+# Formatos de corpus y la extensión de la que se deducen
+FORMATS = ('text', 'tsv', 'jsonl')
+FORMAT_SUFFIXES = {'.tsv': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Valores aceptados en la columna de resultado esperado
+ACCEPT_TOKENS = {'acepta', 'aceptada', 'accept', 'accepted', 'si', 'sí', 'true', '1'}
+REJECT_TOKENS = {'rechaza', 'rechazada', 'reject', 'rejected', 'no', 'false', '0'}
+
+
+class CorpusEntry:
+    """
+    Representa una cadena de prueba con su resultado esperado (opcional)
+    """
+    
+    __slots__ = ('input_string', 'expected_accept', 'expected_output', 'line_number')
+    
+    def __init__(self, input_string: str, expected_accept: Optional[bool] = None,
+                 expected_output: Optional[str] = None, line_number: int = 0):
+        """
+        Inicializa una entrada del corpus
+        
+        Args:
+            input_string: Cadena de entrada
+            expected_accept: Si se espera que la cadena sea aceptada (None = sin expectativa)
+            expected_output: Salida esperada en la cinta (None = sin expectativa)
+            line_number: Línea del archivo de la que proviene
+        """
+        self.input_string = input_string
+        self.expected_accept = expected_accept
+        self.expected_output = expected_output
+        self.line_number = line_number
+    
+    def check(self, accepted: bool, output: Optional[str] = None) -> Optional[str]:
+        """
+        Compara un resultado de simulación con lo esperado
+        
+        Args:
+            accepted: Si la cadena fue aceptada
+            output: Salida obtenida en la cinta
+        
+        Returns:
+            Descripción de la discrepancia o None si coincide
+        """
+        if self.expected_accept is not None and accepted != self.expected_accept:
+            esperado = "ACEPTADA" if self.expected_accept else "RECHAZADA"
+            obtenido = "ACEPTADA" if accepted else "RECHAZADA"
+            return f"se esperaba {esperado} y fue {obtenido}"
+        if self.expected_output is not None and output != self.expected_output:
+            return f"se esperaba la salida '{self.expected_output}' y fue '{output}'"
+        return None
+    
+    def __repr__(self) -> str:
+        return (f"CorpusEntry('{self.input_string}', expected_accept={self.expected_accept}, "
+                f"expected_output={self.expected_output!r}, line_number={self.line_number})")
+
+
+class CorpusReader:
+    """
+    Itera sobre un archivo de cadenas de prueba sin cargarlo completo en memoria
+    
+    Formatos soportados (los archivos sin comprimir se mapean en memoria con
+    mmap y todos admiten compresión gzip con la extensión .gz):
+        - Texto plano: cada línea, sin espacios al inicio ni al final, es una
+          cadena de entrada.
+        - Separado por tabuladores (.tsv): cadena, resultado esperado y salida
+          esperada; las dos últimas columnas son opcionales.
+        - JSON por líneas (.jsonl / .ndjson): cada línea es una cadena JSON o
+          un objeto {"input": ..., "accept": ..., "output": ...}.
+    
+    En todos los formatos se ignoran las líneas vacías y las que empiezan con '#'.
+    Una línea inválida levanta CorpusError, salvo que se indique on_error: en
+    ese caso se le pasa el error y la lectura sigue con la línea siguiente.
+    """
+    
+    def __init__(self, file_path: Union[str, Path], format: Optional[str] = None,
+                 on_error: Optional[Callable[[CorpusError], None]] = None):
+        """
+        Inicializa el lector
+        
+        Args:
+            file_path: Ruta al archivo de cadenas
+            format: 'text', 'tsv' o 'jsonl'; si es None se deduce de la extensión
+            on_error: Función que recibe el error de cada línea inválida (None = levantarlo)
+        """
+        self.path = Path(file_path)
+        suffixes = [s.lower() for s in self.path.suffixes]
+        self.compressed = bool(suffixes) and suffixes[-1] == '.gz'
+        if self.compressed:
+            suffixes = suffixes[:-1]
+        
+        if format is None:
+            format = FORMAT_SUFFIXES.get(suffixes[-1], 'text') if suffixes else 'text'
+        if format not in FORMATS:
+            raise CorpusError(f"Formato de corpus inválido: {format}")
+        self.format = format
+        self.on_error = on_error
+    
+    def __iter__(self) -> Iterator[CorpusEntry]:
+        parse = {'text': self._parse_text_line, 'tsv': self._parse_tsv_line,
+                 'jsonl': self._parse_json_line}[self.format]
+        for line_number, raw_line in self._iter_lines():
+            try:
+                try:
+                    line = raw_line.decode('utf-8')
+                except UnicodeDecodeError as e:
+                    raise CorpusError(f"Línea {line_number} no es UTF-8 válido: {e}")
+                stripped = line.strip()
+                # Ignorar líneas vacías y comentarios
+                if not stripped or stripped.startswith('#'):
+                    continue
+                # En TSV la primera columna puede estar vacía (cadena vacía)
+                entry = parse(line.rstrip('\r\n') if self.format == 'tsv' else stripped, line_number)
+            except CorpusError as e:
+                if self.on_error is None:
+                    raise
+                self.on_error(e)
+                continue
+            yield entry
+    
+    def iter_strings(self) -> Iterator[str]:
+        """
+        Itera únicamente sobre las cadenas de entrada
+        
+        Returns:
+            Iterador de cadenas
+        """
+        for entry in self:
+            yield entry.input_string
+    
+    def _iter_lines(self) -> Iterator[Tuple[int, bytes]]:
+        """Itera sobre las líneas del archivo (sin decodificar) junto con su número"""
+        if not self.path.exists():
+            raise CorpusError(f"Archivo no encontrado: {self.path}")
+        
+        try:
+            if self.compressed:
+                with gzip.open(self.path, 'rb') as file:
+                    yield from enumerate(file, 1)
+                return
+            
+            with open(self.path, 'rb') as file:
+                # mmap no admite archivos vacíos
+                if self.path.stat().st_size == 0:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from enumerate(iter(mapped.readline, b''), 1)
+        except (OSError, EOFError) as e:
+            raise CorpusError(f"Error al leer {self.path}: {e}")
+    
+    @staticmethod
+    def _parse_expected_accept(token: str, line_number: int) -> Optional[bool]:
+        """Interpreta la columna de resultado esperado"""
+        token = token.lower()
+        if token == '-':
+            return None
+        if token in ACCEPT_TOKENS:
+            return True
+        if token in REJECT_TOKENS:
+            return False
+        raise CorpusError(f"Resultado esperado inválido '{token}' en línea {line_number}")
+    
+    @staticmethod
+    def _parse_text_line(line: str, line_number: int) -> CorpusEntry:
+        """Convierte una línea de texto plano en una entrada del corpus"""
+        return CorpusEntry(line, line_number=line_number)
+    
+    def _parse_tsv_line(self, line: str, line_number: int) -> CorpusEntry:
+        """Convierte una línea separada por tabuladores en una entrada del corpus"""
+        fields = [field.strip() for field in line.split('\t')]
+        if len(fields) > 3:
+            raise CorpusError(f"Demasiadas columnas en línea {line_number}")
+        expected_accept = None
+        expected_output = None
+        if len(fields) > 1 and fields[1]:
+            expected_accept = self._parse_expected_accept(fields[1], line_number)
+        if len(fields) > 2:
+            expected_output = fields[2]
+        return CorpusEntry(fields[0], expected_accept, expected_output, line_number)
+    
+    def _parse_json_line(self, line: str, line_number: int) -> CorpusEntry:
+        """Convierte una línea JSON en una entrada del corpus"""
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise CorpusError(f"JSON inválido en línea {line_number}: {e}")
+        
+        if isinstance(value, str):
+            return CorpusEntry(value, line_number=line_number)
+        if not isinstance(value, dict) or not isinstance(value.get('input'), str):
+            raise CorpusError(f"La línea {line_number} debe ser una cadena o un objeto con 'input'")
+        
+        expected_accept = value.get('accept')
+        if isinstance(expected_accept, str):
+            expected_accept = self._parse_expected_accept(expected_accept, line_number)
+        elif expected_accept is not None and not isinstance(expected_accept, bool):
+            raise CorpusError(f"'accept' en línea {line_number} debe ser booleano")
+        
+        expected_output = value.get('output')
+        if expected_output is not None and not isinstance(expected_output, str):
+            raise CorpusError(f"'output' en línea {line_number} debe ser una cadena")
+        
+        return CorpusEntry(value['input'], expected_accept, expected_output, line_number)
+
+
+def read_corpus(file_path: Union[str, Path], format: Optional[str] = None,
+                on_error: Optional[Callable[[CorpusError], None]] = None) -> Iterator[CorpusEntry]:
+    """
+    Atajo para iterar sobre un archivo de cadenas de prueba
+    
+    Args:
+        file_path: Ruta al archivo
+        format: Formato explícito ('text', 'tsv' o 'jsonl')
+        on_error: Función que recibe el error de cada línea inválida (None = levantarlo)
+    
+    Returns:
+        Iterador de CorpusEntry
+    """
+    return iter(CorpusReader(file_path, format, on_error))
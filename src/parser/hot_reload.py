@@ -0,0 +1,380 @@
+"""
+Recarga en caliente de una MT cuando cambia su archivo YAML
+
+El texto nuevo se compara con el anterior para ubicar la región modificada
+(prefijo y sufijo comunes, comparados en C). Si la región cae dentro de la
+lista de transiciones, solo se vuelven a parsear y validar los fragmentos
+de transición que la tocan; las demás transiciones se reutilizan y el índice
+se actualiza con las diferencias (TuringMachine.with_transitions). Si cambia
+la cabecera o la lista no está escrita en bloque, se usa la carga completa
+de YAMLParser.
+"""
+
+import gc
+import hashlib
+import os
+import re
+import threading
+import time
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+import yaml
+from ..models.turing_machine import TuringMachine
+from ..models.transition import Transition
+from ..utils.exceptions import MTException, YAMLParsingError
+from ..utils.validators import validate_transition_structure
+from .yaml_parser import YAMLParser
+
+
+# Clave 'transitions:' sin valor en la misma línea (lista en bloque)
+_TRANSITIONS_KEY = re.compile(r'(?m)^( *)transitions:[ \t]*(?:#.*)?\r?$')
+# Primer elemento de la lista
+_FIRST_ITEM = re.compile(r'(?m)^( *)- ')
+
+# Tamaño de los bloques al buscar el prefijo y el sufijo comunes
+_COMPARE_BLOCK = 1 << 16
+
+
+class TransitionLayout:
+    """
+    Ubicación de la lista de transiciones dentro del texto de un YAML de MT
+    
+    Cada fragmento es el texto de una transición sin el prefijo de sangría y
+    guion; los fragmentos están separados por salto de línea + prefijo.
+    """
+    
+    def __init__(self, key_start: int, key_indent: int, prefix: str, start: int, end: int):
+        """
+        Args:
+            key_start: Posición de la clave 'transitions:'
+            key_indent: Sangría de la clave
+            prefix: Sangría y guion de cada elemento
+            start: Posición del primer fragmento
+            end: Posición donde termina la lista
+        """
+        self.key_start = key_start
+        self.key_indent = key_indent
+        self.prefix = prefix
+        self.separator = '\n' + prefix
+        self.start = start
+        self.end = end
+        # Posición de cada fragmento en el texto
+        self.offsets: List[int] = []
+        indent = len(prefix) - 2
+        # Línea que termina la lista: contenido a menor sangría, o a la misma sin guion
+        if indent:
+            self.end_pattern: Pattern = re.compile(rf'\n(?: {{0,{indent}}}[^ #\r\n-]| {{0,{indent - 1}}}-)')
+        else:
+            self.end_pattern = re.compile(r'\n[^ #\r\n-]')
+    
+    def header(self, text: str) -> str:
+        """Texto sin las transiciones ('transitions: []')"""
+        return text[:self.key_start] + ' ' * self.key_indent + 'transitions: []\n' + text[self.end:]
+    
+    def piece_end(self, index: int) -> int:
+        """Fin del fragmento index (sin el separador siguiente)"""
+        if index + 1 < len(self.offsets):
+            return self.offsets[index + 1] - len(self.separator)
+        return self.end
+
+
+def split_transitions(text: str) -> Optional[Tuple[TransitionLayout, List[str]]]:
+    """
+    Separa el texto de un YAML de MT en la cabecera y un fragmento por transición
+    
+    Args:
+        text: Contenido del archivo
+    
+    Returns:
+        Tupla con (ubicación de la lista, fragmentos en orden), o None si la
+        lista de transiciones no está escrita como lista en bloque
+    """
+    key = _TRANSITIONS_KEY.search(text)
+    if key is None:
+        return None
+    key_indent = len(key.group(1))
+    after_key = key.end() + 1
+    
+    first = _FIRST_ITEM.search(text, after_key)
+    if first is None:
+        return None
+    indent = len(first.group(1))
+    # Antes del primer elemento solo puede haber comentarios y líneas vacías
+    if indent < key_indent or any(line.strip() and not line.lstrip().startswith('#')
+                                  for line in text[after_key:first.start()].splitlines()):
+        return None
+    
+    layout = TransitionLayout(key.start(), key_indent, ' ' * indent + '- ', first.end(), len(text))
+    end = layout.end_pattern.search(text, first.start())
+    if end is not None:
+        layout.end = end.start() + 1
+    
+    # str.split corta en C; el prefijo es igual en todos los fragmentos
+    items = text[layout.start:layout.end].split(layout.separator)
+    position = layout.start
+    for item in items:
+        layout.offsets.append(position)
+        position += len(item) + len(layout.separator)
+    return layout, items
+
+
+def common_affixes(old: str, new: str) -> Tuple[int, int]:
+    """
+    Longitudes del prefijo y del sufijo comunes de dos textos (sin solaparse)
+    
+    Se comparan bloques con == y la diferencia se ubica con búsqueda binaria
+    dentro del primer bloque distinto.
+    
+    Args:
+        old: Texto anterior
+        new: Texto nuevo
+    
+    Returns:
+        Tupla con (longitud del prefijo, longitud del sufijo)
+    """
+    def matching(equal: Callable[[int, int], bool], limit: int) -> int:
+        low = 0
+        while low < limit:
+            high = min(low + _COMPARE_BLOCK, limit)
+            if equal(low, high):
+                low = high
+                continue
+            while high - low > 1:
+                middle = (low + high) // 2
+                if equal(low, middle):
+                    low = middle
+                else:
+                    high = middle
+            return low
+        return limit
+    
+    old_length, new_length = len(old), len(new)
+    prefix = matching(lambda low, high: old[low:high] == new[low:high], min(old_length, new_length))
+    suffix = matching(lambda low, high: (old[old_length - high:old_length - low] ==
+                                         new[new_length - high:new_length - low]),
+                      min(old_length, new_length) - prefix)
+    return prefix, suffix
+
+
+def _parse_item(prefix: str, item: str) -> Dict:
+    """Parsea un fragmento con una sola transición"""
+    text = prefix + item
+    try:
+        data = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise YAMLParsingError(f"Error al parsear YAML: {e}")
+    if not isinstance(data, list) or len(data) != 1 or not isinstance(data[0], dict):
+        raise YAMLParsingError(f"Transición con formato inesperado: {text.strip()}")
+    return data[0]
+
+
+class MachineReloader:
+    """
+    Mantiene la versión vigente de una MT y la reemplaza cuando cambia su archivo
+    
+    El reemplazo es una sola asignación: los trabajos nuevos obtienen la
+    versión nueva con get() y los que ya tenían una referencia terminan con la
+    anterior, que no se modifica. Si la recarga falla, sigue vigente la versión
+    anterior y el error queda en last_error.
+    """
+    
+    def __init__(self, file_path: str, on_reload: Optional[Callable[[TuringMachine], None]] = None):
+        """
+        Carga la MT por primera vez
+        
+        Args:
+            file_path: Ruta al archivo YAML
+            on_reload: Función que recibe cada versión nueva
+        
+        Raises:
+            YAMLParsingError: Si la carga inicial falla
+        """
+        self.file_path = file_path
+        self.on_reload = on_reload
+        self.version = 0
+        self.last_error: Optional[MTException] = None
+        self.last_changes = 0
+        self.last_reload_time = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._text: Optional[str] = None
+        self._layout: Optional[TransitionLayout] = None
+        self._lookup: Optional[Dict] = None
+        self._machine: Optional[TuringMachine] = None
+        self.reload()
+        if self.last_error is not None:
+            raise self.last_error
+    
+    def get(self) -> TuringMachine:
+        """
+        Obtiene la versión vigente de la MT
+        
+        Returns:
+            Instancia de TuringMachine
+        """
+        return self._machine
+    
+    def poll(self) -> bool:
+        """
+        Recarga si el archivo cambió desde la última lectura
+        
+        Returns:
+            True si se instaló una versión nueva
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) == self._signature:
+            return False
+        return self.reload()
+    
+    def reload(self) -> bool:
+        """
+        Lee el archivo e instala la versión nueva si su contenido cambió
+        
+        Returns:
+            True si se instaló una versión nueva
+        """
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                stat = os.stat(self.file_path)
+                with open(self.file_path, 'rb') as file:
+                    content = file.read()
+            except OSError as e:
+                self.last_error = YAMLParsingError(f"Error al leer archivo: {e}")
+                return False
+            self._signature = (stat.st_mtime_ns, stat.st_size)
+            digest = hashlib.sha256(content).hexdigest()
+            if digest == self._digest:
+                return False
+            
+            # La reconstrucción crea decenas de miles de tuplas; una colección
+            # completa del heap en medio puede costar más que la recarga misma
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                text = content.decode('utf-8')
+                machine = self._build_incremental(text)
+                if machine is None:
+                    machine = self._build_full(text)
+            except MTException as e:
+                self.last_error = e
+                return False
+            except (UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+                self.last_error = YAMLParsingError(f"Error al crear la Máquina de Turing: {e}")
+                return False
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            
+            self._digest = digest
+            self._text = text
+            self._machine = machine
+            self.version += 1
+            self.last_error = None
+            self.last_reload_time = time.perf_counter() - started
+        if self.on_reload is not None:
+            self.on_reload(machine)
+        return True
+    
+    def _build_incremental(self, text: str) -> Optional[TuringMachine]:
+        """
+        Reconstruye solo las transiciones de la región modificada
+        
+        Returns:
+            Nueva versión, o None si el cambio requiere la carga completa
+        """
+        layout = self._layout
+        if layout is None or self._machine is None:
+            return None
+        old = self._text
+        prefix, suffix = common_affixes(old, text)
+        old_stop = len(old) - suffix
+        delta = len(text) - len(old)
+        if prefix < layout.start or old_stop > layout.end:
+            return None
+        
+        # Fragmentos que tocan la región, con uno de margen a cada lado
+        offsets = layout.offsets
+        first = max(bisect_right(offsets, prefix) - 2, 0)
+        last = min(bisect_right(offsets, old_stop), len(offsets) - 1)
+        region_start = offsets[first]
+        region = text[region_start:layout.piece_end(last) + delta]
+        if layout.end_pattern.search(region) is not None:
+            # El cambio termina la lista antes (p. ej. se agregó una clave)
+            return None
+        
+        old_transitions = self._machine.transitions
+        old_pieces = {old[offsets[index]:layout.piece_end(index)]: old_transitions[index]
+                      for index in range(first, last + 1)}
+        pieces = region.split(layout.separator)
+        transitions = []
+        added = []
+        for number, piece in enumerate(pieces, first):
+            transition = old_pieces.pop(piece, None)
+            if transition is None:
+                data = _parse_item(layout.prefix, piece)
+                validate_transition_structure(data, number, self._lookup)
+                transition = Transition(data['state'], data['read'], data['write'], data['move'], data['next'])
+                added.append(transition)
+            transitions.append(transition)
+        removed = list(old_pieces.values())
+        
+        machine = self._machine.with_transitions(
+            old_transitions[:first] + transitions + old_transitions[last + 1:], removed, added)
+        
+        new_offsets = []
+        position = region_start
+        for piece in pieces:
+            new_offsets.append(position)
+            position += len(piece) + len(layout.separator)
+        layout.offsets = offsets[:first] + new_offsets + [offset + delta for offset in offsets[last + 1:]]
+        layout.end += delta
+        self.last_changes = len(added) + len(removed)
+        return machine
+    
+    def _build_full(self, text: str) -> TuringMachine:
+        """Carga completa con YAMLParser; ubica los fragmentos para la siguiente recarga"""
+        machine = YAMLParser.parse_turing_machine(YAMLParser.load_from_string(text))
+        self.last_changes = len(machine.transitions)
+        self._layout = self._lookup = None
+        parts = split_transitions(text)
+        if parts is not None and len(parts[1]) == len(machine.transitions):
+            self._layout = parts[0]
+            mt_data = YAMLParser.load_from_string(self._layout.header(text))['mt']
+            # Los fragmentos se validan con conjuntos en lugar de listas
+            self._lookup = {'states': set(mt_data['states']), 'tape_alphabet': set(mt_data['tape_alphabet'])}
+        return machine
+    
+    def start(self, interval: float = 1.0) -> None:
+        """
+        Revisa el archivo periódicamente en un hilo en segundo plano
+        
+        Args:
+            interval: Segundos entre revisiones
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        
+        def watch() -> None:
+            while not self._stop.wait(interval):
+                self.poll()
+        
+        self._thread = threading.Thread(target=watch, name=f"reload-{self.file_path}", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Detiene la revisión periódica"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+    
+    def __repr__(self) -> str:
+        return f"MachineReloader('{self.file_path}', version={self.version})"
@@ -0,0 +1,313 @@
+"""
+Registro de MTs cargadas bajo demanda para servir muchas definiciones
+
+Cada MT se identifica por su ruta y el hash SHA-256 del contenido del
+archivo, así que una edición produce una entrada nueva y la anterior deja
+de entregarse. Las entradas se expulsan por antigüedad de uso (LRU) cuando
+se supera el número máximo de MTs o la memoria estimada, y varias
+solicitudes simultáneas de una MT que no está cargada esperan a una sola
+carga.
+"""
+
+import gc
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from types import FunctionType, ModuleType
+from typing import Dict, Iterable, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..utils.exceptions import YAMLParsingError
+from .yaml_parser import YAMLParser
+
+
+# Clave de una entrada: (ruta absoluta, hash del contenido)
+RegistryKey = Tuple[str, str]
+
+# Objetos que no pertenecen a una MT aunque sean alcanzables desde ella
+_SHARED_TYPES = (type, ModuleType, FunctionType)
+
+
+def estimate_machine_size(turing_machine: TuringMachine) -> int:
+    """
+    Estima la memoria ocupada por una MT recorriendo los objetos que alcanza
+    
+    Los objetos compartidos entre MTs (símbolos internados) se cuentan en
+    cada una, así que la estimación es una cota superior.
+    
+    Args:
+        turing_machine: MT a medir
+    
+    Returns:
+        Tamaño aproximado en bytes
+    """
+    seen = {id(turing_machine)}
+    pending = [turing_machine]
+    total = 0
+    while pending:
+        obj = pending.pop()
+        total += sys.getsizeof(obj)
+        for referent in gc.get_referents(obj):
+            if id(referent) not in seen and not isinstance(referent, _SHARED_TYPES):
+                seen.add(id(referent))
+                pending.append(referent)
+    return total
+
+
+class RegistryEntry:
+    """
+    MT cargada en el registro
+    """
+    
+    def __init__(self, key: RegistryKey, machine: TuringMachine, size: int, load_time: float):
+        """
+        Inicializa la entrada
+        
+        Args:
+            key: (ruta absoluta, hash del contenido)
+            machine: MT cargada
+            size: Memoria estimada en bytes
+            load_time: Segundos que tomó la carga
+        """
+        self.key = key
+        self.machine = machine
+        self.size = size
+        self.load_time = load_time
+        self.hits = 0
+    
+    @property
+    def path(self) -> str:
+        return self.key[0]
+    
+    @property
+    def digest(self) -> str:
+        return self.key[1]
+    
+    def __repr__(self) -> str:
+        return (f"RegistryEntry('{self.path}', {self.digest[:12]}, {self.size} bytes, "
+                f"{self.hits} aciertos)")
+
+
+class MachineRegistry:
+    """
+    Caché LRU de MTs indexada por ruta y contenido
+    
+    get() revisa la firma del archivo (mtime y tamaño) y solo vuelve a leerlo
+    y calcular su hash cuando cambió, de modo que un acierto no toca el
+    contenido del archivo. Las MTs entregadas no se modifican: las
+    simulaciones en curso conservan su referencia aunque la entrada se
+    expulse o el archivo cambie.
+    """
+    
+    def __init__(self, max_machines: int = 128, max_bytes: Optional[int] = None,
+                 prune: bool = False):
+        """
+        Inicializa el registro
+        
+        Args:
+            max_machines: Número máximo de MTs cargadas
+            max_bytes: Memoria estimada máxima (None = sin límite)
+            prune: Si se eliminan los estados inalcanzables al cargar
+        """
+        if max_machines < 1:
+            raise ValueError("El registro debe admitir al menos una MT")
+        self.max_machines = max_machines
+        self.max_bytes = max_bytes
+        self.prune = prune
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared_loads = 0
+        self.evictions = 0
+        self.load_time = 0.0
+        self._entries: 'OrderedDict[RegistryKey, RegistryEntry]' = OrderedDict()
+        # Ruta -> ((mtime_ns, tamaño), hash) de la última lectura
+        self._signatures: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        # Cargas en curso; quienes piden la misma clave esperan el resultado
+        self._loading: Dict[RegistryKey, Future] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, file_path: str) -> TuringMachine:
+        """
+        Obtiene la MT de un archivo, cargándola si no está en el registro
+        
+        Args:
+            file_path: Ruta al archivo YAML
+        
+        Returns:
+            Instancia de TuringMachine
+        
+        Raises:
+            YAMLParsingError: Si el archivo no se puede leer o la MT es inválida
+        """
+        path = os.path.abspath(file_path)
+        key, content = self._resolve(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self.hits += 1
+                return entry.machine
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+                self.misses += 1
+            else:
+                self.shared_loads += 1
+        
+        if not owner:
+            return future.result()
+        try:
+            if content is None:
+                content = self._read(path)
+            entry = self._load(key, content)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._loading[key]
+            self._store(entry)
+        future.set_result(entry.machine)
+        return entry.machine
+    
+    def preload(self, file_paths: Iterable[str]) -> None:
+        """
+        Carga varias MTs por adelantado para sacar el parseo del camino de las solicitudes
+        
+        Args:
+            file_paths: Rutas a los archivos YAML
+        """
+        for file_path in file_paths:
+            self.get(file_path)
+    
+    def invalidate(self, file_path: str) -> bool:
+        """
+        Quita del registro todas las versiones cargadas de un archivo
+        
+        Args:
+            file_path: Ruta al archivo YAML
+        
+        Returns:
+            True si había alguna versión cargada
+        """
+        path = os.path.abspath(file_path)
+        with self._lock:
+            self._signatures.pop(path, None)
+            keys = [key for key in self._entries if key[0] == path]
+            for key in keys:
+                self._remove(key)
+        return bool(keys)
+    
+    def clear(self) -> None:
+        """Vacía el registro (las estadísticas se conservan)"""
+        with self._lock:
+            self._entries.clear()
+            self._signatures.clear()
+            self.total_bytes = 0
+    
+    def entries(self) -> Tuple[RegistryEntry, ...]:
+        """Entradas desde la menos usada recientemente hasta la más reciente"""
+        with self._lock:
+            return tuple(self._entries.values())
+    
+    def _resolve(self, path: str) -> Tuple[RegistryKey, Optional[bytes]]:
+        """
+        Calcula la clave de un archivo leyéndolo solo si cambió su firma
+        
+        Returns:
+            Tupla con (clave, contenido leído o None si no hizo falta leerlo)
+        """
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise YAMLParsingError(f"Archivo no encontrado: {path} ({e})")
+        signature = (stat.st_mtime_ns, stat.st_size)
+        known = self._signatures.get(path)
+        if known is not None and known[0] == signature:
+            return (path, known[1]), None
+        content = self._read(path)
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._signatures[path] = (signature, digest)
+        return (path, digest), content
+    
+    @staticmethod
+    def _read(path: str) -> bytes:
+        try:
+            with open(path, 'rb') as file:
+                return file.read()
+        except OSError as e:
+            raise YAMLParsingError(f"Error al leer archivo: {e}")
+    
+    def _load(self, key: RegistryKey, content: bytes) -> RegistryEntry:
+        """
+        Parsea y valida una MT (fuera del candado del registro)
+        
+        Si el archivo cambió entre la firma y la lectura, la MT se guarda con
+        el hash de lo que realmente se parseó.
+        """
+        started = time.perf_counter()
+        digest = hashlib.sha256(content).hexdigest()
+        if digest != key[1]:
+            key = (key[0], digest)
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise YAMLParsingError(f"Error al leer archivo: {e}")
+        machine = YAMLParser.parse_turing_machine(YAMLParser.load_from_string(text), prune=self.prune)
+        size = estimate_machine_size(machine)
+        return RegistryEntry(key, machine, size, time.perf_counter() - started)
+    
+    def _store(self, entry: RegistryEntry) -> None:
+        """Guarda una entrada y expulsa las menos usadas (con el candado tomado)"""
+        # Las versiones anteriores del mismo archivo ya no se entregan
+        for key in [key for key in self._entries if key[0] == entry.path and key != entry.key]:
+            self._remove(key)
+        if entry.key in self._entries:
+            self._remove(entry.key)
+        self._entries[entry.key] = entry
+        self.total_bytes += entry.size
+        self.load_time += entry.load_time
+        # La entrada recién cargada se conserva aunque supere el límite sola
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_machines or
+                (self.max_bytes is not None and self.total_bytes > self.max_bytes)):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    def _remove(self, key: RegistryKey) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, file_path: str) -> bool:
+        path = os.path.abspath(file_path)
+        with self._lock:
+            return any(key[0] == path for key in self._entries)
+    
+    def get_stats(self) -> str:
+        """
+        Obtiene las estadísticas de uso del registro
+        
+        Returns:
+            String con aciertos, fallos, cargas compartidas y expulsiones
+        """
+        total = self.hits + self.misses + self.shared_loads
+        rate = (self.hits / total) * 100 if total else 0.0
+        return (f"Registro de MTs: {len(self)} cargadas ({self.total_bytes / 1024:.1f} KiB), "
+                f"{self.hits} aciertos, {self.misses} fallos ({rate:.1f}% aciertos), "
+                f"{self.shared_loads} cargas compartidas, {self.evictions} expulsiones, "
+                f"{self.load_time:.3f} s cargando")
+    
+    def __repr__(self) -> str:
+        return (f"MachineRegistry({len(self)}/{self.max_machines} MTs, "
+                f"{self.hits} aciertos, {self.misses} fallos)")
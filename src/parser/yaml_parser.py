@@ -6,6 +6,8 @@ import yaml
 from typing import Dict, Any, List
 from pathlib import Path
 from ..models.turing_machine import TuringMachine
+from ..models.budget import StepBudget
+from ..analysis.graph_analysis import prune_machine
 from ..utils.exceptions import YAMLParsingError
 from ..utils.validators import validate_yaml_structure
 
@@ -70,12 +72,13 @@ class YAMLParser:
             raise YAMLParsingError(f"Error al parsear YAML: {e}")
     
     @staticmethod
-    def parse_turing_machine(data: Dict[str, Any]) -> TuringMachine:
+    def parse_turing_machine(data: Dict[str, Any], prune: bool = False) -> TuringMachine:
         """
         Parsea los datos YAML y crea una instancia de TuringMachine
         
         Args:
             data: Diccionario con los datos del YAML
+            prune: Si se eliminan estados inalcanzables y transiciones de estados muertos
             
         Returns:
             Instancia de TuringMachine configurada
@@ -97,14 +100,50 @@ class YAMLParser:
                 initial_state=mt_data['initial_state'],
                 accept_states=mt_data['accept_states'],
                 transitions=mt_data['transitions'],
-                blank_symbol=YAMLParser._get_blank_symbol(mt_data['tape_alphabet'])
+                blank_symbol=YAMLParser._get_blank_symbol(mt_data['tape_alphabet']),
+                budget=StepBudget.from_dict(mt_data['budget']) if 'budget' in mt_data else None
             )
             
+            if prune:
+                turing_machine = prune_machine(turing_machine)
+            
             return turing_machine
             
         except Exception as e:
             raise YAMLParsingError(f"Error al crear la Máquina de Turing: {e}")
     
+    @staticmethod
+    def dump_turing_machine(turing_machine: TuringMachine) -> str:
+        """
+        Serializa una MT al formato YAML que acepta este parser
+        
+        Args:
+            turing_machine: La Máquina de Turing a serializar
+            
+        Returns:
+            String con el contenido YAML
+        """
+        return yaml.safe_dump(turing_machine.to_dict(), sort_keys=False,
+                              allow_unicode=True, default_flow_style=None)
+    
+    @staticmethod
+    def save_to_file(turing_machine: TuringMachine, file_path: str) -> None:
+        """
+        Guarda una MT en un archivo YAML
+        
+        Args:
+            turing_machine: La Máquina de Turing a guardar
+            file_path: Ruta del archivo destino
+            
+        Raises:
+            YAMLParsingError: Si no se puede escribir el archivo
+        """
+        try:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(YAMLParser.dump_turing_machine(turing_machine))
+        except OSError as e:
+            raise YAMLParsingError(f"Error al escribir archivo: {e}")
+    
     @staticmethod
     def get_test_inputs(data: Dict[str, Any]) -> List[str]:
         """
@@ -7,5 +7,20 @@ la ejecución de Máquinas de Turing y generar descripciones instantáneas.
 
 from .mt_simulator import MTSimulator
 from .instantaneous_description import InstantaneousDescription
+from .simulation_result import SimulationResult, HaltReason
+from .trace_printer import TracePrinter
+from .segmented_engine import SegmentedSimulator
+from .macro_engine import MacroSimulator, BlockCache
+from .snapshot import SimulationSnapshot, Checkpointer
+from .pipeline import Pipeline, PipelineStage, PipelineResult
+from .trace_index import TraceIndex
+from .breakpoints import Breakpoint, Watchpoint
+from .config_search import ConfigurationSearch, SearchResult
+from .batch_results import BatchResults
 
-__all__ = ['MTSimulator', 'InstantaneousDescription']
\ No newline at end of file
+__all__ = ['MTSimulator', 'InstantaneousDescription', 'SimulationResult', 'HaltReason',
+           'TracePrinter', 'SegmentedSimulator', 'MacroSimulator', 'BlockCache',
+           'SimulationSnapshot', 'Checkpointer',
+           'Pipeline', 'PipelineStage', 'PipelineResult', 'TraceIndex',
+           'Breakpoint', 'Watchpoint', 'ConfigurationSearch', 'SearchResult',
+           'BatchResults']
\ No newline at end of file
@@ -0,0 +1,296 @@
+"""
+Resultados de un lote de simulaciones guardados por columnas
+"""
+
+import csv
+from array import array
+from typing import Any, Dict, IO, Iterator, List, Optional, Union
+from ..models.tape import Tape
+from ..models.turing_machine import TuringMachine
+from ..models.budget import StepBudget
+from ..utils.exceptions import MTException
+from .simulation_result import SimulationResult, HaltReason
+
+
+# Código numérico de cada motivo de parada (posición en la enumeración)
+HALT_REASONS: List[HaltReason] = list(HaltReason)
+HALT_REASON_CODES: Dict[HaltReason, int] = {reason: code for code, reason in enumerate(HALT_REASONS)}
+
+# Columnas exportadas a CSV
+CSV_FIELDS = ['index', 'input', 'accepted', 'halt_reason', 'steps', 'final_state',
+              'head_position', 'tape']
+
+
+class BatchResults:
+    """
+    Resultados de muchas cadenas en columnas compactas
+    
+    - accepted, steps, halt_reasons, final_states, head_positions: un
+      elemento por cadena (array)
+    - entradas y cintas finales: un buffer UTF-8 compartido cada una, con
+      desplazamientos de inicio (la cadena i ocupa offsets[i]:offsets[i + 1])
+    
+    Los mensajes no se guardan: message(i) los arma con los mismos textos
+    que MTSimulator.run a partir de las columnas (solo los errores, que son
+    excepcionales, guardan su texto).
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, max_steps: int,
+                 budget: StepBudget, keep_tapes: bool = True):
+        """
+        Inicializa un lote vacío
+        
+        Args:
+            turing_machine: MT simulada
+            max_steps: Límite de pasos del simulador (para los mensajes)
+            budget: Presupuesto efectivo del simulador (para los mensajes)
+            keep_tapes: Si se guardan las cintas finales
+        """
+        self.turing_machine = turing_machine
+        self.max_steps = max_steps
+        self.budget = budget
+        self.keep_tapes = keep_tapes
+        self.state_names: List[str] = list(turing_machine.states)
+        self._state_codes = {name: code for code, name in enumerate(self.state_names)}
+        self.symbols: List[str] = sorted(turing_machine.tape_alphabet | {turing_machine.blank_symbol})
+        self._symbol_codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        
+        self.accepted = array('b')
+        self.steps = array('q')
+        self.halt_reasons = array('B')
+        # Estado final y símbolo bajo el cabezal (-1 si la entrada era inválida)
+        self.final_states = array('i')
+        self.final_symbols = array('i')
+        self.head_positions = array('q')
+        self.input_offsets = array('q', [0])
+        self.input_buffer = bytearray()
+        self.tape_offsets = array('q', [0])
+        self.tape_buffer = bytearray()
+        # Índice -> mensaje de las simulaciones terminadas por error
+        self._errors: Dict[int, str] = {}
+    
+    def append(self, result: SimulationResult) -> None:
+        """
+        Agrega el resultado de una simulación
+        
+        Args:
+            result: Resultado de MTSimulator.run
+        """
+        self.accepted.append(result.accepted)
+        self.steps.append(result.steps)
+        self.halt_reasons.append(HALT_REASON_CODES[result.halt_reason])
+        self.final_states.append(self._state_codes.get(result.final_state, -1))
+        self.head_positions.append(result.head_position)
+        if result.halt_reason is HaltReason.ERROR:
+            self._errors[len(self.accepted) - 1] = result.message
+        
+        self.input_buffer += str(result.input_string).encode('utf-8')
+        self.input_offsets.append(len(self.input_buffer))
+        tape = result.tape
+        if tape is None:
+            self.final_symbols.append(-1)
+        else:
+            head = tape.head_position
+            symbol = tape.tape[head] if 0 <= head < len(tape.tape) else tape.blank_symbol
+            self.final_symbols.append(self._symbol_codes.get(symbol, -1))
+            if self.keep_tapes:
+                self.tape_buffer += tape.get_tape_content().encode('utf-8')
+        self.tape_offsets.append(len(self.tape_buffer))
+    
+    def __len__(self) -> int:
+        return len(self.accepted)
+    
+    def input_string(self, index: int) -> str:
+        """Cadena de entrada número index"""
+        return self.input_buffer[self.input_offsets[index]:self.input_offsets[index + 1]].decode('utf-8')
+    
+    def tape_content(self, index: int) -> str:
+        """Contenido final de la cinta número index ('' si no se guardó)"""
+        return self.tape_buffer[self.tape_offsets[index]:self.tape_offsets[index + 1]].decode('utf-8')
+    
+    def halt_reason(self, index: int) -> HaltReason:
+        """Motivo de parada de la cadena número index"""
+        return HALT_REASONS[self.halt_reasons[index]]
+    
+    def final_state(self, index: int) -> Optional[str]:
+        """Estado final de la cadena número index (None si la entrada era inválida)"""
+        code = self.final_states[index]
+        return self.state_names[code] if code >= 0 else None
+    
+    def message(self, index: int) -> str:
+        """
+        Arma el mensaje de resultado de una cadena
+        
+        Args:
+            index: Posición de la cadena en el lote
+        
+        Returns:
+            El mismo mensaje que SimulationResult.message
+        """
+        reason = self.halt_reason(index)
+        step = self.steps[index]
+        state = self.final_state(index)
+        budget = self.budget
+        if reason is HaltReason.ACCEPTED:
+            return f"Cadena ACEPTADA en {step} pasos"
+        if reason is HaltReason.DEAD_STATE:
+            return (f"Cadena RECHAZADA: el estado '{state}' no puede alcanzar un estado de "
+                    f"aceptación (paso {step})")
+        if reason is HaltReason.NO_TRANSITION:
+            symbol = self.symbols[self.final_symbols[index]]
+            return (f"Cadena RECHAZADA: No hay transición desde estado '{state}' leyendo "
+                    f"'{symbol}' en paso {step}")
+        if reason is HaltReason.INVALID_INPUT:
+            input_string = self.input_string(index)
+            invalid_symbols = [s for s in input_string if s not in self.turing_machine.input_alphabet]
+            return f"Cadena rechazada: contiene símbolos inválidos {invalid_symbols}"
+        if reason in (HaltReason.MAX_STEPS, HaltReason.STEP_BUDGET):
+            # Importado aquí: mt_simulator importa este módulo
+            from .mt_simulator import resolve_step_limit
+            return resolve_step_limit(budget, len(self.input_string(index)), self.max_steps)[2]
+        if reason is HaltReason.TAPE_LIMIT:
+            return (f"Simulación detenida: la cinta creció más de {budget.max_tape_growth} celdas "
+                    f"en paso {step}")
+        if reason is HaltReason.TIME_LIMIT:
+            return f"Simulación detenida: se superó el límite de {budget.time_limit} s en paso {step}"
+        return self._errors.get(index, "")
+    
+    def result(self, index: int) -> SimulationResult:
+        """
+        Reconstruye el SimulationResult de una cadena (sin IDs)
+        
+        Args:
+            index: Posición de la cadena en el lote
+        
+        Returns:
+            Instancia de SimulationResult; sin cinta (tape=None) si la entrada
+            era inválida o el lote no guardó las cintas
+        """
+        tape = None
+        if self.keep_tapes and self.final_states[index] >= 0:
+            tape = Tape("", self.turing_machine.blank_symbol)
+            tape.tape = list(self.tape_content(index))
+            tape.head_position = self.head_positions[index]
+        return SimulationResult(self.input_string(index), bool(self.accepted[index]),
+                                self.halt_reason(index), self.steps[index], self.message(index),
+                                self.final_state(index), tape)
+    
+    def __getitem__(self, index: int) -> SimulationResult:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice fuera del lote")
+        return self.result(index)
+    
+    def accepted_count(self) -> int:
+        """Número de cadenas aceptadas"""
+        return sum(self.accepted)
+    
+    def count_by_reason(self) -> Dict[HaltReason, int]:
+        """
+        Cuenta las cadenas por motivo de parada
+        
+        Returns:
+            Diccionario motivo -> número de cadenas (solo motivos presentes)
+        """
+        counts = [0] * len(HALT_REASONS)
+        for code in self.halt_reasons:
+            counts[code] += 1
+        return {reason: count for reason, count in zip(HALT_REASONS, counts) if count}
+    
+    def records(self, messages: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre el lote como registros (diccionarios), construidos al vuelo
+        
+        Args:
+            messages: Si se incluye el mensaje de cada cadena
+        
+        Returns:
+            Iterador de registros con las columnas de CSV_FIELDS
+        """
+        for index in range(len(self)):
+            record = {
+                'index': index,
+                'input': self.input_string(index),
+                'accepted': bool(self.accepted[index]),
+                'halt_reason': HALT_REASONS[self.halt_reasons[index]].value,
+                'steps': self.steps[index],
+                'final_state': self.final_state(index),
+                'head_position': self.head_positions[index],
+                'tape': self.tape_content(index),
+            }
+            if messages:
+                record['message'] = self.message(index)
+            yield record
+    
+    def to_csv(self, destination: Union[str, IO[str]], messages: bool = False) -> int:
+        """
+        Escribe el lote en CSV
+        
+        Args:
+            destination: Ruta del archivo o flujo de texto
+            messages: Si se agrega la columna con el mensaje de cada cadena
+        
+        Returns:
+            Número de filas escritas
+        """
+        fields = CSV_FIELDS + ['message'] if messages else CSV_FIELDS
+        if isinstance(destination, str):
+            with open(destination, 'w', encoding='utf-8', newline='') as stream:
+                return self.to_csv(stream, messages)
+        writer = csv.DictWriter(destination, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+        written = 0
+        for record in self.records(messages):
+            writer.writerow(record)
+            written += 1
+        return written
+    
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Convierte las columnas a arreglos de NumPy sin copiar los datos
+        
+        Requiere numpy, que es opcional. Los motivos de parada son códigos de
+        HALT_REASONS y las cintas se obtienen de tape_buffer con tape_offsets.
+        Mientras existan los arreglos, el lote no admite más resultados.
+        
+        Returns:
+            Diccionario nombre -> arreglo
+        
+        Raises:
+            MTException: Si numpy no está instalado
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise MTException("Se requiere numpy para exportar a arreglos (pip install numpy)")
+        
+        return {
+            'accepted': numpy.frombuffer(self.accepted, dtype=numpy.int8).view(numpy.bool_),
+            'steps': numpy.frombuffer(self.steps, dtype=numpy.int64),
+            'halt_reason': numpy.frombuffer(self.halt_reasons, dtype=numpy.uint8),
+            'final_state': numpy.frombuffer(self.final_states, dtype=numpy.int32),
+            'head_position': numpy.frombuffer(self.head_positions, dtype=numpy.int64),
+            'input_offsets': numpy.frombuffer(self.input_offsets, dtype=numpy.int64),
+            'input_buffer': numpy.frombuffer(self.input_buffer, dtype=numpy.uint8),
+            'tape_offsets': numpy.frombuffer(self.tape_offsets, dtype=numpy.int64),
+            'tape_buffer': numpy.frombuffer(self.tape_buffer, dtype=numpy.uint8),
+        }
+    
+    def get_summary(self) -> str:
+        """
+        Genera un resumen del lote
+        
+        Returns:
+            Resumen como string
+        """
+        total = len(self)
+        accepted = self.accepted_count()
+        lines = [f"Cadenas: {total}, aceptadas: {accepted}, rechazadas o detenidas: {total - accepted}",
+                 f"Pasos totales: {sum(self.steps)}"]
+        for reason, count in self.count_by_reason().items():
+            lines.append(f"  {reason.value}: {count}")
+        return "\n".join(lines)
+    
+    def __repr__(self) -> str:
+        return f"BatchResults({len(self)} cadenas, {self.accepted_count()} aceptadas)"
@@ -0,0 +1,301 @@
+"""
+Ejecución por lotes (sin interacción) de una Máquina de Turing
+"""
+
+import csv
+import json
+import multiprocessing
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..parser.yaml_parser import YAMLParser
+from .mt_simulator import MTSimulator
+from . import shared_arena
+from .shared_arena import SharedArena
+from ..analysis.coverage import CoverageMap
+from ..utils.exceptions import SimulationError
+
+
+TRACE_LEVELS = ('none', 'summary', 'full')
+OUTPUT_FORMATS = ('jsonl', 'csv')
+
+# Columnas de cada registro según el nivel de traza
+RECORD_FIELDS = {
+    'none': ['index', 'input', 'accepted', 'halt_reason', 'steps', 'mismatch'],
+    'summary': ['index', 'input', 'accepted', 'halt_reason', 'steps', 'mismatch',
+                'final_state', 'head_position', 'tape', 'output', 'message'],
+}
+RECORD_FIELDS['full'] = RECORD_FIELDS['summary'] + ['trace']
+
+# Simulador de cada proceso trabajador (se crea una vez por proceso)
+_worker_simulator: Optional[MTSimulator] = None
+# Numeración de la cobertura en el proceso trabajador (None si no se mide)
+_worker_coverage: Optional[CoverageMap] = None
+
+
+def _init_worker(yaml_path: str, max_steps: int, coverage: bool = False) -> None:
+    """Carga la MT en el proceso trabajador"""
+    global _worker_simulator, _worker_coverage
+    turing_machine = YAMLParser.parse_turing_machine(YAMLParser.load_from_file(yaml_path))
+    _worker_simulator = MTSimulator(turing_machine, max_steps)
+    _worker_coverage = CoverageMap(turing_machine) if coverage else None
+
+
+def _worker_run(job: Tuple[int, str, Optional[bool], Optional[str], str]) -> Dict[str, Any]:
+    """Simula una cadena dentro de un proceso trabajador"""
+    return simulate_record(_worker_simulator, *job, coverage=_worker_coverage)
+
+
+def _worker_run_shared(job: Tuple) -> Dict[str, Any]:
+    """
+    Simula una cadena leyendo la entrada y escribiendo la cinta en memoria
+    compartida; solo el registro resumido vuelve al proceso principal
+    """
+    (index, arena_name, input_capacity, slot_size, offset, length, slot,
+     expected_accept, expected_output, trace_level) = job
+    view = shared_arena.attach(arena_name, input_capacity, slot_size)
+    input_string = view.read_input(offset, length)
+    with view.slot(slot) as tape_slot:
+        record = simulate_record(_worker_simulator, index, input_string, expected_accept,
+                                 expected_output, trace_level, tape_slot, _worker_coverage)
+    # La cadena de entrada ya está en el proceso principal
+    record['input'] = None
+    record['slot'] = slot
+    return record
+
+
+def simulate_record(simulator: MTSimulator, index: int, input_string: str,
+                    expected_accept: Optional[bool], expected_output: Optional[str],
+                    trace_level: str, tape_slot: Optional[memoryview] = None,
+                    coverage: Optional[CoverageMap] = None) -> Dict[str, Any]:
+    """
+    Simula una cadena y construye el registro de salida
+    
+    Args:
+        simulator: Simulador a utilizar
+        index: Posición de la cadena en el corpus
+        input_string: Cadena de entrada
+        expected_accept: Resultado esperado (opcional)
+        expected_output: Salida esperada (opcional)
+        trace_level: 'none', 'summary' o 'full'
+        tape_slot: Espacio de memoria compartida para la cinta final; si la
+                   cinta cabe, el registro lleva 'tape_length' en lugar de
+                   'tape' y 'output' (el proceso principal los reconstruye)
+        coverage: Numeración de la cobertura; si se indica, el registro lleva
+                  además 'coverage' con los mapas de bits de la ejecución
+        
+    Returns:
+        Diccionario con los campos de RECORD_FIELDS[trace_level]
+    """
+    pairs = set() if coverage is not None else None
+    result = simulator.run(input_string, record_trace=(trace_level == 'full'), coverage=pairs)
+    
+    tape_length = -1
+    if tape_slot is not None and trace_level != 'none' and result.tape is not None:
+        tape_length = result.tape.write_content_into(tape_slot)
+    
+    output = None
+    if tape_length < 0 or expected_output is not None:
+        output = simulator.turing_machine.get_output(result.tape_content)
+    
+    mismatch = None
+    if expected_accept is not None and expected_accept != result.accepted:
+        mismatch = 'accepted'
+    elif expected_output is not None and expected_output != output:
+        mismatch = 'output'
+    
+    record = {
+        'index': index,
+        'input': input_string,
+        'accepted': result.accepted,
+        'halt_reason': result.halt_reason.value,
+        'steps': result.steps,
+        'mismatch': mismatch,
+    }
+    if trace_level != 'none':
+        record['final_state'] = result.final_state
+        record['head_position'] = result.head_position
+        if tape_length < 0:
+            record['tape'] = result.tape_content
+            record['output'] = output
+        else:
+            record['tape_length'] = tape_length
+        record['message'] = result.message
+    if trace_level == 'full':
+        record['trace'] = [str(id_desc) for id_desc in result.ids]
+    if coverage is not None:
+        record['coverage'] = coverage.encode(pairs)
+    return record
+
+
+class BatchRunner:
+    """
+    Ejecuta un corpus de cadenas sobre una MT, opcionalmente en varios procesos
+    """
+    
+    def __init__(self, yaml_path: str, max_steps: int = 10000, workers: int = 1,
+                 trace_level: str = 'summary', shared_memory: bool = True,
+                 tape_slot_size: int = 4096, window_size: int = 4096, coverage: bool = False):
+        """
+        Inicializa el ejecutor por lotes
+        
+        Args:
+            yaml_path: Ruta al archivo YAML de la MT
+            max_steps: Número máximo de pasos por cadena
+            workers: Número de procesos trabajadores (1 = mismo proceso)
+            trace_level: 'none', 'summary' o 'full'
+            shared_memory: Si con varios trabajadores las entradas y cintas
+                           finales viajan por memoria compartida en lugar de
+                           serializarse en cada trabajo
+            tape_slot_size: Bytes reservados por cinta final; las cintas más
+                            largas se envían serializadas como antes
+            window_size: Cadenas que se escriben juntas en memoria compartida
+            coverage: Si se mide la cobertura de transiciones y pares
+                      (estado, símbolo); se acumula en self.coverage
+        """
+        if trace_level not in TRACE_LEVELS:
+            raise SimulationError(f"Nivel de traza inválido: {trace_level}")
+        if workers < 1:
+            raise SimulationError("El número de trabajadores debe ser al menos 1")
+        
+        self.yaml_path = yaml_path
+        self.max_steps = max_steps
+        self.workers = workers
+        self.trace_level = trace_level
+        self.shared_memory = shared_memory
+        self.tape_slot_size = tape_slot_size
+        self.window_size = window_size
+        
+        # Se carga aquí también para reportar errores del YAML antes de lanzar procesos
+        self.turing_machine: TuringMachine = YAMLParser.parse_turing_machine(
+            YAMLParser.load_from_file(yaml_path))
+        self.coverage: Optional[CoverageMap] = CoverageMap(self.turing_machine) if coverage else None
+    
+    def run(self, entries: Iterable, ordered: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Simula las entradas y produce los registros a medida que terminan
+        
+        Args:
+            entries: Iterable de CorpusEntry
+            ordered: Si los registros deben salir en el orden del corpus
+            
+        Returns:
+            Iterador de registros (diccionarios)
+        """
+        for record in self._simulate(entries, ordered):
+            if self.coverage is not None:
+                self.coverage.add(record['input'], *record.pop('coverage'))
+            yield record
+    
+    def _simulate(self, entries: Iterable, ordered: bool) -> Iterator[Dict[str, Any]]:
+        """Produce los registros en este proceso o en el Pool de trabajadores"""
+        jobs = ((index, entry.input_string, entry.expected_accept, entry.expected_output,
+                 self.trace_level)
+                for index, entry in enumerate(entries))
+        
+        if self.workers == 1:
+            simulator = MTSimulator(self.turing_machine, self.max_steps)
+            for job in jobs:
+                yield simulate_record(simulator, *job, coverage=self.coverage)
+            return
+        
+        if self.shared_memory:
+            yield from self._run_shared(entries, ordered)
+            return
+        
+        with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                  initargs=(self.yaml_path, self.max_steps, self.coverage is not None)) as pool:
+            mapper = pool.imap if ordered else pool.imap_unordered
+            yield from mapper(_worker_run, jobs, chunksize=64)
+    
+    def _run_shared(self, entries: Iterable, ordered: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Ejecuta por ventanas: las entradas de cada ventana se escriben una vez
+        en un SharedArena y los trabajadores dejan la cinta final en el
+        espacio de su trabajo
+        """
+        fields = RECORD_FIELDS[self.trace_level]
+        if self.coverage is not None:
+            fields = fields + ['coverage']
+        numbered = enumerate(entries)
+        window: List = list(islice(numbered, self.window_size))
+        if not window:
+            return
+        
+        # El primer espacio se crea antes que el Pool para que los trabajadores
+        # hereden el resource_tracker del proceso principal
+        encoded = [entry.input_string.encode('utf-8') for _, entry in window]
+        arena = SharedArena(2 * sum(len(data) for data in encoded), self.window_size,
+                            self.tape_slot_size)
+        try:
+            with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                      initargs=(self.yaml_path, self.max_steps,
+                                                self.coverage is not None)) as pool:
+                mapper = pool.imap if ordered else pool.imap_unordered
+                while window:
+                    input_bytes = sum(len(data) for data in encoded)
+                    if not arena.fits(input_bytes, len(window)):
+                        # Se crea con holgura para reutilizarlo en las siguientes ventanas
+                        capacity = max(2 * input_bytes, arena.input_capacity)
+                        arena.close()
+                        arena = SharedArena(capacity, self.window_size, self.tape_slot_size)
+                    
+                    locations = arena.pack_inputs(encoded)
+                    jobs = [(index, arena.name, arena.input_capacity, arena.slot_size, offset, length,
+                             slot, entry.expected_accept, entry.expected_output, self.trace_level)
+                            for slot, ((index, entry), (offset, length)) in enumerate(zip(window, locations))]
+                    
+                    for record in mapper(_worker_run_shared, jobs, chunksize=64):
+                        slot = record['slot']
+                        record['input'] = window[slot][1].input_string
+                        if 'tape_length' in record:
+                            tape = arena.read_tape(slot, record['tape_length'])
+                            record['tape'] = tape
+                            record['output'] = self.turing_machine.get_output(tape)
+                        yield {field: record[field] for field in fields}
+                    
+                    window = list(islice(numbered, self.window_size))
+                    encoded = [entry.input_string.encode('utf-8') for _, entry in window]
+        finally:
+            arena.close()
+
+
+def write_records(records: Iterable[Dict[str, Any]], stream: IO[str], output_format: str,
+                  trace_level: str) -> Tuple[int, int]:
+    """
+    Escribe registros en formato JSON Lines o CSV, vaciando el buffer por registro
+    
+    Args:
+        records: Registros producidos por BatchRunner.run
+        stream: Flujo de salida (p. ej. sys.stdout)
+        output_format: 'jsonl' o 'csv'
+        trace_level: Nivel de traza de los registros
+        
+    Returns:
+        Tupla con (registros_escritos, discrepancias)
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise SimulationError(f"Formato de salida inválido: {output_format}")
+    
+    fields = RECORD_FIELDS[trace_level]
+    writer = None
+    if output_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+    
+    written = 0
+    mismatches = 0
+    for record in records:
+        if output_format == 'csv':
+            row = dict(record)
+            if 'trace' in row:
+                row['trace'] = ' '.join(row['trace'])
+            writer.writerow(row)
+        else:
+            stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        stream.flush()
+        
+        written += 1
+        if record['mismatch'] is not None:
+            mismatches += 1
+    return written, mismatches
@@ -0,0 +1,140 @@
+"""
+Puntos de interrupción y de observación para la simulación paso a paso
+"""
+
+from typing import Dict, Iterable, List, Optional, Union
+
+
+class Breakpoint:
+    """
+    Detiene la simulación antes de ejecutar un paso en el que se cumplen
+    todas las condiciones indicadas (las omitidas no se comprueban)
+    """
+    
+    def __init__(self, state: Optional[str] = None, symbol: Optional[str] = None,
+                 head_min: Optional[int] = None, head_max: Optional[int] = None,
+                 step: Optional[int] = None, name: Optional[str] = None):
+        """
+        Inicializa el punto de interrupción
+        
+        Args:
+            state: Estado actual
+            symbol: Símbolo bajo el cabezal
+            head_min: Posición absoluta mínima del cabezal (inclusive)
+            head_max: Posición absoluta máxima del cabezal (inclusive)
+            step: Número de paso a partir del cual se cumple
+            name: Nombre para los reportes
+        """
+        if state is None and symbol is None and head_min is None and head_max is None and step is None:
+            raise ValueError("Un punto de interrupción necesita al menos una condición")
+        self.state = state
+        self.symbol = symbol
+        self.head_min = head_min
+        self.head_max = head_max
+        self.step = step
+        self.name = name
+        self.hits = 0
+    
+    def matches(self, state: str, symbol: str, head: int, step: int) -> bool:
+        """Comprueba todas las condiciones sobre una configuración"""
+        return ((self.state is None or state == self.state) and
+                (self.symbol is None or symbol == self.symbol) and
+                (self.head_min is None or head >= self.head_min) and
+                (self.head_max is None or head <= self.head_max) and
+                (self.step is None or step >= self.step))
+    
+    def __repr__(self) -> str:
+        conditions = [f"{key}={value!r}" for key, value in
+                      (('state', self.state), ('symbol', self.symbol), ('head_min', self.head_min),
+                       ('head_max', self.head_max), ('step', self.step)) if value is not None]
+        label = f"'{self.name}', " if self.name else ""
+        return f"Breakpoint({label}{', '.join(conditions)})"
+
+
+class Watchpoint:
+    """
+    Detiene la simulación después de un paso que escribe en una celda
+    """
+    
+    def __init__(self, cell: int, only_changes: bool = True, name: Optional[str] = None):
+        """
+        Inicializa el punto de observación
+        
+        Args:
+            cell: Posición absoluta de la celda (0 = primer símbolo de la entrada)
+            only_changes: Si solo cuentan las escrituras que cambian el símbolo
+            name: Nombre para los reportes
+        """
+        self.cell = cell
+        self.only_changes = only_changes
+        self.name = name
+        self.hits = 0
+    
+    def __repr__(self) -> str:
+        label = f"'{self.name}', " if self.name else ""
+        return f"Watchpoint({label}cell={self.cell}, only_changes={self.only_changes})"
+
+
+class CompiledBreakpoints:
+    """
+    Puntos compilados en compuertas baratas para el ciclo interno
+    
+    Cada punto de interrupción se asigna a su condición más selectiva: el
+    estado (búsqueda en diccionario), si no el símbolo, si no el paso (un
+    umbral) y si no el rango del cabezal (una comparación). Solo cuando la
+    compuerta se abre se evalúan todas sus condiciones. Los puntos de
+    observación se reducen a un conjunto de celdas.
+    """
+    
+    def __init__(self, points: Iterable[Union[Breakpoint, Watchpoint]]):
+        self.by_state: Dict[str, List[Breakpoint]] = {}
+        self.by_symbol: Dict[str, List[Breakpoint]] = {}
+        self.by_step: List[Breakpoint] = []
+        self.by_head: List[Breakpoint] = []
+        self.watch_cells: Dict[int, List[Watchpoint]] = {}
+        
+        for point in points:
+            if isinstance(point, Watchpoint):
+                self.watch_cells.setdefault(point.cell, []).append(point)
+            elif point.state is not None:
+                self.by_state.setdefault(point.state, []).append(point)
+            elif point.symbol is not None:
+                self.by_symbol.setdefault(point.symbol, []).append(point)
+            elif point.step is not None:
+                self.by_step.append(point)
+            else:
+                self.by_head.append(point)
+        
+        # Umbral del primer paso que abre la compuerta de pasos
+        self.step_threshold = min((point.step for point in self.by_step), default=None)
+        # Unión de los rangos del cabezal
+        self.head_low = min((point.head_min if point.head_min is not None else -float('inf')
+                             for point in self.by_head), default=None)
+        self.head_high = max((point.head_max if point.head_max is not None else float('inf')
+                              for point in self.by_head), default=None)
+    
+    def check(self, state: str, symbol: str, head: int, step: int) -> Optional[Breakpoint]:
+        """
+        Evalúa por completo los puntos de interrupción (camino lento)
+        
+        Returns:
+            Primer punto que se cumple o None
+        """
+        for group in (self.by_state.get(state, ()), self.by_symbol.get(symbol, ()),
+                      self.by_step, self.by_head):
+            for point in group:
+                if point.matches(state, symbol, head, step):
+                    return point
+        return None
+    
+    def watched(self, cell: int, old_symbol: str, new_symbol: str) -> Optional[Watchpoint]:
+        """
+        Evalúa los puntos de observación de una celda recién escrita
+        
+        Returns:
+            Primer punto que se cumple o None
+        """
+        for point in self.watch_cells.get(cell, ()):
+            if not point.only_changes or old_symbol != new_symbol:
+                return point
+        return None
@@ -0,0 +1,536 @@
+"""
+Búsqueda de configuraciones en paralelo (expansión de frontera)
+
+Explora las configuraciones alcanzables desde un conjunto de entradas
+(todas las cadenas hasta cierta longitud o una lista dada) para saber qué
+estados se alcanzan y con qué cadena. La frontera se reparte entre procesos
+por hash de la configuración codificada: cada proceso es dueño de una
+partición, guarda ahí las configuraciones ya vistas y descarta las
+repetidas, de modo que la detección de duplicados queda distribuida sin un
+conjunto central.
+
+Cada configuración se codifica como bytes: número de estado, posición del
+cabezal relativa al primer símbolo no blanco y la cinta sin blancos en los
+extremos, un byte por símbolo. Dos configuraciones que solo difieren por una
+traslación de la cinta se consideran la misma.
+"""
+
+import multiprocessing
+import queue
+import struct
+import time
+import zlib
+from itertools import islice, product
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from ..models.turing_machine import TuringMachine
+from ..utils.exceptions import SimulationError
+
+
+# Cabecera de una configuración codificada: estado y cabezal relativo
+_HEADER = struct.Struct('<Ii')
+# Bytes estimados por configuración vista además de su codificación
+# (objeto bytes y entrada del conjunto)
+_SEEN_OVERHEAD = 80
+# Movimiento del cabezal por dirección
+_MOVES = {'L': -1, 'R': 1, 'S': 0}
+
+# Elemento de la frontera: (configuración codificada, número de cadena, pasos)
+FrontierItem = Tuple[bytes, int, int]
+
+
+class SearchTable:
+    """
+    Tabla de transiciones numerada para la búsqueda
+    
+    Los estados se numeran en orden y los símbolos también, con el blanco
+    como 0 para poder recortarlo de la cinta con bytes.strip. Es serializable,
+    así que se envía una vez a cada proceso.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine):
+        """
+        Numera la MT
+        
+        Args:
+            turing_machine: MT de una cinta a explorar
+        
+        Raises:
+            SimulationError: Si la MT tiene más de 256 símbolos de cinta
+        """
+        blank = turing_machine.blank_symbol
+        self.state_names: List[str] = sorted(turing_machine.states)
+        self.symbols: List[str] = [blank] + sorted(turing_machine.tape_alphabet - {blank})
+        if len(self.symbols) > 256:
+            raise SimulationError("La búsqueda de configuraciones admite hasta 256 símbolos de cinta")
+        state_ids = {name: number for number, name in enumerate(self.state_names)}
+        self.symbol_ids: Dict[str, int] = {symbol: number for number, symbol in enumerate(self.symbols)}
+        self.initial = state_ids[turing_machine.initial_state]
+        self.accept = bytes(name in turing_machine.accept_states for name in self.state_names)
+        # estado -> símbolo -> (estado siguiente, símbolo escrito, desplazamiento) o None
+        self.rows: List[List[Optional[Tuple[int, int, int]]]] = []
+        for name in self.state_names:
+            row: List[Optional[Tuple[int, int, int]]] = [None] * len(self.symbols)
+            for symbol, (next_row, write, move, _) in turing_machine.state_rows[name].symbols.items():
+                if symbol in self.symbol_ids and write in self.symbol_ids:
+                    row[self.symbol_ids[symbol]] = (state_ids[next_row.name], self.symbol_ids[write],
+                                                    _MOVES[move])
+            self.rows.append(row)
+    
+    def encode_input(self, input_string: str) -> Optional[bytes]:
+        """
+        Codifica la configuración inicial de una cadena
+        
+        Returns:
+            Configuración codificada o None si usa símbolos fuera de la cinta
+        """
+        try:
+            tape = bytes(self.symbol_ids[symbol] for symbol in input_string)
+        except KeyError:
+            return None
+        return encode_configuration(self.initial, 0, tape)
+    
+    def decode(self, encoded: bytes) -> Tuple[str, int, str]:
+        """
+        Decodifica una configuración para mostrarla
+        
+        Returns:
+            Tupla con (estado, cabezal relativo, contenido de la cinta)
+        """
+        state, head = _HEADER.unpack_from(encoded)
+        content = ''.join(self.symbols[symbol] for symbol in encoded[_HEADER.size:])
+        return self.state_names[state], head, content
+
+
+def encode_configuration(state: int, head: int, tape: Sequence[int]) -> bytes:
+    """
+    Codifica una configuración recortando los blancos de los extremos
+    
+    Args:
+        state: Número de estado
+        head: Posición del cabezal dentro de tape
+        tape: Símbolos numerados (blanco = 0)
+    
+    Returns:
+        Configuración codificada
+    """
+    content = bytes(tape)
+    stripped = content.lstrip(b'\x00')
+    head -= len(content) - len(stripped)
+    return _HEADER.pack(state, head) + stripped.rstrip(b'\x00')
+
+
+def _unrank(index: int, symbols: Sequence[str]) -> str:
+    """Cadena número index en orden por longitud y luego lexicográfico"""
+    base = len(symbols)
+    length = 0
+    while index >= base ** length:
+        index -= base ** length
+        length += 1
+    digits = []
+    for _ in range(length):
+        index, digit = divmod(index, base)
+        digits.append(symbols[digit])
+    return ''.join(reversed(digits))
+
+
+class SearchPartition:
+    """
+    Partición de la frontera que pertenece a un proceso
+    
+    Guarda las configuraciones vistas de su partición y expande cada
+    configuración nueva hasta round_steps pasos. Si el conjunto de vistas
+    supera su presupuesto de memoria se vacía: la búsqueda sigue siendo
+    correcta, solo puede repetir trabajo (los ciclos se cortan por max_steps).
+    """
+    
+    def __init__(self, table: SearchTable, partitions: int, round_steps: int,
+                 max_steps: int, memory_limit: Optional[int]):
+        self.table = table
+        self.partitions = partitions
+        self.round_steps = round_steps
+        self.max_steps = max_steps
+        self.memory_limit = memory_limit
+        self.seen: Set[bytes] = set()
+        self.seen_bytes = 0
+        self.reached = bytearray(len(table.state_names))
+    
+    def expand(self, seeds: Sequence[Tuple[int, bytes]],
+               incoming: Iterable[FrontierItem]) -> Tuple[List[List[FrontierItem]], Dict]:
+        """
+        Procesa una ronda: cadenas nuevas y configuraciones recibidas
+        
+        Args:
+            seeds: Pares (número de cadena, configuración inicial)
+            incoming: Configuraciones de esta partición producidas en la ronda anterior
+        
+        Returns:
+            Tupla con (configuraciones siguientes por partición, contadores de la ronda)
+        """
+        rows = self.table.rows
+        accept = self.table.accept
+        reached = self.reached
+        seen = self.seen
+        partitions = self.partitions
+        max_steps = self.max_steps
+        outgoing: List[List[FrontierItem]] = [[] for _ in range(partitions)]
+        new_states: List[Tuple[int, int, int]] = []
+        report = {'explored': 0, 'duplicates': 0, 'accepted': 0, 'rejected': 0,
+                  'step_limit': 0, 'seen_resets': 0}
+        
+        items = [(encoded, seed, 0) for seed, encoded in seeds]
+        items.extend(incoming)
+        for encoded, seed, depth in items:
+            if encoded in seen:
+                report['duplicates'] += 1
+                continue
+            seen.add(encoded)
+            self.seen_bytes += len(encoded) + _SEEN_OVERHEAD
+            report['explored'] += 1
+            
+            state, head = _HEADER.unpack_from(encoded)
+            tape = bytearray(encoded[_HEADER.size:])
+            if head < 0:
+                tape[0:0] = bytes(-head)
+                head = 0
+            if head >= len(tape):
+                tape.extend(bytes(head - len(tape) + 1))
+            if not reached[state]:
+                reached[state] = 1
+                new_states.append((state, seed, depth))
+            
+            limit = min(depth + self.round_steps, max_steps)
+            while True:
+                if accept[state]:
+                    report['accepted'] += 1
+                    break
+                entry = rows[state][tape[head]]
+                if entry is None:
+                    report['rejected'] += 1
+                    break
+                if depth >= limit:
+                    if depth >= max_steps:
+                        report['step_limit'] += 1
+                    else:
+                        following = encode_configuration(state, head, tape)
+                        outgoing[zlib.crc32(following) % partitions].append((following, seed, depth))
+                    break
+                state, tape[head], move = entry
+                head += move
+                if head < 0:
+                    tape.insert(0, 0)
+                    head = 0
+                elif head == len(tape):
+                    tape.append(0)
+                depth += 1
+                if not reached[state]:
+                    reached[state] = 1
+                    new_states.append((state, seed, depth))
+        
+        if self.memory_limit is not None and self.seen_bytes > self.memory_limit:
+            seen.clear()
+            self.seen_bytes = 0
+            report['seen_resets'] += 1
+        report['new_states'] = new_states
+        report['seen_bytes'] = self.seen_bytes
+        report['frontier'] = sum(len(items) for items in outgoing)
+        return outgoing, report
+
+
+def _search_worker(index: int, partition: SearchPartition, inboxes: List,
+                   control, reports) -> None:
+    """
+    Ciclo de un proceso de búsqueda
+    
+    En cada ronda recibe las cadenas nuevas del coordinador y una lista de
+    cada proceso (incluido él mismo) con las configuraciones de su
+    partición; envía a cada proceso las configuraciones que le tocan. Antes
+    de terminar vacía su buzón para que ningún proceso quede bloqueado
+    escribiendo en él.
+    """
+    inbox = inboxes[index]
+    pending = False
+    while True:
+        seeds = control.get()
+        incoming: List[FrontierItem] = []
+        if pending:
+            # Se ordenan por remitente para que la ronda no dependa de la llegada
+            for _, items in sorted((inbox.get() for _ in inboxes), key=lambda message: message[0]):
+                incoming.extend(items)
+        if seeds is None:
+            return
+        outgoing, report = partition.expand(seeds, incoming)
+        for target, items in enumerate(outgoing):
+            inboxes[target].put((index, items))
+        pending = True
+        reports.put((index, report))
+
+
+class _LocalCluster:
+    """Una sola partición en este proceso"""
+    
+    def __init__(self, partitions: List[SearchPartition]):
+        self.partition = partitions[0]
+        self.incoming: List[FrontierItem] = []
+    
+    def round(self, chunks: List[List[Tuple[int, bytes]]]) -> List[Tuple[int, Dict]]:
+        outgoing, report = self.partition.expand(chunks[0], self.incoming)
+        self.incoming = outgoing[0]
+        return [(0, report)]
+    
+    def close(self) -> None:
+        self.incoming = []
+
+
+class _ProcessCluster:
+    """Una partición por proceso, con un buzón por proceso"""
+    
+    def __init__(self, partitions: List[SearchPartition]):
+        self.inboxes = [multiprocessing.Queue() for _ in partitions]
+        self.controls = [multiprocessing.Queue() for _ in partitions]
+        self.reports = multiprocessing.Queue()
+        self.processes = [multiprocessing.Process(target=_search_worker, daemon=True,
+                                                  args=(index, partition, self.inboxes,
+                                                        self.controls[index], self.reports))
+                          for index, partition in enumerate(partitions)]
+        for process in self.processes:
+            process.start()
+    
+    def round(self, chunks: List[List[Tuple[int, bytes]]]) -> List[Tuple[int, Dict]]:
+        for control, chunk in zip(self.controls, chunks):
+            control.put(chunk)
+        reports = []
+        while len(reports) < len(self.processes):
+            try:
+                reports.append(self.reports.get(timeout=1.0))
+            except queue.Empty:
+                if not all(process.is_alive() for process in self.processes):
+                    raise SimulationError("Un proceso de búsqueda terminó inesperadamente")
+        return reports
+    
+    def close(self) -> None:
+        for control in self.controls:
+            control.put(None)
+        for process in self.processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+
+
+class SearchResult:
+    """
+    Resultado de una búsqueda de configuraciones
+    """
+    
+    def __init__(self, status: str, witnesses: Dict[str, Tuple[str, int]],
+                 targets: Set[str], stats: Dict[str, int], elapsed: float):
+        """
+        Inicializa el resultado
+        
+        Args:
+            status: 'encontrado', 'agotado' o 'tiempo'
+            witnesses: Estado -> (cadena que lo alcanza, pasos hasta alcanzarlo)
+            targets: Estados buscados (vacío si la búsqueda fue exhaustiva)
+            stats: Contadores acumulados de la búsqueda
+            elapsed: Segundos de búsqueda
+        """
+        self.status = status
+        self.witnesses = witnesses
+        self.targets = targets
+        self.stats = stats
+        self.elapsed = elapsed
+    
+    @property
+    def found(self) -> bool:
+        """True si se alcanzaron todos los estados buscados"""
+        return bool(self.targets) and self.targets <= self.witnesses.keys()
+    
+    @property
+    def complete(self) -> bool:
+        """
+        True si se exploraron todas las configuraciones de las cadenas
+        
+        Una búsqueda completa en la que ninguna configuración llegó al límite
+        de pasos prueba que los estados sin testigo son inalcanzables desde
+        esas cadenas.
+        """
+        return self.status == 'agotado' and self.stats['step_limit'] == 0
+    
+    def reachable_states(self) -> List[str]:
+        """Estados alcanzados, ordenados"""
+        return sorted(self.witnesses)
+    
+    def get_summary(self) -> str:
+        """
+        Genera un resumen legible de la búsqueda
+        
+        Returns:
+            Resumen como string
+        """
+        stats = self.stats
+        lines = [
+            f"Búsqueda {self.status} en {self.elapsed:.2f} s ({stats['rounds']} rondas):",
+            f"  Cadenas iniciales: {stats['seeds']} ({stats['invalid']} inválidas)",
+            f"  Configuraciones exploradas: {stats['explored']}, duplicadas: {stats['duplicates']}",
+            f"  Aceptadas: {stats['accepted']}, rechazadas: {stats['rejected']}, "
+            f"en el límite de pasos: {stats['step_limit']}",
+            f"  Frontera máxima: {stats['peak_frontier']}, vaciados del conjunto de vistas: "
+            f"{stats['seen_resets']}",
+        ]
+        for state in sorted(self.witnesses):
+            input_string, steps = self.witnesses[state]
+            lines.append(f"  {state}: '{input_string}' en {steps} pasos")
+        missing = sorted(self.targets - self.witnesses.keys())
+        if missing:
+            lines.append(f"  Sin alcanzar: {', '.join(missing)}")
+        return "\n".join(lines)
+    
+    def __repr__(self) -> str:
+        return (f"SearchResult(status={self.status}, reached={len(self.witnesses)}, "
+                f"explored={self.stats['explored']})")
+
+
+class ConfigurationSearch:
+    """
+    Busca las configuraciones alcanzables desde un conjunto de cadenas
+    
+    La búsqueda avanza por rondas sincronizadas: en cada ronda cada
+    configuración de la frontera avanza hasta round_steps pasos y la
+    configuración a la que llega se envía a la partición dueña de su hash.
+    Con round_steps=1 se descartan todas las configuraciones repetidas; con
+    rondas más largas solo se comparan las de fin de ronda (menos mensajes,
+    y los ciclos se siguen detectando porque la secuencia de fin de ronda
+    también se repite). Las cadenas iniciales entran a medida que hay lugar
+    en la frontera, que nunca supera max_frontier configuraciones.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, max_input_length: int = 8,
+                 inputs: Optional[Iterable[str]] = None, targets: Optional[Iterable[str]] = None,
+                 workers: int = 1, max_steps: int = 10000, round_steps: int = 64,
+                 max_frontier: int = 100000, memory_limit: Optional[int] = 256 * 1024 * 1024,
+                 time_limit: Optional[float] = None):
+        """
+        Prepara la búsqueda
+        
+        Args:
+            turing_machine: MT a explorar
+            max_input_length: Longitud máxima de las cadenas (todas las del alfabeto de entrada)
+            inputs: Cadenas iniciales explícitas (reemplaza a max_input_length)
+            targets: Estados buscados; la búsqueda termina al alcanzarlos todos.
+                     Sin estados buscados se exploran todas las configuraciones
+            workers: Número de procesos (1 = en este proceso)
+            max_steps: Pasos máximos desde cada cadena
+            round_steps: Pasos que avanza cada configuración por ronda
+            max_frontier: Configuraciones máximas en la frontera
+            memory_limit: Bytes estimados para las configuraciones vistas (entre todos los procesos)
+            time_limit: Segundos máximos de búsqueda
+        
+        Raises:
+            SimulationError: Si los parámetros o los estados buscados son inválidos
+        """
+        if workers < 1:
+            raise SimulationError("El número de trabajadores debe ser al menos 1")
+        if round_steps < 1 or max_frontier < 1:
+            raise SimulationError("round_steps y max_frontier deben ser al menos 1")
+        self.turing_machine = turing_machine
+        self.table = SearchTable(turing_machine)
+        self.targets = set(targets) if targets is not None else set()
+        unknown = sorted(self.targets - turing_machine.states.keys())
+        if unknown:
+            raise SimulationError(f"Estados buscados inexistentes: {', '.join(unknown)}")
+        self.inputs = list(inputs) if inputs is not None else None
+        self.max_input_length = max_input_length
+        self.alphabet = sorted(turing_machine.input_alphabet)
+        self.workers = workers
+        self.max_steps = max_steps
+        self.round_steps = round_steps
+        self.max_frontier = max_frontier
+        self.memory_limit = memory_limit
+        self.time_limit = time_limit
+    
+    def _seed_strings(self) -> Iterator[str]:
+        """Cadenas iniciales en orden de numeración"""
+        if self.inputs is not None:
+            return iter(self.inputs)
+        return (''.join(symbols) for length in range(self.max_input_length + 1)
+                for symbols in product(self.alphabet, repeat=length))
+    
+    def _seed_string(self, seed: int) -> str:
+        if self.inputs is not None:
+            return self.inputs[seed]
+        return _unrank(seed, self.alphabet)
+    
+    def run(self) -> SearchResult:
+        """
+        Ejecuta la búsqueda
+        
+        Returns:
+            SearchResult con el testigo de cada estado alcanzado
+        """
+        started = time.perf_counter()
+        partition_memory = None if self.memory_limit is None else self.memory_limit // self.workers
+        partitions = [SearchPartition(self.table, self.workers, self.round_steps, self.max_steps,
+                                      partition_memory)
+                      for _ in range(self.workers)]
+        cluster = _LocalCluster(partitions) if self.workers == 1 else _ProcessCluster(partitions)
+        
+        stats = dict.fromkeys(('explored', 'duplicates', 'accepted', 'rejected', 'step_limit',
+                               'seen_resets', 'seeds', 'invalid', 'rounds', 'peak_frontier',
+                               'peak_seen_bytes'), 0)
+        found: Dict[int, Tuple[int, int]] = {}
+        target_ids = {self.table.state_names.index(name) for name in self.targets}
+        seeds = enumerate(self._seed_strings())
+        seeds_left = True
+        frontier = 0
+        try:
+            while True:
+                # Cada cadena va a la partición dueña de su configuración inicial
+                chunks: List[List[Tuple[int, bytes]]] = [[] for _ in range(self.workers)]
+                valid = 0
+                capacity = self.max_frontier - frontier
+                if seeds_left and capacity > 0:
+                    taken = 0
+                    for seed, input_string in islice(seeds, capacity):
+                        taken += 1
+                        encoded = self.table.encode_input(input_string)
+                        if encoded is None or not self.turing_machine.validate_input(input_string):
+                            stats['invalid'] += 1
+                            continue
+                        chunks[zlib.crc32(encoded) % self.workers].append((seed, encoded))
+                        valid += 1
+                    stats['seeds'] += taken
+                    seeds_left = taken == capacity
+                if not valid and frontier == 0 and not seeds_left:
+                    status = 'agotado'
+                    break
+                
+                reports = cluster.round(chunks)
+                stats['rounds'] += 1
+                frontier = 0
+                seen_bytes = 0
+                round_found: Dict[int, Tuple[int, int]] = {}
+                for _, report in sorted(reports, key=lambda item: item[0]):
+                    for key in ('explored', 'duplicates', 'accepted', 'rejected', 'step_limit',
+                                'seen_resets'):
+                        stats[key] += report[key]
+                    frontier += report['frontier']
+                    seen_bytes += report['seen_bytes']
+                    for state, seed, depth in report['new_states']:
+                        if state not in found and (depth, seed) < round_found.get(state, (depth + 1, 0)):
+                            round_found[state] = (depth, seed)
+                for state, (depth, seed) in round_found.items():
+                    found[state] = (seed, depth)
+                stats['peak_frontier'] = max(stats['peak_frontier'], frontier)
+                stats['peak_seen_bytes'] = max(stats['peak_seen_bytes'], seen_bytes)
+                
+                if target_ids and target_ids <= found.keys():
+                    status = 'encontrado'
+                    break
+                if self.time_limit is not None and time.perf_counter() - started > self.time_limit:
+                    status = 'tiempo'
+                    break
+        finally:
+            cluster.close()
+        
+        witnesses = {self.table.state_names[state]: (self._seed_string(seed), depth)
+                     for state, (seed, depth) in found.items()}
+        return SearchResult(status, witnesses, self.targets, stats, time.perf_counter() - started)
@@ -2,18 +2,31 @@
 Clase InstantaneousDescription para representar descripciones instantáneas de una MT
 """
 
-from typing import Optional
+from typing import Optional, Union
 from ..models.tape import Tape
+from ..models.transition import Transition
 
 
 class InstantaneousDescription:
     """
     Representa una descripción instantánea (ID) de una Máquina de Turing
     Una ID captura el estado completo de la MT en un momento dado
+    
+    Es un registro inmutable con __slots__; la transición aplicada se guarda
+    como referencia y solo se convierte a texto al consultarla. La
+    visualización de la cinta se dibuja bajo demanda a partir del contenido.
+    
+    Con window, la ID copia solo las celdas alrededor del cabezal: tape_content
+    es esa ventana, window_start la posición de su primera celda y
+    tape_length el largo de la cinta completa (None si se copió entera).
     """
     
+    __slots__ = ('state', 'tape_content', 'head_position', 'step', '_transition', 'blank_symbol',
+                 'window_start', 'tape_length')
+    
     def __init__(self, state: str, tape: Tape, step: int = 0, 
-                 transition_applied: Optional[str] = None):
+                 transition_applied: Optional[Union[str, Transition]] = None,
+                 window: Optional[int] = None):
         """
         Inicializa una descripción instantánea
         
@@ -21,71 +34,150 @@ class InstantaneousDescription:
             state: Estado actual de la MT
             tape: Estado actual de la cinta
             step: Número de paso en la simulación
-            transition_applied: Descripción de la transición aplicada (opcional)
+            transition_applied: Transición aplicada o su descripción (opcional)
+            window: Celdas a copiar a cada lado del cabezal (None = toda la cinta)
+        """
+        setter = object.__setattr__
+        setter(self, 'state', state)
+        if window is None:
+            setter(self, 'tape_content', tape.get_tape_content())
+            setter(self, 'window_start', 0)
+            setter(self, 'tape_length', None)
+        else:
+            cells = tape.tape
+            start = max(0, tape.head_position - window)
+            setter(self, 'tape_content', ''.join(cells[start:tape.head_position + window + 1]))
+            setter(self, 'window_start', start)
+            setter(self, 'tape_length', len(cells))
+        setter(self, 'head_position', tape.head_position)
+        setter(self, 'step', step)
+        setter(self, '_transition', transition_applied)
+        setter(self, 'blank_symbol', tape.blank_symbol)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("InstantaneousDescription es inmutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("InstantaneousDescription es inmutable")
+    
+    def __getstate__(self):
+        return tuple(object.__getattribute__(self, slot) for slot in self.__slots__)
+    
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            object.__setattr__(self, slot, value)
+    
+    @property
+    def transition_applied(self) -> Optional[str]:
+        """Descripción de la transición aplicada (None en la ID inicial)"""
+        return str(self._transition) if self._transition is not None else None
+    
+    @property
+    def tape_visual(self) -> str:
+        """Visualización de la cinta alrededor del cabezal"""
+        return self.get_tape_visual()
+    
+    def get_tape_visual(self, context: int = 5, full: bool = False) -> str:
         """
-        self.state = state
-        self.tape_content = tape.get_tape_content()
-        self.head_position = tape.head_position
-        self.step = step
-        self.transition_applied = transition_applied
+        Obtiene la visualización de la cinta en el momento de esta ID
         
-        # Crear una copia del estado de la cinta para preservar el historial
-        self.tape_visual = tape.get_visual_representation()
+        Args:
+            context: Número de posiciones a mostrar alrededor del cabezal
+            full: Si se muestra todo el contenido no blanco de la cinta
+            
+        Returns:
+            Representación visual de la cinta
+        """
+        return Tape.render_visual(self.tape_content, self.head_position - self.window_start,
+                                  self.blank_symbol, context, full, self.window_start, self.tape_length)
     
     def __str__(self) -> str:
         """
         Representación string de la descripción instantánea
         Formato: (estado, contenido_cinta_con_cabezal)
         """
-        # Crear representación con el estado marcado en la posición del cabezal
-        tape_chars = list(self.tape_content)
+        return self.render()
+    
+    def render(self, context: Optional[int] = None) -> str:
+        """
+        Representa la ID con el estado insertado en la posición del cabezal
+        
+        Args:
+            context: Celdas a mostrar a cada lado del cabezal; None muestra la
+                     cinta completa. Con ventana, las celdas omitidas se marcan
+                     con '…' y, si se omiten celdas a la izquierda, se agrega
+                     la posición de la primera celda mostrada (p. ej. '@1200').
+                     Una ID con ventana muestra a lo sumo las celdas copiadas.
+            
+        Returns:
+            String con la ID
+        """
+        content = self.tape_content
+        head = self.head_position - self.window_start
         
         # Asegurar que la cinta tenga suficientes caracteres
-        while len(tape_chars) <= self.head_position:
-            tape_chars.append('B')
+        if len(content) <= head:
+            content += 'B' * (head + 1 - len(content))
         
-        # Insertar el estado en la posición del cabezal
-        if self.head_position < len(tape_chars):
-            left_part = ''.join(tape_chars[:self.head_position])
-            right_part = ''.join(tape_chars[self.head_position:])
-            return f"({left_part}{self.state}{right_part})"
-        else:
-            return f"({''.join(tape_chars)}{self.state})"
+        if context is None:
+            if self.tape_length is None:
+                return f"({content[:head]}{self.state}{content[head:]})"
+            context = max(head, len(content))
+        
+        start = max(0, head - context)
+        end = min(len(content), head + context + 1)
+        first = self.window_start + start
+        length = len(content) if self.tape_length is None else max(self.tape_length, self.window_start + len(content))
+        left_mark = '…' if first > 0 else ''
+        right_mark = '…' if self.window_start + end < length else ''
+        offset = f" @{first}" if first > 0 else ''
+        return f"({left_mark}{content[start:head]}{self.state}{content[head:end]}{right_mark}){offset}"
     
-    def get_detailed_representation(self) -> str:
+    def get_detailed_representation(self, context: Optional[int] = None) -> str:
         """
         Obtiene una representación detallada de la descripción instantánea
         
+        Args:
+            context: Celdas a mostrar a cada lado del cabezal (None = todas)
+        
         Returns:
             String con representación detallada
         """
         result = f"Paso {self.step}:\n"
         result += f"  Estado: {self.state}\n"
         result += f"  Posición del cabezal: {self.head_position}\n"
-        result += f"  Contenido de la cinta: {self.tape_content}\n"
+        if context is None:
+            result += f"  Contenido de la cinta: {self.tape_content}\n"
         
         if self.transition_applied:
             result += f"  Transición aplicada: {self.transition_applied}\n"
         
-        result += f"  ID: {self}\n"
+        result += f"  ID: {self.render(context)}\n"
         result += f"  Visualización de la cinta:\n"
         
         # Indentar la visualización de la cinta
-        visual_lines = self.tape_visual.split('\n')
+        if context is None:
+            visual = self.get_tape_visual(full=True)
+        else:
+            visual = self.get_tape_visual(context)
+        visual_lines = visual.split('\n')
         for line in visual_lines:
             result += f"    {line}\n"
         
         return result
     
-    def get_compact_representation(self) -> str:
+    def get_compact_representation(self, context: Optional[int] = None) -> str:
         """
         Obtiene una representación compacta para listados
         
+        Args:
+            context: Celdas a mostrar a cada lado del cabezal (None = todas)
+        
         Returns:
             String con representación compacta
         """
         transition_info = f" [{self.transition_applied}]" if self.transition_applied else ""
-        return f"Paso {self.step}: {self}{transition_info}"
+        return f"Paso {self.step}: {self.render(context)}{transition_info}"
     
     def __repr__(self) -> str:
         return f"InstantaneousDescription(state='{self.state}', head_pos={self.head_position}, step={self.step})"
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""
+Simulador con memoización por bloques de cinta (macro máquina)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.tape import Tape
+from ..models.budget import StepBudget
+from ..analysis.graph_analysis import analyze_machine
+from .mt_simulator import resolve_step_limit, TIME_CHECK_INTERVAL
+from .simulation_result import SimulationResult, HaltReason
+
+
+# Macro paso: (estado_salida, dirección_salida, contenido_nuevo, pasos, desplazamiento_salida,
+#              desplazamiento_mínimo, desplazamiento_máximo)
+MacroStep = Tuple[str, str, Tuple[str, ...], int, int, int, int]
+
+# Marca de "no existe macro paso" (la MT se detiene o no sale del bloque)
+NO_MACRO = ()
+
+
+class BlockCache:
+    """
+    Caché LRU acotada de macro pasos por bloque
+    """
+    
+    def __init__(self, capacity: int = 65536):
+        """
+        Inicializa la caché
+        
+        Args:
+            capacity: Número máximo de entradas antes de expulsar la menos usada
+        """
+        self.capacity = capacity
+        self._entries: 'OrderedDict[Hashable, MacroStep]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[MacroStep]:
+        """
+        Busca un macro paso y lo marca como usado recientemente
+        
+        Args:
+            key: (estado, dirección_entrada, contenido_del_bloque)
+            
+        Returns:
+            El macro paso, NO_MACRO o None si no está en la caché
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+    
+    def put(self, key: Hashable, value: MacroStep) -> None:
+        """
+        Guarda un macro paso expulsando la entrada menos usada si hace falta
+        
+        Args:
+            key: (estado, dirección_entrada, contenido_del_bloque)
+            value: Macro paso o NO_MACRO
+        """
+        self._entries[key] = value
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> str:
+        """
+        Obtiene las estadísticas de uso de la caché
+        
+        Returns:
+            String con aciertos, fallos y expulsiones
+        """
+        total = self.hits + self.misses
+        rate = (self.hits / total) * 100 if total else 0.0
+        return (f"Caché de bloques: {len(self)} entradas, {self.hits} aciertos, "
+                f"{self.misses} fallos ({rate:.1f}% aciertos), {self.evictions} expulsiones")
+
+
+class MacroSimulator:
+    """
+    Simulador que cruza bloques de cinta conocidos con una sola consulta
+    
+    La cinta (Tape) se divide en bloques de tamaño fijo alineados con la
+    posición absoluta. Cuando el cabezal entra a un bloque por uno de sus
+    bordes, se busca en la caché el comportamiento de la MT sobre ese bloque
+    (estado, dirección de entrada, contenido) y, si la MT sale del bloque sin
+    detenerse, se aplica el macro paso completo. El número de pasos reportado
+    es exacto y coincide con MTSimulator.run: un macro paso que cruzaría el
+    límite de pasos o haría crecer la cinta más de lo permitido se reemplaza
+    por pasos simples.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, max_steps: int = 10000,
+                 use_analysis: bool = True, budget: Optional[StepBudget] = None,
+                 block_size: int = 8, cache: Optional[BlockCache] = None,
+                 local_step_cap: int = 10000):
+        """
+        Inicializa el simulador por bloques
+        
+        Args:
+            turing_machine: La Máquina de Turing a simular
+            max_steps: Límite de pasos si el presupuesto no define uno
+            use_analysis: Si se rechaza al entrar a un estado muerto
+            budget: Presupuesto de ejecución; por defecto el declarado en la MT
+            block_size: Celdas por bloque
+            cache: Caché de macro pasos (se puede compartir entre simuladores de la misma MT)
+            local_step_cap: Pasos máximos dentro de un bloque al calcular un macro paso
+        """
+        if block_size < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+        
+        self.turing_machine = turing_machine
+        self.max_steps = max_steps
+        self.budget = budget or turing_machine.budget or StepBudget()
+        self.block_size = block_size
+        self.cache = cache if cache is not None else BlockCache()
+        self.local_step_cap = local_step_cap
+        self._dead_states = analyze_machine(turing_machine).wandering_states if use_analysis else set()
+    
+    def _compute_macro(self, state: str, entry: str, contents: Tuple[str, ...]) -> MacroStep:
+        """
+        Simula la MT dentro de un bloque aislado
+        
+        Args:
+            state: Estado al entrar
+            entry: 'L' si se entra por el borde izquierdo, 'R' si por el derecho
+            contents: Contenido del bloque
+            
+        Returns:
+            Macro paso o NO_MACRO si la MT se detiene dentro del bloque
+        """
+        index = self.turing_machine.transition_index
+        accept_states = self.turing_machine.accept_states
+        dead_states = self._dead_states
+        cells = list(contents)
+        size = len(cells)
+        offset = 0 if entry == 'L' else size - 1
+        low = high = offset
+        steps = 0
+        
+        while steps < self.local_step_cap:
+            if state in accept_states or state in dead_states:
+                return NO_MACRO
+            transition = index.get((state, (cells[offset],)))
+            if transition is None:
+                return NO_MACRO
+            state, write_symbols, move = transition.apply()
+            cells[offset] = write_symbols[0]
+            steps += 1
+            if move == 'R':
+                offset += 1
+            elif move == 'L':
+                offset -= 1
+            if offset < 0:
+                return state, 'R', tuple(cells), steps, offset, offset, high
+            if offset >= size:
+                return state, 'L', tuple(cells), steps, offset, low, offset
+            if offset < low:
+                low = offset
+            elif offset > high:
+                high = offset
+        return NO_MACRO
+    
+    def _read_block(self, tape: Tape, start: int) -> Tuple[str, ...]:
+        """Lee un bloque por posición absoluta sin materializar celdas nuevas"""
+        cells = tape.tape
+        first = start + tape.left_expansions
+        if 0 <= first and first + self.block_size <= len(cells):
+            return tuple(cells[first:first + self.block_size])
+        blank = tape.blank_symbol
+        return tuple(cells[i] if 0 <= i < len(cells) else blank
+                     for i in range(first, first + self.block_size))
+    
+    @staticmethod
+    def _length_after(tape: Tape, start: int, macro: MacroStep) -> int:
+        """Largo que tendría la cinta después de aplicar un macro paso"""
+        first = start + macro[5] + tape.left_expansions
+        last = start + macro[6] + tape.left_expansions
+        return len(tape.tape) + max(0, -first) + max(0, last + 1 - len(tape.tape))
+    
+    @staticmethod
+    def _apply_macro(tape: Tape, start: int, macro: MacroStep) -> None:
+        """Escribe el resultado de un macro paso en la cinta y mueve el cabezal"""
+        _, _, contents, _, exit_offset, low, high = macro
+        
+        # Materializar las celdas visitadas (igual que haría la simulación paso a paso)
+        first = start + low + tape.left_expansions
+        if first < 0:
+            tape.tape[0:0] = [tape.blank_symbol] * (-first)
+            tape.left_expansions -= first
+        last = start + high + tape.left_expansions
+        if last >= len(tape.tape):
+            tape.tape.extend([tape.blank_symbol] * (last + 1 - len(tape.tape)))
+        
+        base = start + tape.left_expansions
+        for offset in range(max(low, 0), min(high, len(contents) - 1) + 1):
+            tape.tape[base + offset] = contents[offset]
+        tape.head_position = base + exit_offset
+    
+    def run(self, input_string: str) -> SimulationResult:
+        """
+        Simula una cadena usando macro pasos por bloque
+        
+        Args:
+            input_string: Cadena de entrada
+            
+        Returns:
+            Instancia de SimulationResult (sin IDs)
+        """
+        turing_machine = self.turing_machine
+        if not turing_machine.validate_input(input_string):
+            invalid_symbols = [s for s in input_string if s not in turing_machine.input_alphabet]
+            return SimulationResult(input_string, False, HaltReason.INVALID_INPUT, 0,
+                                    f"Cadena rechazada: contiene símbolos inválidos {invalid_symbols}")
+        
+        current_state = turing_machine.initial_state
+        tape = turing_machine.create_tape(input_string)
+        step = 0
+        size = self.block_size
+        cache = self.cache
+        dead_states = self._dead_states
+        
+        step_limit, limit_reason, limit_message = resolve_step_limit(
+            self.budget, len(input_string), self.max_steps)
+        deadline = None
+        if self.budget.time_limit is not None:
+            deadline = time.perf_counter() + self.budget.time_limit
+        tape_limit = None
+        if self.budget.max_tape_growth is not None:
+            tape_limit = max(1, len(input_string)) + self.budget.max_tape_growth
+        
+        # Borde por el que el cabezal entró a la celda actual (None = no aplica)
+        entry = None
+        iterations = 0
+        
+        while step < step_limit:
+            if turing_machine.is_accept_state(current_state):
+                return SimulationResult(input_string, True, HaltReason.ACCEPTED, step,
+                                        f"Cadena ACEPTADA en {step} pasos", current_state, tape)
+            
+            if current_state in dead_states:
+                return SimulationResult(input_string, False, HaltReason.DEAD_STATE, step,
+                                        f"Cadena RECHAZADA: el estado '{current_state}' no puede alcanzar un estado de aceptación (paso {step})",
+                                        current_state, tape)
+            
+            # Intentar cruzar el bloque completo
+            macro = NO_MACRO
+            if entry is not None:
+                absolute = tape.head_position - tape.left_expansions
+                offset = absolute % size
+                if offset == (0 if entry == 'L' else size - 1):
+                    start = absolute - offset
+                    key = (current_state, entry, self._read_block(tape, start))
+                    macro = cache.get(key)
+                    if macro is None:
+                        macro = self._compute_macro(current_state, entry, key[2])
+                        cache.put(key, macro)
+                    # La cinta solo crece, así que si no supera el límite al final
+                    # del macro paso tampoco lo superó en un paso intermedio
+                    if (macro is not NO_MACRO and step + macro[3] <= step_limit and
+                            (tape_limit is None or self._length_after(tape, start, macro) <= tape_limit)):
+                        self._apply_macro(tape, start, macro)
+                        current_state, entry = macro[0], macro[1]
+                        step += macro[3]
+                    else:
+                        macro = NO_MACRO
+            
+            # Paso simple
+            if macro is NO_MACRO:
+                current_symbol = tape.read()
+                transition = turing_machine.get_transition(current_state, [current_symbol])
+                if transition is None:
+                    return SimulationResult(input_string, False, HaltReason.NO_TRANSITION, step,
+                                            f"Cadena RECHAZADA: No hay transición desde estado '{current_state}' leyendo '{current_symbol}' en paso {step}",
+                                            current_state, tape)
+                current_state, write_symbols, move_direction = transition.apply()
+                tape.write(write_symbols[0])
+                tape.move(move_direction)
+                step += 1
+                entry = 'L' if move_direction == 'R' else ('R' if move_direction == 'L' else None)
+            
+            # Verificar límites de cinta y de tiempo
+            if tape_limit is not None and len(tape.tape) > tape_limit:
+                return SimulationResult(input_string, False, HaltReason.TAPE_LIMIT, step,
+                                        f"Simulación detenida: la cinta creció más de {self.budget.max_tape_growth} celdas en paso {step}",
+                                        current_state, tape)
+            iterations += 1
+            if deadline is not None and iterations % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+                return SimulationResult(input_string, False, HaltReason.TIME_LIMIT, step,
+                                        f"Simulación detenida: se superó el límite de {self.budget.time_limit} s en paso {step}",
+                                        current_state, tape)
+        
+        return SimulationResult(input_string, False, limit_reason, step, limit_message,
+                                current_state, tape)
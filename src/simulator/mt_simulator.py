@@ -2,29 +2,90 @@
 Simulador principal de Máquinas de Turing
 """
 
-from typing import List, Tuple, Optional
+import time
+from typing import Callable, Iterable, Iterator, List, Set, Tuple, Optional, Union
 from ..models.turing_machine import TuringMachine
+from ..models.budget import StepBudget
 from ..models.tape import Tape
+from ..models.mapped_tape import MappedInput
 from ..models.transition import Transition
 from .instantaneous_description import InstantaneousDescription
+from .simulation_result import SimulationResult, HaltReason
+from .snapshot import SimulationSnapshot, Checkpointer
+from .stay_chains import compose_stay_chains
+from .trace_index import TraceIndex
+from .breakpoints import Breakpoint, Watchpoint, CompiledBreakpoints
+from .batch_results import BatchResults
+from ..analysis.graph_analysis import MachineAnalysis, analyze_machine
 from ..utils.exceptions import SimulationError
 
 
+# Cada cuántos pasos se consulta el reloj cuando hay límite de tiempo
+TIME_CHECK_INTERVAL = 1024
+
+
+def resolve_step_limit(budget: StepBudget, input_length: int, default_max_steps: int) -> Tuple[int, HaltReason, str]:
+    """
+    Calcula el límite de pasos efectivo de una simulación
+    
+    Args:
+        budget: Presupuesto de ejecución
+        input_length: Longitud de la cadena de entrada
+        default_max_steps: Límite a usar si el presupuesto no limita los pasos
+        
+    Returns:
+        Tupla con (límite, motivo_de_parada, mensaje) para cuando se alcance
+    """
+    limit = budget.max_steps if budget.max_steps is not None else default_max_steps
+    reason = HaltReason.MAX_STEPS
+    message = f"Simulación detenida: se alcanzó el límite máximo de {limit} pasos"
+    
+    polynomial = budget.polynomial_limit(input_length)
+    if polynomial is not None and (budget.max_steps is None or polynomial < limit):
+        limit = polynomial
+        reason = HaltReason.STEP_BUDGET
+        message = (f"Simulación detenida: se alcanzó el presupuesto de {limit} pasos "
+                   f"para una entrada de longitud {input_length}")
+    return limit, reason, message
+
+
 class MTSimulator:
     """
     Simulador de Máquinas de Turing que genera descripciones instantáneas
     """
     
-    def __init__(self, turing_machine: TuringMachine, max_steps: int = 10000):
+    def __init__(self, turing_machine: TuringMachine, max_steps: int = 10000,
+                 use_analysis: bool = True, budget: Optional[StepBudget] = None):
         """
         Inicializa el simulador
         
         Args:
             turing_machine: La Máquina de Turing a simular
-            max_steps: Número máximo de pasos para evitar bucles infinitos
+            max_steps: Número máximo de pasos para evitar bucles infinitos; se usa
+                       cuando el presupuesto no define un límite de pasos
+            use_analysis: Si se usa el análisis estático para rechazar en cuanto
+                          la MT entra a un estado desde el que no puede aceptar
+            budget: Presupuesto de ejecución; por defecto el declarado en la MT
         """
         self.turing_machine = turing_machine
         self.max_steps = max_steps
+        self.budget = budget or turing_machine.budget or StepBudget()
+        self.use_analysis = use_analysis
+        self.analysis = analyze_machine(turing_machine) if use_analysis else None
+        self._dead_states = self.analysis.wandering_states if self.analysis else set()
+        
+        # Cadenas de transiciones S compuestas (se usan cuando no se generan IDs)
+        self.stay_chains = compose_stay_chains(turing_machine, frozenset(self._dead_states))
+    
+    def get_stay_cycles(self) -> List[Tuple[str, str]]:
+        """
+        Obtiene los pares (estado, símbolo) desde los que la MT entra a un
+        ciclo de transiciones S y nunca se detiene
+        
+        Returns:
+            Lista de pares (estado, símbolo)
+        """
+        return [key for key, chain in self.stay_chains.items() if chain.is_cycle]
     
     def simulate(self, input_string: str) -> Tuple[bool, List[InstantaneousDescription], str]:
         """
@@ -39,67 +100,248 @@ class MTSimulator:
             - lista_de_IDs: Lista de descripciones instantáneas
             - resultado_final: Descripción del resultado
         """
+        result = self.run(input_string)
+        return result.accepted, result.ids, result.message
+    
+    def run(self, input_string: Union[str, MappedInput], record_trace: bool = True,
+            on_step: Optional[Callable[[InstantaneousDescription], None]] = None,
+            checkpointer: Optional[Checkpointer] = None,
+            resume_from: Optional[SimulationSnapshot] = None,
+            initial_tape: Optional[Tape] = None,
+            trace_index: Optional[TraceIndex] = None,
+            coverage: Optional[Set[Tuple[str, str]]] = None,
+            on_step_context: Optional[int] = None) -> SimulationResult:
+        """
+        Simula la ejecución de la MT y retorna un resultado estructurado
+        
+        Args:
+            input_string: Cadena de entrada a procesar, o MappedInput para
+                          entradas enormes leídas desde archivo (conviene
+                          record_trace=False: cada ID copia la cinta completa)
+            record_trace: Si se registran las descripciones instantáneas; sin
+                          traza ni callback la simulación no crea IDs en cada paso
+            on_step: Función que recibe cada ID en cuanto se produce (p. ej.
+                     TracePrinter.emit), aunque no se registre la traza
+            checkpointer: Guarda instantáneas periódicas o al recibir una señal
+            resume_from: Instantánea desde la cual continuar; se usa su
+                         presupuesto y el tiempo ya consumido
+            initial_tape: Cinta ya construida (p. ej. la cinta final de otra MT)
+                          que se usa sin copiarla; input_string solo etiqueta
+                          el resultado y los límites se miden sobre sus celdas
+                          (una sola celda en blanco cuenta como entrada vacía)
+            trace_index: Índice que registra estado, transición y cabezal de
+                         cada paso para consultarlos después sin IDs
+            coverage: Conjunto al que se agrega cada par (estado, símbolo)
+                      leído, incluido el par final sin transición (ver
+                      analysis.coverage.CoverageMap)
+            on_step_context: Sin record_trace, las IDs para on_step copian solo
+                             estas celdas a cada lado del cabezal en lugar de
+                             toda la cinta (p. ej. el context de TracePrinter)
+            
+        Returns:
+            Instancia de SimulationResult
+            
+        Raises:
+            SimulationError: Si la instantánea no corresponde a esta MT o entrada,
+                             o si se piden instantáneas de una entrada mapeada
+        """
+        if isinstance(input_string, MappedInput) and (checkpointer is not None or resume_from is not None):
+            raise SimulationError("Las instantáneas no admiten entradas mapeadas desde archivo")
+        
         # Validar entrada
-        if not self.turing_machine.validate_input(input_string):
-            invalid_symbols = [s for s in input_string if s not in self.turing_machine.input_alphabet]
-            return False, [], f"Cadena rechazada: contiene símbolos inválidos {invalid_symbols}"
+        if initial_tape is not None:
+            if resume_from is not None:
+                raise SimulationError("No se puede reanudar una instantánea sobre una cinta recibida")
+            allowed = self.turing_machine.tape_alphabet | {self.turing_machine.blank_symbol}
+            invalid_symbols = sorted(set(initial_tape.tape) - allowed)
+            if invalid_symbols:
+                return SimulationResult(input_string, False, HaltReason.INVALID_INPUT, 0,
+                                        f"Cinta rechazada: contiene símbolos fuera del alfabeto de cinta {invalid_symbols}")
+            # Una sola celda en blanco equivale a la entrada vacía (como create_tape(""))
+            cells = initial_tape.tape
+            blank_only = len(cells) == 1 and cells[0] == self.turing_machine.blank_symbol
+            input_length = 0 if blank_only else len(cells)
+        elif not self.turing_machine.validate_input(input_string):
+            if isinstance(input_string, MappedInput):
+                invalid_symbols = sorted(input_string.find_invalid_symbols(self.turing_machine.input_alphabet))
+            else:
+                invalid_symbols = [s for s in input_string if s not in self.turing_machine.input_alphabet]
+            return SimulationResult(input_string, False, HaltReason.INVALID_INPUT, 0,
+                                    f"Cadena rechazada: contiene símbolos inválidos {invalid_symbols}")
+        else:
+            input_length = len(input_string)
         
         # Inicializar simulación
-        current_state = self.turing_machine.initial_state
-        tape = self.turing_machine.create_tape(input_string)
-        step = 0
+        budget = self.budget
+        elapsed = 0.0
+        if resume_from is None:
+            current_state = self.turing_machine.initial_state
+            tape = initial_tape if initial_tape is not None else self.turing_machine.create_tape(input_string)
+            step = 0
+        else:
+            resume_from.check_machine(self.turing_machine)
+            if resume_from.input_string != input_string:
+                raise SimulationError("La instantánea corresponde a otra cadena de entrada")
+            current_state = resume_from.state
+            tape = resume_from.restore_tape()
+            step = resume_from.step
+            elapsed = resume_from.elapsed
+            if resume_from.budget is not None:
+                budget = StepBudget.from_dict(resume_from.budget)
+        started = time.perf_counter()
         
         # Lista para almacenar las descripciones instantáneas
         ids = []
         
         # Crear ID inicial
-        initial_id = InstantaneousDescription(current_state, tape, step)
-        ids.append(initial_id)
+        make_ids = record_trace or on_step is not None
+        # Las IDs que se registran necesitan la cinta completa
+        window = None if record_trace else on_step_context
+        if make_ids:
+            initial_id = InstantaneousDescription(current_state, tape, step, window=window)
+            if record_trace:
+                ids.append(initial_id)
+            if on_step is not None:
+                on_step(initial_id)
+        
+        if trace_index is not None:
+            trace_index.start(current_state, tape.head_position - tape.left_expansions, step)
         
-        # Simulación principal
-        while step < self.max_steps:
+        dead_states = self._dead_states
+        
+        # Límites del presupuesto de ejecución (la cinta crece desde la entrada inicial)
+        step_limit, limit_reason, limit_message = resolve_step_limit(
+            budget, input_length, self.max_steps)
+        deadline = None
+        if budget.time_limit is not None:
+            deadline = started + budget.time_limit - elapsed
+        tape_limit = None
+        if budget.max_tape_growth is not None:
+            tape_limit = max(1, input_length) + budget.max_tape_growth
+        
+        # Sin IDs, las cadenas S se aplican como una sola transición compuesta;
+        # con traza, índice o cobertura se recorren paso a paso para registrar cada paso
+        stay_chains = self.stay_chains if not make_ids and trace_index is None and coverage is None else None
+        
+        # Huella de la MT para las instantáneas (se calcula en la primera)
+        fingerprint = None
+        
+        # Simulación principal: la fila del estado actual es una variable local
+        # y la del siguiente estado viene directamente de la entrada aplicada
+        row = self.turing_machine.state_rows[current_state]
+        while step < step_limit:
             # Verificar si estamos en un estado de aceptación
-            if self.turing_machine.is_accept_state(current_state):
-                result = f"Cadena ACEPTADA en {step} pasos"
-                return True, ids, result
+            if row.is_accept:
+                return SimulationResult(input_string, True, HaltReason.ACCEPTED, step,
+                                        f"Cadena ACEPTADA en {step} pasos",
+                                        current_state, tape, ids)
+            
+            # Verificar si el estado ya no puede alcanzar la aceptación
+            if current_state in dead_states:
+                return SimulationResult(input_string, False, HaltReason.DEAD_STATE, step,
+                                        f"Cadena RECHAZADA: el estado '{current_state}' no puede alcanzar un estado de aceptación (paso {step})",
+                                        current_state, tape, ids)
             
             # Leer símbolo actual de la cinta
             current_symbol = tape.read()
+            if coverage is not None:
+                coverage.add((current_state, current_symbol))
             
-            # Buscar transición aplicable
-            transition = self.turing_machine.get_transition(current_state, [current_symbol])
+            # Buscar transición aplicable en la fila del estado
+            entry = row.symbols.get(current_symbol)
             
-            if transition is None:
+            if entry is None:
                 # No hay transición aplicable
-                result = f"Cadena RECHAZADA: No hay transición desde estado '{current_state}' leyendo '{current_symbol}' en paso {step}"
-                return False, ids, result
+                return SimulationResult(input_string, False, HaltReason.NO_TRANSITION, step,
+                                        f"Cadena RECHAZADA: No hay transición desde estado '{current_state}' leyendo '{current_symbol}' en paso {step}",
+                                        current_state, tape, ids)
+            
+            # Componer la cadena S que empieza aquí, si cabe en el límite de pasos
+            advanced = 1
+            chain = None
+            if stay_chains is not None and entry[2] == 'S':
+                chain = stay_chains.get((current_state, current_symbol))
+            if chain is not None and chain.is_cycle:
+                # Ciclo S: la MT no se detiene; se salta al límite de pasos
+                row, cell = chain.position_after(step_limit - step)
+                tape.write(cell)
+                current_state = row.name
+                step = step_limit
+                break
+            if chain is not None and step + chain.steps <= step_limit:
+                entry = (chain.row, chain.write_symbol, chain.move, None)
+                advanced = chain.steps
             
             # Aplicar transición
             try:
-                new_state, write_symbols, move_direction = transition.apply()
+                row, write_symbol, move_direction, transition = entry
                 
                 # Escribir en la cinta
-                tape.write(write_symbols[0])  # Para MT de una cinta
+                tape.write(write_symbol)
                 
                 # Mover cabezal
                 tape.move(move_direction)
                 
                 # Actualizar estado
-                current_state = new_state
-                step += 1
+                current_state = row.name
+                step += advanced
                 
                 # Crear nueva ID
-                transition_desc = str(transition)
-                new_id = InstantaneousDescription(current_state, tape, step, transition_desc)
-                ids.append(new_id)
+                if make_ids:
+                    new_id = InstantaneousDescription(current_state, tape, step, transition, window)
+                    if record_trace:
+                        ids.append(new_id)
+                    if on_step is not None:
+                        on_step(new_id)
+                if trace_index is not None:
+                    trace_index.add(current_state, transition, tape.head_position - tape.left_expansions)
                 
             except Exception as e:
-                result = f"Error durante la simulación en paso {step}: {e}"
-                return False, ids, result
+                return SimulationResult(input_string, False, HaltReason.ERROR, step,
+                                        f"Error durante la simulación en paso {step}: {e}",
+                                        current_state, tape, ids)
+            
+            # Verificar límites de cinta y de tiempo
+            if tape_limit is not None and len(tape.tape) > tape_limit:
+                return SimulationResult(input_string, False, HaltReason.TAPE_LIMIT, step,
+                                        f"Simulación detenida: la cinta creció más de {budget.max_tape_growth} celdas en paso {step}",
+                                        current_state, tape, ids)
+            if deadline is not None and step % TIME_CHECK_INTERVAL < advanced and time.perf_counter() > deadline:
+                return SimulationResult(input_string, False, HaltReason.TIME_LIMIT, step,
+                                        f"Simulación detenida: se superó el límite de {budget.time_limit} s en paso {step}",
+                                        current_state, tape, ids)
+            
+            # Guardar instantánea si corresponde
+            if checkpointer is not None and checkpointer.due(step, advanced):
+                if fingerprint is None:
+                    fingerprint = self.turing_machine.get_fingerprint()
+                checkpointer.save(SimulationSnapshot.capture(
+                    self.turing_machine, input_string, current_state, step, tape,
+                    budget.to_dict(), elapsed + time.perf_counter() - started, fingerprint))
         
-        # Se alcanzó el límite máximo de pasos
-        result = f"Simulación detenida: se alcanzó el límite máximo de {self.max_steps} pasos"
-        return False, ids, result
+        # Se alcanzó el límite de pasos
+        return SimulationResult(input_string, False, limit_reason, step, limit_message,
+                                current_state, tape, ids)
+    
+    def resume(self, snapshot: SimulationSnapshot, record_trace: bool = False,
+               on_step: Optional[Callable[[InstantaneousDescription], None]] = None,
+               checkpointer: Optional[Checkpointer] = None,
+               on_step_context: Optional[int] = None) -> SimulationResult:
+        """
+        Continúa una simulación guardada con SimulationSnapshot
+        
+        Args:
+            snapshot: Instantánea (p. ej. SimulationSnapshot.load(ruta))
+            record_trace: Si se registran las IDs desde el punto de reanudación
+            on_step: Función que recibe cada ID
+            checkpointer: Guarda nuevas instantáneas durante la reanudación
+            on_step_context: Celdas que copian las IDs para on_step (ver run)
+            
+        Returns:
+            Instancia de SimulationResult
+        """
+        return self.run(snapshot.input_string, record_trace, on_step, checkpointer, snapshot,
+                        on_step_context=on_step_context)
     
     def simulate_step_by_step(self, input_string: str) -> 'StepByStepSimulation':
         """
@@ -111,25 +353,76 @@ class MTSimulator:
         Returns:
             Instancia de StepByStepSimulation
         """
-        return StepByStepSimulation(self.turing_machine, input_string, self.max_steps)
+        return StepByStepSimulation(self.turing_machine, input_string, self.max_steps,
+                                    use_analysis=self.use_analysis, analysis=self.analysis,
+                                    budget=self.budget)
     
     def simulate_multiple(self, input_strings: List[str]) -> List[Tuple[str, bool, List[InstantaneousDescription], str]]:
         """
         Simula múltiples cadenas de entrada
         
+        Cada tupla guarda todas las IDs de la cadena; para lotes grandes
+        conviene simulate_batch.
+        
         Args:
             input_strings: Lista de cadenas a simular
             
         Returns:
             Lista de tuplas con (cadena, aceptada, IDs, resultado)
         """
-        results = []
+        return list(self.iter_simulate(input_strings))
+    
+    def simulate_batch(self, input_strings: Iterable[str], keep_tapes: bool = True) -> BatchResults:
+        """
+        Simula un lote de cadenas sin trazas y guarda los resultados por columnas
         
+        Args:
+            input_strings: Iterable de cadenas
+            keep_tapes: Si se guardan las cintas finales
+            
+        Returns:
+            BatchResults con veredicto, pasos, motivo de parada y cinta final
+            de cada cadena; los mensajes se arman solo al pedirlos
+        """
+        results = BatchResults(self.turing_machine, self.max_steps, self.budget, keep_tapes)
+        for input_string in input_strings:
+            results.append(self.run(input_string, record_trace=False))
+        return results
+    
+    def iter_simulate(self, input_strings: Iterable[str]) -> Iterator[Tuple[str, bool, List[InstantaneousDescription], str]]:
+        """
+        Simula cadenas de entrada una a una a medida que se consumen
+        
+        A diferencia de simulate_multiple no acumula resultados, por lo que
+        sirve para corpus que no caben en memoria.
+        
+        Args:
+            input_strings: Iterable de cadenas (p. ej. CorpusReader.iter_strings())
+            
+        Returns:
+            Iterador de tuplas con (cadena, aceptada, IDs, resultado)
+        """
         for input_string in input_strings:
             accepted, ids, result = self.simulate(input_string)
-            results.append((input_string, accepted, ids, result))
+            yield input_string, accepted, ids, result
+    
+    def check_corpus(self, entries: Iterable) -> Iterator[Tuple[object, bool, str, Optional[str]]]:
+        """
+        Simula un corpus comparando cada resultado con lo esperado
         
-        return results
+        Args:
+            entries: Iterable de CorpusEntry
+            
+        Returns:
+            Iterador de tuplas con (entrada, aceptada, resultado, discrepancia)
+            donde discrepancia es None si el resultado coincide con lo esperado
+        """
+        for entry in entries:
+            accepted, ids, result = self.simulate(entry.input_string)
+            output = None
+            if entry.expected_output is not None:
+                output = self.turing_machine.get_output(ids[-1].tape_content) if ids else ""
+            yield entry, accepted, result, entry.check(accepted, output)
 
 
 class StepByStepSimulation:
@@ -137,18 +430,32 @@ class StepByStepSimulation:
     Simulador paso a paso para ejecución interactiva
     """
     
-    def __init__(self, turing_machine: TuringMachine, input_string: str, max_steps: int = 10000):
+    def __init__(self, turing_machine: TuringMachine, input_string: str, max_steps: int = 10000,
+                 use_analysis: bool = True, analysis: Optional[MachineAnalysis] = None,
+                 budget: Optional[StepBudget] = None, checkpointer: Optional[Checkpointer] = None):
         """
         Inicializa la simulación paso a paso
         
         Args:
             turing_machine: La Máquina de Turing a simular
             input_string: Cadena de entrada
-            max_steps: Número máximo de pasos
+            max_steps: Número máximo de pasos si el presupuesto no define uno
+            use_analysis: Si se rechaza al entrar a un estado muerto
+            analysis: Análisis estático ya calculado (opcional)
+            budget: Presupuesto de ejecución; por defecto el declarado en la MT.
+                    El límite de tiempo cuenta solo el tiempo simulado (dentro de
+                    next_step y run_until), no las pausas entre llamadas.
+            checkpointer: Guarda instantáneas periódicas o al recibir una señal
         """
         self.turing_machine = turing_machine
         self.input_string = input_string
-        self.max_steps = max_steps
+        self.budget = budget or turing_machine.budget or StepBudget()
+        self.max_steps, self._limit_reason, self._limit_message = resolve_step_limit(
+            self.budget, len(input_string), max_steps)
+        
+        if use_analysis and analysis is None:
+            analysis = analyze_machine(turing_machine)
+        self._dead_states = analysis.wandering_states if use_analysis else set()
         
         # Estado de la simulación
         self.current_state = turing_machine.initial_state
@@ -157,6 +464,19 @@ class StepByStepSimulation:
         self.finished = False
         self.accepted = False
         self.result_message = ""
+        self.halt_reason: Optional[HaltReason] = None
+        self.checkpointer = checkpointer
+        self._fingerprint: Optional[str] = None
+        self.last_hit: Optional[Union[Breakpoint, Watchpoint]] = None
+        self._stopped_at: Optional[int] = None
+        # Segundos simulados y comienzo de la llamada en curso (None entre llamadas)
+        self.elapsed = 0.0
+        self._resumed_at: Optional[float] = None
+        
+        # Límite de cinta
+        self._tape_limit = None
+        if self.budget.max_tape_growth is not None:
+            self._tape_limit = len(self.tape.tape) + self.budget.max_tape_growth
         
         # Historial de IDs
         self.ids = []
@@ -172,19 +492,56 @@ class StepByStepSimulation:
         """
         if self.finished:
             return None
+        self._resumed_at = time.perf_counter()
+        try:
+            return self._advance()
+        finally:
+            self.elapsed += time.perf_counter() - self._resumed_at
+            self._resumed_at = None
+    
+    def _advance(self) -> Optional[InstantaneousDescription]:
+        """Ejecuta un paso (next_step mide su tiempo)"""
+        # Verificar límites de cinta y de tiempo (en el mismo orden que
+        # MTSimulator.run: se cumplen por el paso anterior)
+        if self._tape_limit is not None and len(self.tape.tape) > self._tape_limit:
+            self.finished = True
+            self.accepted = False
+            self.result_message = f"Simulación detenida: la cinta creció más de {self.budget.max_tape_growth} celdas"
+            self.halt_reason = HaltReason.TAPE_LIMIT
+            return None
+        
+        if self.budget.time_limit is not None and self._elapsed_now() > self.budget.time_limit:
+            self.finished = True
+            self.accepted = False
+            self.result_message = f"Simulación detenida: se superó el límite de {self.budget.time_limit} s"
+            self.halt_reason = HaltReason.TIME_LIMIT
+            return None
+        
+        # Verificar límite de pasos
+        if self.step >= self.max_steps:
+            self.finished = True
+            self.accepted = False
+            if self._limit_reason is HaltReason.MAX_STEPS:
+                self.result_message = f"Simulación detenida: límite de {self.max_steps} pasos alcanzado"
+            else:
+                self.result_message = self._limit_message
+            self.halt_reason = self._limit_reason
+            return None
         
         # Verificar estado de aceptación
         if self.turing_machine.is_accept_state(self.current_state):
             self.finished = True
             self.accepted = True
             self.result_message = f"Cadena ACEPTADA en {self.step} pasos"
+            self.halt_reason = HaltReason.ACCEPTED
             return None
         
-        # Verificar límite de pasos
-        if self.step >= self.max_steps:
+        # Verificar si el estado ya no puede alcanzar la aceptación
+        if self.current_state in self._dead_states:
             self.finished = True
             self.accepted = False
-            self.result_message = f"Simulación detenida: límite de {self.max_steps} pasos alcanzado"
+            self.result_message = f"Cadena RECHAZADA: el estado '{self.current_state}' no puede alcanzar un estado de aceptación"
+            self.halt_reason = HaltReason.DEAD_STATE
             return None
         
         # Leer símbolo actual
@@ -197,6 +554,7 @@ class StepByStepSimulation:
             self.finished = True
             self.accepted = False
             self.result_message = f"Cadena RECHAZADA: No hay transición desde '{self.current_state}' leyendo '{current_symbol}'"
+            self.halt_reason = HaltReason.NO_TRANSITION
             return None
         
         # Aplicar transición
@@ -210,18 +568,187 @@ class StepByStepSimulation:
             self.step += 1
             
             # Crear nueva ID
-            transition_desc = str(transition)
-            new_id = InstantaneousDescription(self.current_state, self.tape, self.step, transition_desc)
+            new_id = InstantaneousDescription(self.current_state, self.tape, self.step, transition)
             self.ids.append(new_id)
             
+            if self.checkpointer is not None and self.checkpointer.due(self.step):
+                self.checkpointer.save(self.snapshot())
+            
             return new_id
             
         except Exception as e:
             self.finished = True
             self.accepted = False
             self.result_message = f"Error en paso {self.step}: {e}"
+            self.halt_reason = HaltReason.ERROR
             return None
     
+    def snapshot(self) -> SimulationSnapshot:
+        """
+        Toma una instantánea de la configuración actual
+        
+        Returns:
+            Instancia de SimulationSnapshot
+        """
+        if self._fingerprint is None:
+            self._fingerprint = self.turing_machine.get_fingerprint()
+        return SimulationSnapshot.capture(self.turing_machine, self.input_string, self.current_state,
+                                          self.step, self.tape, self.budget.to_dict(), self._elapsed_now(),
+                                          self._fingerprint)
+    
+    def _elapsed_now(self) -> float:
+        """Segundos simulados, incluida la llamada en curso"""
+        if self._resumed_at is None:
+            return self.elapsed
+        return self.elapsed + time.perf_counter() - self._resumed_at
+    
+    @classmethod
+    def from_snapshot(cls, turing_machine: TuringMachine, snapshot: SimulationSnapshot,
+                      max_steps: int = 10000, use_analysis: bool = True,
+                      analysis: Optional[MachineAnalysis] = None,
+                      checkpointer: Optional[Checkpointer] = None) -> 'StepByStepSimulation':
+        """
+        Reanuda una simulación paso a paso desde una instantánea
+        
+        Args:
+            turing_machine: La Máquina de Turing con la que se tomó la instantánea
+            snapshot: Instantánea a reanudar
+            max_steps: Número máximo de pasos si el presupuesto no define uno
+            use_analysis: Si se rechaza al entrar a un estado muerto
+            analysis: Análisis estático ya calculado (opcional)
+            checkpointer: Guarda nuevas instantáneas durante la reanudación
+            
+        Returns:
+            Instancia de StepByStepSimulation; el historial empieza en la ID reanudada
+            
+        Raises:
+            SimulationError: Si la instantánea no corresponde a la MT
+        """
+        snapshot.check_machine(turing_machine)
+        budget = StepBudget.from_dict(snapshot.budget) if snapshot.budget is not None else None
+        simulation = cls(turing_machine, snapshot.input_string, max_steps, use_analysis,
+                         analysis, budget, checkpointer)
+        
+        simulation.current_state = snapshot.state
+        simulation.tape = snapshot.restore_tape()
+        simulation.step = snapshot.step
+        simulation.elapsed = snapshot.elapsed
+        simulation.ids = [InstantaneousDescription(simulation.current_state, simulation.tape, simulation.step)]
+        return simulation
+    
+    def run_until(self, points: Union[CompiledBreakpoints, Iterable[Union[Breakpoint, Watchpoint]]]) -> Optional[Union[Breakpoint, Watchpoint]]:
+        """
+        Ejecuta a velocidad completa hasta que se cumpla un punto de
+        interrupción u observación, o hasta que la simulación termine
+        
+        Los puntos se compilan en compuertas (ver CompiledBreakpoints) que el
+        ciclo interno consulta con una búsqueda o comparación por paso. Los
+        pasos intermedios no generan IDs: solo se agrega la ID del punto donde
+        se detiene. Un punto de interrupción no se vuelve a cumplir en la
+        misma configuración en la que detuvo la llamada anterior. Los puntos
+        se evalúan en toda configuración alcanzada, incluidas las de parada
+        (aceptación, estado muerto o sin transición).
+        
+        Args:
+            points: Puntos de interrupción y observación (o ya compilados)
+            
+        Returns:
+            Punto que detuvo la ejecución, o None si la simulación terminó
+        """
+        if self.finished:
+            return None
+        compiled = points if isinstance(points, CompiledBreakpoints) else CompiledBreakpoints(points)
+        by_state = compiled.by_state
+        by_symbol = compiled.by_symbol
+        step_threshold = compiled.step_threshold
+        head_low, head_high = compiled.head_low, compiled.head_high
+        check_head = head_low is not None
+        watch_cells = compiled.watch_cells
+        
+        tape = self.tape
+        row = self.turing_machine.state_rows[self.current_state]
+        dead_states = self._dead_states
+        step_limit = self.max_steps
+        tape_limit = self._tape_limit
+        # Un punto de observación puede detener la llamada anterior en el mismo
+        # paso en que la cinta superó su límite: next_step registra la parada
+        if tape_limit is not None and len(tape.tape) > tape_limit:
+            self.next_step()
+            return None
+        self._resumed_at = time.perf_counter()
+        deadline = None
+        if self.budget.time_limit is not None:
+            deadline = self._resumed_at + self.budget.time_limit - self.elapsed
+        checkpointer = self.checkpointer
+        start_step = step = self.step
+        skip_check = self._stopped_at == step
+        transition = None
+        hit = None
+        
+        try:
+            while step < step_limit:
+                symbol = tape.read()
+                
+                # Compuertas de los puntos de interrupción (antes de ejecutar el
+                # paso y antes de las condiciones de parada)
+                if skip_check:
+                    skip_check = False
+                elif ((by_state and row.name in by_state) or (by_symbol and symbol in by_symbol) or
+                      (step_threshold is not None and step >= step_threshold) or
+                      (check_head and head_low <= tape.head_position - tape.left_expansions <= head_high)):
+                    hit = compiled.check(row.name, symbol, tape.head_position - tape.left_expansions, step)
+                    if hit is not None:
+                        break
+                
+                if row.is_accept or row.name in dead_states:
+                    break
+                entry = row.symbols.get(symbol)
+                if entry is None:
+                    break
+                row, write_symbol, move_direction, transition = entry
+                cell = tape.head_position - tape.left_expansions
+                tape.write(write_symbol)
+                tape.move(move_direction)
+                step += 1
+                
+                # Puntos de observación (después de escribir)
+                if watch_cells and cell in watch_cells:
+                    hit = compiled.watched(cell, symbol, write_symbol)
+                    if hit is not None:
+                        break
+                
+                if tape_limit is not None and len(tape.tape) > tape_limit:
+                    break
+                if deadline is not None and step % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+                    break
+                if checkpointer is not None and checkpointer.due(step):
+                    self.step, self.current_state = step, row.name
+                    checkpointer.save(self.snapshot())
+        except Exception as e:
+            self.finished = True
+            self.accepted = False
+            self.result_message = f"Error en paso {step}: {e}"
+            self.halt_reason = HaltReason.ERROR
+            return None
+        finally:
+            self.step = step
+            self.current_state = row.name
+            self.elapsed += time.perf_counter() - self._resumed_at
+            self._resumed_at = None
+        
+        if step != start_step:
+            self.ids.append(InstantaneousDescription(self.current_state, self.tape, step, transition))
+        
+        if hit is None:
+            # La configuración cumple una condición de parada: next_step la registra
+            self.next_step()
+            return None
+        
+        hit.hits += 1
+        self.last_hit = hit
+        self._stopped_at = step if isinstance(hit, Breakpoint) else None
+        return hit
+    
     def run_to_completion(self) -> Tuple[bool, List[InstantaneousDescription], str]:
         """
         Ejecuta la simulación hasta completarse
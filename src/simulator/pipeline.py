@@ -0,0 +1,180 @@
+"""
+Encadenamiento de Máquinas de Turing (la cinta final de una es la entrada de la siguiente)
+"""
+
+from typing import Dict, List, Optional
+from ..models.turing_machine import TuringMachine
+from ..models.tape import Tape
+from ..models.budget import StepBudget
+from .mt_simulator import MTSimulator
+from .simulation_result import SimulationResult
+
+
+class PipelineStage:
+    """
+    Una etapa del pipeline: la MT y cómo preparar la cinta que recibe
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, symbol_map: Optional[Dict[str, Optional[str]]] = None,
+                 keep_output_only: bool = False, reset_head: bool = True,
+                 max_steps: int = 10000, budget: Optional[StepBudget] = None):
+        """
+        Inicializa la etapa
+        
+        Args:
+            turing_machine: MT de la etapa
+            symbol_map: Reemplazo de símbolos de la cinta recibida; un valor
+                        None elimina la celda
+            keep_output_only: Si se conservan solo los símbolos del alfabeto de
+                              entrada de la MT anterior (como get_output)
+            reset_head: Si el cabezal vuelve a la primera celda no blanca
+            max_steps: Límite de pasos de la etapa
+            budget: Presupuesto de la etapa (por defecto el de la MT)
+        """
+        self.turing_machine = turing_machine
+        self.symbol_map = symbol_map or {}
+        self.keep_output_only = keep_output_only
+        self.reset_head = reset_head
+        self.simulator = MTSimulator(turing_machine, max_steps, budget=budget)
+    
+    def prepare(self, tape: Tape, previous: TuringMachine) -> None:
+        """
+        Adapta en el lugar la cinta final de la etapa anterior
+        
+        Las celdas se transforman dentro de la misma lista, sin pasar por
+        strings; el blanco de la MT anterior se traduce al de esta etapa.
+        
+        Args:
+            tape: Cinta final de la etapa anterior
+            previous: MT de la etapa anterior
+        """
+        blank = self.turing_machine.blank_symbol
+        mapping = {previous.blank_symbol: blank}
+        if self.keep_output_only:
+            for symbol in set(tape.tape) - previous.input_alphabet:
+                mapping[symbol] = None
+        mapping.update(self.symbol_map)
+        
+        cells = tape.tape
+        head = tape.head_position
+        if any(key != value for key, value in mapping.items()):
+            get = mapping.get
+            mapped = [get(symbol, symbol) for symbol in cells]
+            if None in mapping.values():
+                # Eliminar celdas: el cabezal conserva su celda o la siguiente que quede
+                head -= mapped[:head].count(None)
+                mapped = [symbol for symbol in mapped if symbol is not None]
+            cells[:] = mapped
+        
+        if not cells:
+            cells.append(blank)
+        tape.blank_symbol = blank
+        tape.left_expansions = 0
+        
+        if self.reset_head:
+            head = next((index for index, symbol in enumerate(cells) if symbol != blank), 0)
+        tape.head_position = min(max(head, 0), len(cells) - 1)
+
+
+class PipelineResult:
+    """
+    Resultado de ejecutar un pipeline
+    """
+    
+    def __init__(self, input_string: str, stages: List[SimulationResult], tape: Optional[Tape],
+                 total_stages: int):
+        """
+        Args:
+            input_string: Cadena de entrada de la primera etapa
+            stages: Resultado de cada etapa ejecutada; la cinta de las etapas
+                    intermedias pasó a la siguiente, por lo que no se conserva
+            tape: Cinta final de la última etapa ejecutada (si una etapa rechazó
+                  la cinta recibida, esa cinta tal como se le entregó)
+            total_stages: Número de etapas del pipeline
+        """
+        self.input_string = input_string
+        self.stages = stages
+        self.tape = tape
+        self.total_stages = total_stages
+    
+    @property
+    def accepted(self) -> bool:
+        """Si todas las etapas se completaron y la última aceptó"""
+        return self.completed and self.stages[-1].accepted
+    
+    @property
+    def completed(self) -> bool:
+        """Si se ejecutaron todas las etapas"""
+        return len(self.stages) == self.total_stages
+    
+    @property
+    def steps(self) -> int:
+        """Pasos totales de todas las etapas"""
+        return sum(result.steps for result in self.stages)
+    
+    @property
+    def tape_content(self) -> str:
+        """Contenido de la cinta final"""
+        return self.tape.get_tape_content() if self.tape is not None else ""
+    
+    def __repr__(self) -> str:
+        return (f"PipelineResult(input='{self.input_string}', stages={len(self.stages)}, "
+                f"accepted={self.accepted}, steps={self.steps})")
+
+
+class Pipeline:
+    """
+    Ejecuta N MT en cadena pasando la cinta final de cada una a la siguiente
+    
+    No se generan trazas ni se reconstruyen strings entre etapas: la misma
+    lista de celdas se transforma en el lugar (PipelineStage.prepare) y se
+    entrega con MTSimulator.run(initial_tape=...).
+    """
+    
+    def __init__(self, stages: List[PipelineStage], require_accept: bool = True):
+        """
+        Inicializa el pipeline
+        
+        Args:
+            stages: Etapas en orden de ejecución
+            require_accept: Si una etapa que no acepta detiene el pipeline
+        """
+        self.stages = stages
+        self.require_accept = require_accept
+    
+    def run(self, input_string: str) -> PipelineResult:
+        """
+        Ejecuta todas las etapas
+        
+        Args:
+            input_string: Cadena de entrada de la primera etapa
+        
+        Returns:
+            Instancia de PipelineResult
+        """
+        results = []
+        tape = None
+        previous = None
+        for index, stage in enumerate(self.stages):
+            if tape is None:
+                result = stage.simulator.run(input_string, record_trace=False)
+            else:
+                stage.prepare(tape, previous)
+                result = stage.simulator.run(f"<cinta de la etapa {index}>", record_trace=False,
+                                             initial_tape=tape)
+            
+            if result.tape is None:
+                # La etapa no llegó a ejecutarse: se conserva la cinta que rechazó
+                results.append(result)
+                break
+            if results:
+                # La cinta de la etapa anterior ahora pertenece a esta
+                results[-1].tape = None
+            results.append(result)
+            tape = result.tape
+            previous = stage.turing_machine
+            
+            if self.require_accept and not result.accepted:
+                break
+        
+        return PipelineResult(input_string, results, tape, len(self.stages))
@@ -0,0 +1,372 @@
+"""
+Motor experimental que simula una sola ejecución larga saltando segmentos de cinta
+
+La cinta se divide en segmentos de tamaño fijo. Para cada (contenido del
+segmento, estado, posición de entrada) se calcula un "resumen transductor":
+el estado y el lado por el que el cabezal sale del segmento, el contenido
+reescrito y el número de pasos. Mientras el cabezal entra a segmentos ya
+resumidos, el ciclo principal avanza un segmento completo por consulta.
+
+Los resúmenes de los segmentos iniciales (y de los segmentos reescritos) se
+calculan de forma especulativa en procesos trabajadores.
+
+Un resumen guardado no se usa si cruzaría el límite de pasos o el de
+crecimiento de la cinta: ese segmento se vuelve a simular en serie con los
+límites, para detenerse en el mismo paso que MTSimulator.
+"""
+
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.tape import Tape
+from ..models.budget import StepBudget
+from ..analysis.graph_analysis import analyze_machine
+from .mt_simulator import resolve_step_limit
+from .simulation_result import SimulationResult, HaltReason
+
+
+# Tipos de resumen
+EXIT = 'exit'
+ACCEPT = 'accept'
+DEAD = 'dead'
+NO_TRANSITION = 'no_transition'
+LIMIT = 'limit'
+TAPE_LIMIT = 'tape_limit'
+
+# Resumen: (tipo, estado, posición final, contenido, pasos, posición mínima, posición máxima)
+# La posición final es -1 o el tamaño del segmento cuando el cabezal sale de él.
+Summary = Tuple[str, str, int, Tuple[str, ...], int, int, int]
+
+# Tabla δ compacta: (estado, símbolo) -> (siguiente, escritura, desplazamiento)
+DeltaTable = Dict[Tuple[str, str], Tuple[str, str, int]]
+
+MOVE_OFFSETS = {'L': -1, 'R': 1, 'S': 0}
+
+
+def build_delta_table(turing_machine: TuringMachine) -> DeltaTable:
+    """
+    Construye la tabla δ compacta de una MT de una cinta
+    
+    Args:
+        turing_machine: La Máquina de Turing
+    
+    Returns:
+        Diccionario (estado, símbolo) -> (siguiente, escritura, desplazamiento)
+    """
+    return {
+        (transition.from_state, transition.read_symbols[0]):
+            (transition.to_state, transition.write_symbols[0], MOVE_OFFSETS[transition.move])
+        for transition in turing_machine.transitions
+    }
+
+
+def run_segment(delta: DeltaTable, accept_states: FrozenSet[str], dead_states: FrozenSet[str],
+                contents: Tuple[str, ...], state: str, offset: int, max_steps: int,
+                tape_limit: Optional[int] = None, tape_low: int = 0, tape_high: int = 0) -> Summary:
+    """
+    Simula dentro de un segmento hasta que el cabezal sale, la MT se detiene o
+    se agotan los pasos
+    
+    Las comprobaciones siguen el mismo orden que MTSimulator.run para que los
+    conteos de pasos coincidan exactamente.
+    
+    Args:
+        delta: Tabla δ compacta
+        accept_states: Estados de aceptación
+        dead_states: Estados muertos con transiciones (rechazo inmediato)
+        contents: Contenido del segmento
+        state: Estado al entrar
+        offset: Posición del cabezal dentro del segmento
+        max_steps: Pasos máximos a simular
+        tape_limit: Celdas máximas de la cinta completa (None = sin límite)
+        tape_low: Primera celda ya usada de la cinta, relativa al segmento
+        tape_high: Última celda ya usada de la cinta, relativa al segmento
+    
+    Returns:
+        Resumen de la ejecución local
+    """
+    cells = list(contents)
+    size = len(cells)
+    low = high = offset
+    steps = 0
+    kind = LIMIT
+    
+    while steps < max_steps:
+        if state in accept_states:
+            kind = ACCEPT
+            break
+        if state in dead_states:
+            kind = DEAD
+            break
+        entry = delta.get((state, cells[offset]))
+        if entry is None:
+            kind = NO_TRANSITION
+            break
+        state, cells[offset], move = entry
+        offset += move
+        steps += 1
+        if offset < low:
+            low = offset
+        elif offset > high:
+            high = offset
+        if tape_limit is not None and max(tape_high, high) - min(tape_low, low) + 1 > tape_limit:
+            kind = TAPE_LIMIT
+            break
+        if offset < 0 or offset >= size:
+            kind = EXIT
+            break
+    
+    return kind, state, offset, tuple(cells), steps, low, high
+
+
+# Datos de la MT en cada proceso trabajador
+_worker_machine: Optional[tuple] = None
+
+
+def _init_worker(delta: DeltaTable, accept_states: FrozenSet[str], dead_states: FrozenSet[str],
+                 states: Tuple[str, ...], local_step_cap: int) -> None:
+    """Guarda la tabla δ en el proceso trabajador"""
+    global _worker_machine
+    _worker_machine = (delta, accept_states, dead_states, states, local_step_cap)
+
+
+def _summarize_segment(contents: Tuple[str, ...]) -> List[Tuple[tuple, Summary]]:
+    """Calcula los resúmenes de un segmento para todos los estados y ambos bordes"""
+    delta, accept_states, dead_states, states, local_step_cap = _worker_machine
+    summaries = []
+    for state in states:
+        for offset in {0, len(contents) - 1}:
+            key = (contents, state, offset)
+            summaries.append((key, run_segment(delta, accept_states, dead_states,
+                                               contents, state, offset, local_step_cap)))
+    return summaries
+
+
+class SegmentedSimulator:
+    """
+    Simulador de una sola entrada muy larga mediante resúmenes de segmentos
+    
+    Produce el mismo veredicto, número de pasos, cinta final y posición del
+    cabezal que MTSimulator.run, sin registrar IDs. Los límites de pasos y de
+    crecimiento de la cinta son exactos; el de tiempo se comprueba al cruzar
+    segmentos.
+    
+    Con workers > 0 el pool de procesos se crea en la primera ejecución y se
+    reutiliza en las siguientes; close() (o salir del bloque with) lo cierra.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, max_steps: int = 10000,
+                 use_analysis: bool = True, budget: Optional[StepBudget] = None,
+                 segment_size: int = 64, workers: int = 0,
+                 local_step_cap: int = 100000, cache_limit: int = 200000):
+        """
+        Inicializa el simulador segmentado
+        
+        Args:
+            turing_machine: La Máquina de Turing a simular
+            max_steps: Límite de pasos si el presupuesto no define uno
+            use_analysis: Si se rechaza al entrar a un estado muerto
+            budget: Presupuesto de ejecución; por defecto el declarado en la MT
+            segment_size: Celdas por segmento
+            workers: Procesos para precalcular resúmenes (0 = sin especulación)
+            local_step_cap: Pasos máximos dentro de un segmento antes de
+                            renunciar a resumirlo (bucles internos)
+            cache_limit: Número máximo de resúmenes guardados
+        """
+        if segment_size < 1:
+            raise ValueError("El tamaño de segmento debe ser al menos 1")
+        
+        self.turing_machine = turing_machine
+        self.max_steps = max_steps
+        self.budget = budget or turing_machine.budget or StepBudget()
+        self.segment_size = segment_size
+        self.workers = workers
+        self.local_step_cap = local_step_cap
+        self.cache_limit = cache_limit
+        
+        self.delta = build_delta_table(turing_machine)
+        self.accept_states = frozenset(turing_machine.accept_states)
+        dead = analyze_machine(turing_machine).wandering_states if use_analysis else set()
+        self.dead_states = frozenset(dead)
+        self._summary_states = tuple(name for name in turing_machine.states
+                                     if name not in self.accept_states and name not in self.dead_states)
+        
+        self.cache: Dict[tuple, Summary] = {}
+        self.hits = 0
+        self.misses = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    def close(self) -> None:
+        """Cierra el pool de procesos trabajadores, si se creó"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+    
+    def __enter__(self) -> 'SegmentedSimulator':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def run(self, input_string: str) -> SimulationResult:
+        """
+        Simula una cadena saltando segmentos resumidos
+        
+        Args:
+            input_string: Cadena de entrada
+        
+        Returns:
+            Instancia de SimulationResult (sin IDs)
+        """
+        turing_machine = self.turing_machine
+        if not turing_machine.validate_input(input_string):
+            invalid_symbols = [s for s in input_string if s not in turing_machine.input_alphabet]
+            return SimulationResult(input_string, False, HaltReason.INVALID_INPUT, 0,
+                                    f"Cadena rechazada: contiene símbolos inválidos {invalid_symbols}")
+        
+        size = self.segment_size
+        blank = turing_machine.blank_symbol
+        blank_segment = (blank,) * size
+        
+        # Segmentos iniciales
+        initial_length = max(1, len(input_string))
+        padded = list(input_string) or [blank]
+        padded += [blank] * (-len(padded) % size)
+        segments: Dict[int, Tuple[str, ...]] = {
+            index: tuple(padded[index * size:(index + 1) * size])
+            for index in range(len(padded) // size)
+        }
+        
+        pool = None
+        pending: Dict[Tuple[str, ...], Future] = {}
+        if self.workers > 0:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                 initargs=(self.delta, self.accept_states, self.dead_states,
+                                                           self._summary_states, self.local_step_cap))
+            pool = self._pool
+            for contents in set(segments.values()):
+                pending[contents] = pool.submit(_summarize_segment, contents)
+        
+        step_limit, limit_reason, limit_message = resolve_step_limit(
+            self.budget, len(input_string), self.max_steps)
+        deadline = None
+        if self.budget.time_limit is not None:
+            deadline = time.perf_counter() + self.budget.time_limit
+        tape_limit = None
+        if self.budget.max_tape_growth is not None:
+            tape_limit = initial_length + self.budget.max_tape_growth
+        
+        state = turing_machine.initial_state
+        position = 0
+        step = 0
+        leftmost = 0
+        rightmost = initial_length - 1
+        
+        try:
+            while True:
+                index, offset = divmod(position, size)
+                contents = segments.get(index, blank_segment)
+                key = (contents, state, offset)
+                
+                summary = self._lookup(key, pending)
+                if summary is None:
+                    self.misses += 1
+                    summary = run_segment(self.delta, self.accept_states, self.dead_states,
+                                          contents, state, offset, self.local_step_cap)
+                    self._store(key, summary)
+                else:
+                    self.hits += 1
+                
+                # El resumen no se puede usar si cruza el límite de pasos o el de
+                # la cinta: simular en serie deteniéndose en el paso exacto
+                base = index * size
+                if (summary[0] == LIMIT or step + summary[4] >= step_limit or
+                        (tape_limit is not None and
+                         max(rightmost, base + summary[6]) - min(leftmost, base + summary[5]) + 1 > tape_limit)):
+                    summary = run_segment(self.delta, self.accept_states, self.dead_states,
+                                          contents, state, offset, step_limit - step,
+                                          tape_limit, leftmost - base, rightmost - base)
+                
+                kind, state, offset, new_contents, steps, low, high = summary
+                step += steps
+                leftmost = min(leftmost, base + low)
+                rightmost = max(rightmost, base + high)
+                position = base + offset
+                
+                if new_contents != contents:
+                    segments[index] = new_contents
+                    if pool is not None and new_contents not in pending:
+                        pending[new_contents] = pool.submit(_summarize_segment, new_contents)
+                
+                if kind != EXIT:
+                    break
+                
+                if deadline is not None and time.perf_counter() > deadline:
+                    kind = HaltReason.TIME_LIMIT
+                    break
+        finally:
+            # Los resúmenes especulativos de esta cadena ya no se esperan; el pool sigue abierto
+            for future in pending.values():
+                if future is not None:
+                    future.cancel()
+        
+        tape = self._build_tape(segments, blank, leftmost, rightmost, position)
+        
+        if kind == ACCEPT:
+            return SimulationResult(input_string, True, HaltReason.ACCEPTED, step,
+                                    f"Cadena ACEPTADA en {step} pasos", state, tape)
+        if kind == DEAD:
+            return SimulationResult(input_string, False, HaltReason.DEAD_STATE, step,
+                                    f"Cadena RECHAZADA: el estado '{state}' no puede alcanzar un estado de aceptación (paso {step})",
+                                    state, tape)
+        if kind == NO_TRANSITION:
+            return SimulationResult(input_string, False, HaltReason.NO_TRANSITION, step,
+                                    f"Cadena RECHAZADA: No hay transición desde estado '{state}' leyendo '{tape.read()}' en paso {step}",
+                                    state, tape)
+        if kind == TAPE_LIMIT:
+            return SimulationResult(input_string, False, HaltReason.TAPE_LIMIT, step,
+                                    f"Simulación detenida: la cinta creció más de {self.budget.max_tape_growth} celdas en paso {step}",
+                                    state, tape)
+        if kind == HaltReason.TIME_LIMIT:
+            return SimulationResult(input_string, False, HaltReason.TIME_LIMIT, step,
+                                    f"Simulación detenida: se superó el límite de {self.budget.time_limit} s en paso {step}",
+                                    state, tape)
+        return SimulationResult(input_string, False, limit_reason, step, limit_message, state, tape)
+    
+    def _lookup(self, key: tuple, pending: Dict[Tuple[str, ...], Future]) -> Optional[Summary]:
+        """Busca un resumen en la caché, incorporando los cálculos especulativos terminados"""
+        summary = self.cache.get(key)
+        if summary is not None:
+            return summary
+        
+        future = pending.get(key[0])
+        if future is not None and future.done() and not future.cancelled():
+            for computed_key, computed in future.result():
+                self._store(computed_key, computed)
+            pending[key[0]] = None
+            return self.cache.get(key)
+        return None
+    
+    def _store(self, key: tuple, summary: Summary) -> None:
+        """Guarda un resumen respetando el tamaño máximo de la caché"""
+        if len(self.cache) >= self.cache_limit:
+            self.cache.clear()
+        self.cache[key] = summary
+    
+    def _build_tape(self, segments: Dict[int, Tuple[str, ...]], blank: str,
+                    leftmost: int, rightmost: int, position: int) -> Tape:
+        """Reconstruye una Tape equivalente a la de MTSimulator"""
+        size = self.segment_size
+        cells = []
+        for absolute in range(leftmost, rightmost + 1):
+            index, offset = divmod(absolute, size)
+            contents = segments.get(index)
+            cells.append(contents[offset] if contents is not None else blank)
+        
+        tape = Tape("", blank)
+        tape.tape = cells
+        tape.head_position = position - leftmost
+        tape.left_expansions = -leftmost
+        return tape
@@ -0,0 +1,143 @@
+"""
+Espacios de memoria compartida para los procesos trabajadores del modo por lotes
+"""
+
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class SharedArena:
+    """
+    Bloque de multiprocessing.shared_memory dividido en dos zonas: las cadenas
+    de entrada empaquetadas (UTF-8, una tras otra) y espacios de tamaño fijo
+    donde los trabajadores escriben la cinta final de cada trabajo.
+    
+    El proceso principal crea el espacio (antes de lanzar los trabajadores)
+    y lo reutiliza entre ventanas de trabajos mientras quepan; los
+    trabajadores solo se conectan por nombre.
+    """
+    
+    def __init__(self, input_capacity: int, slot_count: int, slot_size: int):
+        """
+        Crea el espacio de memoria compartida
+        
+        Args:
+            input_capacity: Bytes reservados para las cadenas de entrada
+            slot_count: Número de espacios de cinta
+            slot_size: Bytes por espacio de cinta
+        """
+        self.input_capacity = max(1, input_capacity)
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.memory = shared_memory.SharedMemory(
+            create=True, size=self.input_capacity + slot_count * slot_size)
+    
+    @property
+    def name(self) -> str:
+        """Nombre con el que se conectan los trabajadores"""
+        return self.memory.name
+    
+    def fits(self, input_bytes: int, slot_count: int) -> bool:
+        """Indica si una ventana de trabajos cabe en este espacio"""
+        return input_bytes <= self.input_capacity and slot_count <= self.slot_count
+    
+    def pack_inputs(self, encoded_inputs: Sequence[bytes]) -> List[Tuple[int, int]]:
+        """
+        Escribe las cadenas de entrada una sola vez en la zona de entradas
+        
+        Args:
+            encoded_inputs: Cadenas ya codificadas en UTF-8
+            
+        Returns:
+            Lista de (desplazamiento, longitud) de cada cadena
+        """
+        buffer = self.memory.buf
+        locations = []
+        offset = 0
+        for encoded in encoded_inputs:
+            buffer[offset:offset + len(encoded)] = encoded
+            locations.append((offset, len(encoded)))
+            offset += len(encoded)
+        return locations
+    
+    def read_tape(self, slot: int, length: int) -> str:
+        """
+        Lee la cinta final que un trabajador dejó en un espacio
+        
+        Args:
+            slot: Índice del espacio
+            length: Bytes escritos por el trabajador
+            
+        Returns:
+            Contenido de la cinta
+        """
+        start = self.input_capacity + slot * self.slot_size
+        return bytes(self.memory.buf[start:start + length]).decode('utf-8')
+    
+    def close(self) -> None:
+        """Libera el espacio (solo desde el proceso que lo creó)"""
+        self.memory.close()
+        self.memory.unlink()
+
+
+class ArenaView:
+    """
+    Conexión de un proceso trabajador a un SharedArena existente
+    """
+    
+    def __init__(self, name: str, input_capacity: int, slot_size: int):
+        """
+        Se conecta a un espacio por nombre
+        
+        Args:
+            name: Nombre del espacio (SharedArena.name)
+            input_capacity: Tamaño de la zona de entradas
+            slot_size: Bytes por espacio de cinta
+        """
+        self.name = name
+        self.input_capacity = input_capacity
+        self.slot_size = slot_size
+        # Antes de Python 3.13 la conexión también registra el espacio en el
+        # resource_tracker; como el primer SharedArena se crea antes que los
+        # trabajadores, todos comparten el del proceso principal y el registro
+        # duplicado se descarta
+        self.memory = shared_memory.SharedMemory(name=name)
+    
+    def read_input(self, offset: int, length: int) -> str:
+        """Lee una cadena de entrada directamente de la memoria compartida"""
+        return bytes(self.memory.buf[offset:offset + length]).decode('utf-8')
+    
+    def slot(self, index: int) -> memoryview:
+        """Retorna la vista del espacio de cinta indicado"""
+        start = self.input_capacity + index * self.slot_size
+        return self.memory.buf[start:start + self.slot_size]
+    
+    def close(self) -> None:
+        """Cierra la conexión sin eliminar el espacio"""
+        self.memory.close()
+
+
+# Conexión abierta en cada proceso trabajador (se cambia cuando el espacio crece)
+_views: Dict[str, ArenaView] = {}
+
+
+def attach(name: str, input_capacity: int, slot_size: int) -> ArenaView:
+    """
+    Retorna la conexión del proceso actual al espacio indicado, abriéndola
+    la primera vez y cerrando la de un espacio anterior
+    
+    Args:
+        name: Nombre del espacio
+        input_capacity: Tamaño de la zona de entradas
+        slot_size: Bytes por espacio de cinta
+        
+    Returns:
+        Instancia de ArenaView
+    """
+    view: Optional[ArenaView] = _views.get(name)
+    if view is None:
+        for old_view in _views.values():
+            old_view.close()
+        _views.clear()
+        view = _views[name] = ArenaView(name, input_capacity, slot_size)
+    return view
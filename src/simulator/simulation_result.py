@@ -0,0 +1,69 @@
+"""
+Resultado compacto de una simulación de Máquina de Turing
+"""
+
+from enum import Enum
+from typing import List, Optional
+from ..models.tape import Tape
+from .instantaneous_description import InstantaneousDescription
+
+
+class HaltReason(Enum):
+    """Motivo por el que se detuvo una simulación"""
+    ACCEPTED = 'accepted'
+    NO_TRANSITION = 'no_transition'
+    DEAD_STATE = 'dead_state'
+    INVALID_INPUT = 'invalid_input'
+    MAX_STEPS = 'max_steps'
+    STEP_BUDGET = 'step_budget'
+    TIME_LIMIT = 'time_limit'
+    TAPE_LIMIT = 'tape_limit'
+    ERROR = 'error'
+
+
+class SimulationResult:
+    """
+    Resultado de simular una cadena: veredicto, motivo de parada y cinta final
+    
+    Las IDs solo se guardan si la simulación se ejecutó con traza.
+    """
+    
+    def __init__(self, input_string: str, accepted: bool, halt_reason: HaltReason,
+                 steps: int, message: str, final_state: Optional[str] = None,
+                 tape: Optional[Tape] = None,
+                 ids: Optional[List[InstantaneousDescription]] = None):
+        """
+        Inicializa el resultado
+        
+        Args:
+            input_string: Cadena de entrada simulada
+            accepted: True si la cadena fue aceptada
+            halt_reason: Motivo de parada
+            steps: Número de pasos ejecutados
+            message: Descripción del resultado
+            final_state: Estado en el que se detuvo la MT
+            tape: Cinta final (None si la entrada era inválida)
+            ids: Descripciones instantáneas registradas
+        """
+        self.input_string = input_string
+        self.accepted = accepted
+        self.halt_reason = halt_reason
+        self.steps = steps
+        self.message = message
+        self.final_state = final_state
+        self.tape = tape
+        self.ids = ids if ids is not None else []
+    
+    @property
+    def tape_content(self) -> str:
+        """Contenido final de la cinta"""
+        return self.tape.get_tape_content() if self.tape is not None else ""
+    
+    @property
+    def head_position(self) -> int:
+        """Posición final del cabezal"""
+        return self.tape.head_position if self.tape is not None else 0
+    
+    def __repr__(self) -> str:
+        return (f"SimulationResult(input='{self.input_string}', accepted={self.accepted}, "
+                f"halt_reason={self.halt_reason.value}, steps={self.steps})")
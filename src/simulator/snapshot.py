@@ -0,0 +1,275 @@
+"""
+Instantáneas en disco de simulaciones en curso para poder reanudarlas
+"""
+
+import json
+import os
+import signal
+import struct
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+from ..models.turing_machine import TuringMachine
+from ..models.tape import Tape
+from ..utils.exceptions import SimulationError
+
+
+# Formato: MAGIC, longitud del encabezado (uint32), encabezado JSON y celdas codificadas
+MAGIC = b'MTSNAP1\n'
+
+
+class SimulationSnapshot:
+    """
+    Configuración completa de una simulación: estado, cinta, cabezal, pasos y presupuesto
+    """
+    
+    def __init__(self, machine_fingerprint: str, input_string: str, state: str, step: int,
+                 tape_cells: List[str], head_position: int, left_expansions: int,
+                 blank_symbol: str, budget: Optional[Dict[str, Any]] = None,
+                 elapsed: float = 0.0):
+        """
+        Inicializa la instantánea
+        
+        Args:
+            machine_fingerprint: Huella de la MT (TuringMachine.get_fingerprint)
+            input_string: Cadena de entrada original
+            state: Estado actual
+            step: Pasos ejecutados
+            tape_cells: Celdas de la cinta
+            head_position: Posición del cabezal en tape_cells
+            left_expansions: Celdas agregadas a la izquierda de la entrada
+            blank_symbol: Símbolo en blanco
+            budget: Presupuesto de ejecución (formato del bloque 'budget')
+            elapsed: Segundos de simulación consumidos hasta ahora
+        """
+        self.machine_fingerprint = machine_fingerprint
+        self.input_string = input_string
+        self.state = state
+        self.step = step
+        self.tape_cells = tape_cells
+        self.head_position = head_position
+        self.left_expansions = left_expansions
+        self.blank_symbol = blank_symbol
+        self.budget = budget
+        self.elapsed = elapsed
+    
+    @classmethod
+    def capture(cls, turing_machine: TuringMachine, input_string: str, state: str, step: int,
+                tape: Tape, budget: Optional[Dict[str, Any]] = None,
+                elapsed: float = 0.0, fingerprint: Optional[str] = None) -> 'SimulationSnapshot':
+        """
+        Toma una instantánea de una simulación en curso
+        
+        Args:
+            turing_machine: MT que se está simulando
+            input_string: Cadena de entrada original
+            state: Estado actual
+            step: Pasos ejecutados
+            tape: Cinta actual (no se copia: se codifica al guardar)
+            budget: Presupuesto de ejecución
+            elapsed: Segundos de simulación consumidos
+            fingerprint: Huella de la MT ya calculada; conviene pasarla en las
+                         capturas periódicas porque calcularla recorre toda la MT
+            
+        Returns:
+            Instancia de SimulationSnapshot
+        """
+        if fingerprint is None:
+            fingerprint = turing_machine.get_fingerprint()
+        return cls(fingerprint, input_string, state, step, tape.tape,
+                   tape.head_position, tape.left_expansions, tape.blank_symbol, budget, elapsed)
+    
+    def restore_tape(self) -> Tape:
+        """
+        Reconstruye la cinta guardada
+        
+        Returns:
+            Instancia de Tape
+        """
+        tape = Tape("", self.blank_symbol)
+        tape.tape = list(self.tape_cells)
+        tape.head_position = self.head_position
+        tape.left_expansions = self.left_expansions
+        return tape
+    
+    def check_machine(self, turing_machine: TuringMachine) -> None:
+        """
+        Verifica que la instantánea pertenezca a la MT indicada
+        
+        Args:
+            turing_machine: MT con la que se quiere reanudar
+            
+        Raises:
+            SimulationError: Si la MT no coincide
+        """
+        if turing_machine.get_fingerprint() != self.machine_fingerprint:
+            raise SimulationError("La instantánea fue tomada con una Máquina de Turing distinta")
+    
+    def save(self, file_path: str) -> None:
+        """
+        Guarda la instantánea de forma atómica
+        
+        Las celdas se codifican como índices en la tabla de símbolos (1 o 2
+        bytes por celda) y el buffer resultante se escribe directamente con
+        memoryview, sin pasar por JSON.
+        
+        Args:
+            file_path: Ruta del archivo destino
+        """
+        symbols = sorted(set(self.tape_cells) | {self.blank_symbol})
+        codes = {symbol: code for code, symbol in enumerate(symbols)}
+        buffer = array('B' if len(symbols) <= 256 else 'H', [codes[cell] for cell in self.tape_cells])
+        
+        header = json.dumps({
+            'machine_fingerprint': self.machine_fingerprint,
+            'input_string': self.input_string,
+            'state': self.state,
+            'step': self.step,
+            'head_position': self.head_position,
+            'left_expansions': self.left_expansions,
+            'blank_symbol': self.blank_symbol,
+            'budget': self.budget,
+            'elapsed': self.elapsed,
+            'symbols': symbols,
+            'typecode': buffer.typecode,
+            'cells': len(buffer),
+        }, ensure_ascii=False).encode('utf-8')
+        
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(MAGIC)
+            file.write(struct.pack('<I', len(header)))
+            file.write(header)
+            file.write(memoryview(buffer).cast('B'))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, file_path)
+    
+    @classmethod
+    def load(cls, file_path: str) -> 'SimulationSnapshot':
+        """
+        Carga una instantánea guardada con save()
+        
+        Args:
+            file_path: Ruta del archivo
+            
+        Returns:
+            Instancia de SimulationSnapshot
+            
+        Raises:
+            SimulationError: Si el archivo no es una instantánea válida
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                if file.read(len(MAGIC)) != MAGIC:
+                    raise SimulationError(f"{file_path} no es una instantánea de simulación")
+                (header_length,) = struct.unpack('<I', file.read(4))
+                header = json.loads(file.read(header_length).decode('utf-8'))
+                buffer = array(header['typecode'])
+                buffer.frombytes(file.read())
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            raise SimulationError(f"Error al leer la instantánea {file_path}: {e}")
+        
+        if len(buffer) != header['cells']:
+            raise SimulationError(f"La instantánea {file_path} está incompleta")
+        
+        symbols = header['symbols']
+        return cls(header['machine_fingerprint'], header['input_string'], header['state'],
+                   header['step'], [symbols[code] for code in buffer], header['head_position'],
+                   header['left_expansions'], header['blank_symbol'], header['budget'],
+                   header['elapsed'])
+    
+    def __repr__(self) -> str:
+        return (f"SimulationSnapshot(state='{self.state}', step={self.step}, "
+                f"cells={len(self.tape_cells)}, head_position={self.head_position})")
+
+
+class Checkpointer:
+    """
+    Decide cuándo guardar instantáneas: cada k pasos, cada t segundos o al
+    recibir una señal (opcional, p. ej. signal.SIGUSR1)
+    
+    Si se indica una señal, su manejador anterior se restaura con close() o
+    al salir del bloque with.
+    """
+    
+    def __init__(self, file_path: str, every_steps: Optional[int] = None,
+                 every_seconds: Optional[float] = None, signum: Optional[int] = None):
+        """
+        Inicializa el guardado periódico
+        
+        Args:
+            file_path: Archivo donde se guardan las instantáneas (se sobrescribe)
+            every_steps: Guardar cada k pasos (None = no)
+            every_seconds: Guardar cada t segundos (None = no)
+            signum: Señal que solicita una instantánea (None = ninguna); solo
+                    se instala desde el hilo principal
+        """
+        self.file_path = file_path
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.saved = 0
+        self._requested = False
+        self._last_save = time.perf_counter()
+        self._signum: Optional[int] = None
+        self._previous_handler = None
+        
+        if signum is not None:
+            try:
+                self._previous_handler = signal.signal(signum, self._on_signal)
+                self._signum = signum
+            except ValueError:
+                # signal.signal solo funciona en el hilo principal
+                pass
+    
+    def close(self) -> None:
+        """Restaura el manejador anterior de la señal, si se instaló uno"""
+        if self._signum is not None:
+            signal.signal(self._signum, self._previous_handler)
+            self._signum = None
+            self._previous_handler = None
+    
+    def __enter__(self) -> 'Checkpointer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _on_signal(self, signum, frame) -> None:
+        self._requested = True
+    
+    def request(self) -> None:
+        """Solicita una instantánea en el siguiente punto de control"""
+        self._requested = True
+    
+    def due(self, step: int, advanced: int = 1) -> bool:
+        """
+        Indica si corresponde guardar una instantánea en este paso
+        
+        Args:
+            step: Paso actual de la simulación
+            advanced: Pasos recorridos desde la consulta anterior (una cadena S
+                compuesta avanza varios de golpe y puede saltarse un múltiplo)
+            
+        Returns:
+            True si se debe guardar
+        """
+        if self._requested:
+            return True
+        if self.every_steps is not None and step % self.every_steps < advanced:
+            return True
+        if self.every_seconds is not None and step % 1024 < advanced:
+            return time.perf_counter() - self._last_save >= self.every_seconds
+        return False
+    
+    def save(self, snapshot: SimulationSnapshot) -> None:
+        """
+        Guarda una instantánea y reinicia los contadores
+        
+        Args:
+            snapshot: Instantánea a guardar
+        """
+        snapshot.save(self.file_path)
+        self.saved += 1
+        self._requested = False
+        self._last_save = time.perf_counter()
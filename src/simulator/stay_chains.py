@@ -0,0 +1,110 @@
+"""
+Composición de cadenas de transiciones con movimiento S
+
+Una transición con movimiento S vuelve a leer la misma celda en el paso
+siguiente, así que desde cada par (estado, símbolo) la secuencia de
+transiciones S es fija. Este preprocesamiento la sigue una sola vez y la
+reduce a una transición compuesta con su número de pasos; si la secuencia
+vuelve a un par ya visitado, la MT nunca se detiene a partir de ahí (ciclo S).
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.state import StateRow
+
+
+class StayChain:
+    """
+    Transición compuesta que resume una cadena de transiciones desde (estado, símbolo)
+    
+    Sin ciclo, aplicar la cadena equivale a escribir `write_symbol`, mover
+    según `move` y pasar a `row` tras `steps` pasos. Con ciclo, `links` guarda
+    el estado y el símbolo de la celda después de cada paso del prefijo y del
+    ciclo para ubicar la configuración en cualquier paso futuro.
+    """
+    
+    __slots__ = ('steps', 'row', 'write_symbol', 'move', 'links', 'cycle_start', 'cycle_length')
+    
+    def __init__(self, links: List[Tuple[StateRow, str, str]], cycle_start: Optional[int] = None):
+        """
+        Inicializa la cadena
+        
+        Args:
+            links: (fila siguiente, símbolo escrito, movimiento) de cada paso
+            cycle_start: Índice del primer paso del ciclo S (None si no hay ciclo)
+        """
+        self.links = links
+        self.steps = len(links)
+        self.row, self.write_symbol, self.move = links[-1]
+        self.cycle_start = cycle_start
+        self.cycle_length = len(links) - cycle_start if cycle_start is not None else 0
+    
+    @property
+    def is_cycle(self) -> bool:
+        """Si la cadena termina en un ciclo S (la MT no se detiene)"""
+        return self.cycle_start is not None
+    
+    def position_after(self, steps: int) -> Tuple[StateRow, str]:
+        """
+        Obtiene la fila del estado y el símbolo de la celda tras un número de pasos
+        
+        Args:
+            steps: Pasos ejecutados desde el inicio de la cadena (al menos 1)
+        
+        Returns:
+            Tupla con (fila, símbolo en la celda)
+        """
+        index = steps - 1
+        if index >= self.steps:
+            index = self.cycle_start + (index - self.cycle_start) % self.cycle_length
+        row, symbol, _ = self.links[index]
+        return row, symbol
+    
+    def __repr__(self) -> str:
+        kind = f"ciclo de {self.cycle_length}" if self.is_cycle else f"-> {self.row.name}"
+        return f"StayChain(steps={self.steps}, {kind})"
+
+
+def compose_stay_chains(turing_machine: TuringMachine,
+                        dead_states: FrozenSet[str] = frozenset()) -> Dict[Tuple[str, str], StayChain]:
+    """
+    Compone las cadenas S que empiezan en cada par (estado, símbolo) con movimiento S
+    
+    La cadena se corta antes de continuar desde un estado de aceptación, un
+    estado muerto o un par sin transición (el simulador debe detenerse ahí), e
+    incluye la primera transición con movimiento L o R como último paso.
+    
+    Args:
+        turing_machine: La Máquina de Turing (usa TuringMachine.state_rows)
+        dead_states: Estados en los que el simulador rechaza de inmediato
+    
+    Returns:
+        Diccionario (estado, símbolo) -> StayChain de los pares con movimiento S
+        cuya cadena tiene más de un paso o es un ciclo
+    """
+    chains = {}
+    for row in turing_machine.state_rows.values():
+        for symbol, entry in row.symbols.items():
+            if entry[2] != 'S':
+                continue
+            
+            visited = {(row.name, symbol): 0}
+            links = []
+            cycle_start = None
+            while True:
+                next_row, written, move, _ = entry
+                links.append((next_row, written, move))
+                if move != 'S' or next_row.is_accept or next_row.name in dead_states:
+                    break
+                entry = next_row.symbols.get(written)
+                if entry is None:
+                    break
+                key = (next_row.name, written)
+                if key in visited:
+                    cycle_start = visited[key]
+                    break
+                visited[key] = len(links)
+            
+            if len(links) > 1 or cycle_start is not None:
+                chains[(row.name, symbol)] = StayChain(links, cycle_start)
+    return chains
@@ -0,0 +1,261 @@
+"""
+Índices secundarios de una traza para consultarla sin volver a simular
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..models.turing_machine import TuringMachine
+from ..models.transition import Transition
+from ..utils.exceptions import SimulationError
+
+
+class TraceIndex:
+    """
+    Registra cada paso de una ejecución en columnas compactas e índices
+    
+    - estado -> tramos [inicio, fin] de pasos consecutivos en ese estado
+    - transición (índice en TuringMachine.transitions) -> pasos que la aplican
+    - bloque de posiciones del cabezal -> pasos con el cabezal en ese bloque
+    
+    El paso s describe la configuración después de s pasos, igual que las
+    IDs; la posición del cabezal es absoluta (0 = primer símbolo de la entrada).
+    Se llena pasando trace_index a MTSimulator.run.
+    """
+    
+    def __init__(self, turing_machine: TuringMachine, head_bucket_size: int = 64):
+        """
+        Inicializa un índice vacío
+        
+        Args:
+            turing_machine: MT cuya ejecución se va a registrar
+            head_bucket_size: Posiciones del cabezal agrupadas en cada bloque
+        """
+        self.turing_machine = turing_machine
+        self.head_bucket_size = head_bucket_size
+        self.state_names: List[str] = list(turing_machine.states)
+        self._state_codes = {name: code for code, name in enumerate(self.state_names)}
+        self._transition_numbers = {transition: number
+                                    for number, transition in enumerate(turing_machine.transitions)}
+        self._reset()
+    
+    def _reset(self) -> None:
+        """Vacía las columnas y los índices"""
+        self.first_step = 0
+        # Columnas por paso
+        self.states = array('H')
+        self.transitions = array('i')
+        self.heads = array('q')
+        # Índices secundarios
+        self._run_starts: Dict[int, array] = {}
+        self._run_ends: Dict[int, array] = {}
+        # Pasos del estado en los tramos anteriores a cada tramo (para estimar tamaños)
+        self._run_before: Dict[int, array] = {}
+        self._by_transition: Dict[int, array] = {}
+        self._by_bucket: Dict[int, array] = {}
+    
+    def __len__(self) -> int:
+        return len(self.states)
+    
+    @property
+    def last_step(self) -> int:
+        """Último paso registrado"""
+        return self.first_step + len(self.states) - 1
+    
+    def start(self, state: str, head: int, step: int = 0) -> None:
+        """
+        Registra la configuración inicial y reinicia el índice
+        
+        Args:
+            state: Estado inicial
+            head: Posición absoluta del cabezal
+            step: Número del primer paso (distinto de 0 al reanudar)
+        """
+        self._reset()
+        self.first_step = step
+        self._append(state, -1, head)
+    
+    def add(self, state: str, transition: Transition, head: int) -> None:
+        """
+        Registra el siguiente paso
+        
+        Args:
+            state: Estado después del paso
+            transition: Transición aplicada
+            head: Posición absoluta del cabezal después del paso
+        """
+        self._append(state, self._transition_numbers[transition], head)
+    
+    def _append(self, state: str, transition_number: int, head: int) -> None:
+        step = self.first_step + len(self.states)
+        code = self._state_codes[state]
+        if self.states and self.states[-1] == code:
+            self._run_ends[code][-1] = step
+        else:
+            starts = self._run_starts.setdefault(code, array('q'))
+            ends = self._run_ends.setdefault(code, array('q'))
+            before = self._run_before.setdefault(code, array('q'))
+            before.append(before[-1] + ends[-1] - starts[-1] + 1 if starts else 0)
+            starts.append(step)
+            ends.append(step)
+        self.states.append(code)
+        self.transitions.append(transition_number)
+        self.heads.append(head)
+        if transition_number >= 0:
+            self._by_transition.setdefault(transition_number, array('q')).append(step)
+        self._by_bucket.setdefault(head // self.head_bucket_size, array('q')).append(step)
+    
+    def get(self, step: int) -> Tuple[str, Optional[int], int]:
+        """
+        Obtiene el registro de un paso
+        
+        Args:
+            step: Número de paso
+        
+        Returns:
+            Tupla con (estado, número de transición aplicada o None, posición del cabezal)
+        """
+        index = step - self.first_step
+        if not 0 <= index < len(self.states):
+            raise SimulationError(f"El paso {step} no está en la traza")
+        transition_number = self.transitions[index]
+        return (self.state_names[self.states[index]],
+                transition_number if transition_number >= 0 else None, self.heads[index])
+    
+    def state_ranges(self, state: str) -> List[Tuple[int, int]]:
+        """
+        Tramos de pasos consecutivos en un estado
+        
+        Args:
+            state: Nombre del estado
+        
+        Returns:
+            Lista de (primer paso, último paso)
+        """
+        code = self._state_code(state)
+        return list(zip(self._run_starts.get(code, ()), self._run_ends.get(code, ())))
+    
+    def steps_with_transition(self, transition_number: int) -> List[int]:
+        """
+        Pasos que aplican una transición
+        
+        Args:
+            transition_number: Índice de la transición en TuringMachine.transitions
+        
+        Returns:
+            Lista ordenada de pasos
+        """
+        return list(self._by_transition.get(transition_number, ()))
+    
+    def find(self, state: Optional[str] = None, entering: bool = False,
+             transition: Optional[int] = None, head_min: Optional[int] = None,
+             head_max: Optional[int] = None, after: int = 0) -> Iterator[int]:
+        """
+        Itera en orden los pasos que cumplen todas las condiciones dadas
+        
+        Entre los índices aplicables (transición, entradas a un estado, tramos
+        del estado, bloques del cabezal) se recorre el que tiene menos
+        candidatos desde `after`, contados con búsquedas binarias; el resto de
+        las condiciones se comprueban en O(1) por candidato.
+        
+        Args:
+            state: Estado después del paso
+            entering: Solo pasos en los que se entra a `state` desde otro estado
+            transition: Índice de la transición aplicada
+            head_min: Posición mínima del cabezal (inclusive)
+            head_max: Posición máxima del cabezal (inclusive)
+            after: Primer paso a considerar
+        
+        Returns:
+            Iterador de números de paso
+        """
+        code = self._state_code(state) if state is not None else None
+        if entering and code is None:
+            raise SimulationError("entering requiere un estado")
+        
+        # (número de candidatos, generador) de cada índice aplicable
+        options = [(self.last_step + 1 - max(after, self.first_step),
+                    lambda: iter(range(max(after, self.first_step), self.last_step + 1)))]
+        if transition is not None:
+            steps = self._by_transition.get(transition, array('q'))
+            options.append((len(steps) - bisect_left(steps, after), lambda: self._tail(steps, after)))
+        if entering:
+            starts = self._run_starts.get(code, array('q'))
+            options.append((len(starts) - bisect_left(starts, after), lambda: self._tail(starts, after)))
+        elif code is not None:
+            options.append((self._count_in_runs(code, after), lambda: self._steps_in_runs(code, after)))
+        if head_min is not None or head_max is not None:
+            buckets = self._overlapping_buckets(head_min, head_max)
+            options.append((sum(len(steps) - bisect_left(steps, after) for steps in buckets),
+                            lambda: merge(*(self._tail(steps, after) for steps in buckets))))
+        candidates = min(options, key=lambda option: option[0])[1]()
+        
+        first = self.first_step
+        for step in candidates:
+            index = step - first
+            if code is not None and self.states[index] != code:
+                continue
+            if entering and index > 0 and self.states[index - 1] == code:
+                continue
+            if transition is not None and self.transitions[index] != transition:
+                continue
+            head = self.heads[index]
+            if head_min is not None and head < head_min:
+                continue
+            if head_max is not None and head > head_max:
+                continue
+            yield step
+    
+    def first(self, **conditions) -> Optional[int]:
+        """
+        Primer paso que cumple las condiciones de find()
+        
+        Ejemplo: index.first(state='q5', entering=True, head_min=1001)
+        
+        Returns:
+            Número de paso o None
+        """
+        return next(self.find(**conditions), None)
+    
+    def _state_code(self, state: str) -> int:
+        code = self._state_codes.get(state)
+        if code is None:
+            raise SimulationError(f"Estado '{state}' no existe en la MT")
+        return code
+    
+    @staticmethod
+    def _tail(steps: array, after: int) -> Iterator[int]:
+        """Pasos de una lista ordenada desde `after` (búsqueda binaria)"""
+        return (steps[i] for i in range(bisect_left(steps, after), len(steps)))
+    
+    def _steps_in_runs(self, code: int, after: int) -> Iterator[int]:
+        """Todos los pasos de los tramos de un estado desde `after`"""
+        starts = self._run_starts.get(code, array('q'))
+        ends = self._run_ends.get(code, array('q'))
+        for i in range(bisect_right(ends, after - 1), len(starts)):
+            yield from range(max(starts[i], after), ends[i] + 1)
+    
+    def _count_in_runs(self, code: int, after: int) -> int:
+        """Número de pasos de los tramos de un estado desde `after`"""
+        starts = self._run_starts.get(code)
+        if not starts:
+            return 0
+        ends = self._run_ends[code]
+        before = self._run_before[code]
+        total = before[-1] + ends[-1] - starts[-1] + 1
+        i = bisect_right(ends, after - 1)
+        if i == len(starts):
+            return 0
+        return total - before[i] - max(0, after - starts[i])
+    
+    def _overlapping_buckets(self, head_min: Optional[int], head_max: Optional[int]) -> List[array]:
+        """Listas de pasos de los bloques del cabezal que se superponen al rango"""
+        size = self.head_bucket_size
+        low = head_min // size if head_min is not None else None
+        high = head_max // size if head_max is not None else None
+        return [steps for bucket, steps in self._by_bucket.items()
+                if (low is None or bucket >= low) and (high is None or bucket <= high)]
+    
+    def __repr__(self) -> str:
+        return f"TraceIndex(steps={len(self)}, states={len(self._run_starts)})"
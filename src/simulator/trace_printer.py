@@ -0,0 +1,198 @@
+"""
+Salida de trazas con buffer y muestreo para la ejecución interactiva
+"""
+
+import queue
+import sys
+import threading
+import time
+from typing import IO, Iterable, List, Optional
+from ..utils.exceptions import SimulationError
+from .instantaneous_description import InstantaneousDescription
+
+
+class TracePrinter:
+    """
+    Imprime descripciones instantáneas en bloques grandes en lugar de línea a línea
+    
+    Puede muestrear la traza (cada k pasos o solo en cambios de estado) y
+    escribirla a un archivo desde un hilo en segundo plano, mostrando en la
+    terminal únicamente el progreso. La última ID recibida siempre se escribe.
+    
+    Si la escritura al archivo falla, flush() y close() levantan
+    SimulationError con la causa.
+    """
+    
+    def __init__(self, stream: Optional[IO[str]] = None, every: int = 1,
+                 only_state_changes: bool = False, context: Optional[int] = None,
+                 file_path: Optional[str] = None, buffer_size: int = 64 * 1024,
+                 progress_interval: float = 0.5):
+        """
+        Inicializa el impresor de trazas
+        
+        Args:
+            stream: Flujo de la terminal (por defecto sys.stdout)
+            every: Escribir solo una de cada k IDs (según el número de paso)
+            only_state_changes: Escribir solo las IDs en las que cambia el estado
+            context: Celdas a mostrar a cada lado del cabezal (None = todas)
+            file_path: Si se indica, la traza va a este archivo y la terminal solo muestra el progreso
+            buffer_size: Caracteres acumulados antes de escribir un bloque
+            progress_interval: Segundos entre actualizaciones del progreso en la terminal
+        """
+        if every < 1:
+            raise ValueError("El intervalo de muestreo debe ser al menos 1")
+        
+        self.stream = stream if stream is not None else sys.stdout
+        self.every = every
+        self.only_state_changes = only_state_changes
+        self.context = context
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.progress_interval = progress_interval
+        
+        self.received = 0
+        self.written = 0
+        self._buffer: List[str] = []
+        self._buffered_chars = 0
+        self._last_id: Optional[InstantaneousDescription] = None
+        self._last_written: Optional[InstantaneousDescription] = None
+        self._last_progress = 0.0
+        self._closed = False
+        
+        # Escritura en segundo plano hacia el archivo
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        # Error de escritura del hilo, se reporta en flush() o close()
+        self._error: Optional[BaseException] = None
+        if file_path is not None:
+            self._file = open(file_path, 'w', encoding='utf-8', buffering=buffer_size)
+            self._queue = queue.Queue(maxsize=64)
+            self._writer = threading.Thread(target=self._write_worker, daemon=True)
+            self._writer.start()
+    
+    def _write_worker(self) -> None:
+        """Hilo que vuelca al archivo los bloques encolados"""
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            # Tras un error se sigue vaciando la cola para no bloquear put()
+            if self._error is None:
+                try:
+                    self._file.write(chunk)
+                except Exception as e:
+                    self._error = e
+        try:
+            self._file.close()
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+    
+    def _raise_error(self) -> None:
+        """Levanta el error de escritura del hilo, si lo hubo"""
+        if self._error is not None:
+            raise SimulationError(f"Error al escribir la traza en {self.file_path}: {self._error}") from self._error
+    
+    def _selected(self, id_desc: InstantaneousDescription) -> bool:
+        """Decide si una ID se escribe según las reglas de muestreo"""
+        if id_desc.step % self.every != 0:
+            return False
+        if self.only_state_changes and self._last_id is not None:
+            return id_desc.state != self._last_id.state
+        return True
+    
+    def emit(self, id_desc: InstantaneousDescription) -> None:
+        """
+        Recibe una ID de la simulación (se puede usar como callback por paso)
+        
+        Args:
+            id_desc: Descripción instantánea
+        """
+        self.received += 1
+        if self._selected(id_desc):
+            self._append(id_desc)
+        self._last_id = id_desc
+    
+    def emit_all(self, ids: Iterable[InstantaneousDescription]) -> None:
+        """
+        Recibe una secuencia completa de IDs
+        
+        Args:
+            ids: Descripciones instantáneas en orden
+        """
+        for id_desc in ids:
+            self.emit(id_desc)
+    
+    def _append(self, id_desc: InstantaneousDescription) -> None:
+        """Agrega la línea de una ID al buffer y lo vacía si está lleno"""
+        line = f" {id_desc.get_compact_representation(self.context)}\n"
+        self._buffer.append(line)
+        self._buffered_chars += len(line)
+        self._last_written = id_desc
+        self.written += 1
+        
+        if self._buffered_chars >= self.buffer_size:
+            self.flush()
+        elif self._queue is not None and self.written % 256 == 0:
+            self._report_progress(id_desc.step)
+    
+    def _report_progress(self, step: int) -> None:
+        """Muestra en la terminal el avance de la escritura a archivo"""
+        now = time.perf_counter()
+        if now - self._last_progress >= self.progress_interval:
+            self._last_progress = now
+            self.stream.write(f"\r Paso {step} ({self.written} IDs escritas en {self.file_path})")
+            self.stream.flush()
+    
+    def flush(self) -> None:
+        """
+        Escribe el contenido del buffer como un solo bloque
+        
+        Raises:
+            SimulationError: Si falló la escritura al archivo
+        """
+        self._raise_error()
+        if not self._buffer:
+            return
+        chunk = ''.join(self._buffer)
+        self._buffer = []
+        self._buffered_chars = 0
+        
+        if self._queue is not None:
+            self._queue.put(chunk)
+            if self._last_written is not None:
+                self._report_progress(self._last_written.step)
+        else:
+            self.stream.write(chunk)
+            self.stream.flush()
+    
+    def close(self) -> None:
+        """
+        Escribe la última ID si quedó fuera del muestreo y vacía todo
+        
+        Raises:
+            SimulationError: Si falló la escritura al archivo
+        """
+        if self._closed:
+            return
+        self._closed = True
+        
+        try:
+            if self._last_id is not None and self._last_id is not self._last_written:
+                self._append(self._last_id)
+            self.flush()
+        finally:
+            if self._queue is not None:
+                self._queue.put(None)
+                self._writer.join()
+        
+        if self._queue is not None:
+            self._raise_error()
+            self.stream.write(f"\r Traza escrita en {self.file_path}: {self.written} de {self.received} IDs\n")
+            self.stream.flush()
+    
+    def __enter__(self) -> 'TracePrinter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -8,4 +8,4 @@ para el funcionamiento del simulador.
 from .exceptions import *
 from .validators import *
 
-__all__ = ['MTException', 'InvalidTransitionError', 'InvalidStateError', 'validate_yaml_structure']
\ No newline at end of file
+__all__ = ['MTException', 'InvalidTransitionError', 'InvalidStateError', 'CorpusError', 'validate_yaml_structure']
\ No newline at end of file
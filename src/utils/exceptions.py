@@ -35,4 +35,8 @@ class YAMLParsingError(MTException):
 
 class SimulationError(MTException):
     """Error durante la simulación de la MT"""
-    pass
\ No newline at end of file
+    pass
+
+class CorpusError(MTException):
+    """Error al leer un archivo de cadenas de prueba"""
+    pass
@@ -67,6 +67,39 @@ def validate_yaml_structure(data: Dict[str, Any]) -> None:
     # Validar estructura de transiciones
     for i, transition in enumerate(mt_data['transitions']):
         validate_transition_structure(transition, i, mt_data)
+    
+    # Validar presupuesto de ejecución (opcional)
+    if 'budget' in mt_data:
+        validate_budget_structure(mt_data['budget'])
+
+
+def validate_budget_structure(budget: Any) -> None:
+    """
+    Valida el bloque opcional 'budget' de una MT
+    
+    Args:
+        budget: Contenido del bloque 'budget'
+        
+    Raises:
+        YAMLParsingError: Si el bloque no es válido
+    """
+    allowed_fields = ['max_steps', 'steps_coefficient', 'steps_exponent', 'steps_base',
+                      'time_limit', 'max_tape_growth']
+    
+    if not isinstance(budget, dict):
+        raise YAMLParsingError("'budget' debe ser un diccionario")
+    
+    for field, value in budget.items():
+        if field not in allowed_fields:
+            raise YAMLParsingError(f"Campo desconocido 'budget.{field}'")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise YAMLParsingError(f"'budget.{field}' debe ser numérico")
+        if value < 0:
+            raise YAMLParsingError(f"'budget.{field}' no puede ser negativo")
+    
+    for field in ['max_steps', 'steps_base', 'max_tape_growth']:
+        if field in budget and not isinstance(budget[field], int):
+            raise YAMLParsingError(f"'budget.{field}' debe ser un entero")
 
 
 def validate_transition_structure(transition: Dict[str, Any], index: int, mt_data: Dict[str, Any]) -> None: